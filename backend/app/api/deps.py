@@ -1,9 +1,13 @@
 ﻿from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import decode_token
-from app.db.session import SessionLocal
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.security import verify_token
+from app.db.session import AsyncSessionLocal, SessionLocal
 from app.models.user import User
 
 security_scheme = HTTPBearer(auto_error=False)
@@ -17,10 +21,38 @@ def get_db():
         db.close()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials | None = Depends(security_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+class Principal:
+    """The authenticated user's identity, detached from any session."""
+
+    __slots__ = ('id', 'name', 'email', 'role', 'created_at')
+
+    def __init__(self, user: User):
+        self.id = user.id
+        self.name = user.name
+        self.email = user.email
+        self.role = user.role
+        self.created_at = user.created_at
+
+
+principal_cache = TTLCache(settings.AUTH_PRINCIPAL_CACHE_SIZE, settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def forget_principal(user_id: int) -> None:
+    """Drop the cached principal so the next request reloads the user row.
+
+    Runs automatically when this process updates or deletes a user through the ORM;
+    other workers keep theirs until AUTH_PRINCIPAL_CACHE_TTL_SECONDS pass.
+    """
+    principal_cache.pop(user_id)
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _forget_changed_user(mapper, connection, target: User) -> None:
+    forget_principal(target.id)
+
+
+def _token_user_id(credentials: HTTPAuthorizationCredentials | None) -> int:
     if credentials is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Not authenticated')
 
@@ -28,23 +60,53 @@ def get_current_user(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid auth scheme')
 
     try:
-        payload = decode_token(credentials.credentials)
+        payload = verify_token(credentials.credentials)
     except ValueError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid token')
 
     user_id = payload.get('sub')
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid token payload')
+    return int(user_id)
+
 
-    user = db.get(User, int(user_id))
+def _remember_principal(user: User | None) -> Principal:
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='User not found')
+    principal = Principal(user)
+    principal_cache.set(user.id, principal)
+    return principal
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security_scheme),
+    db: Session = Depends(get_db),
+) -> Principal:
+    user_id = _token_user_id(credentials)
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    return _remember_principal(db.get(User, user_id))
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
 
-    return user
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> Principal:
+    user_id = _token_user_id(credentials)
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    return _remember_principal(await db.get(User, user_id))
 
 
 def require_role(roles: list[str]):
-    def dependency(user: User = Depends(get_current_user)) -> User:
+    def dependency(user: Principal = Depends(get_current_user)) -> Principal:
         if user.role not in roles:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail='Insufficient role')
         return user
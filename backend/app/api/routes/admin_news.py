@@ -12,6 +12,7 @@ from app.schemas.news import (
     NewsStatusOut,
 )
 from app.services import news_service
+from app.services.news_fetcher import FetchInProgress
 
 router = APIRouter(prefix='/admin/news', tags=['admin-news'])
 
@@ -64,7 +65,10 @@ def delete_source(source_id: int, db: Session = Depends(get_db)):
 
 @router.post('/fetch-now', response_model=FetchNowResponse, dependencies=[Depends(require_role(['admin']))])
 def fetch_now(db: Session = Depends(get_db)):
-    return news_service.admin_fetch_now(db)
+    try:
+        return news_service.admin_fetch_now(db)
+    except FetchInProgress as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
 
 
 @router.get('/status', response_model=NewsStatusOut, dependencies=[Depends(require_role(['admin']))])
@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends
 
-from app.api.deps import get_current_user
-from app.models.user import User
+from app.api.deps import Principal, get_current_user
 from app.schemas.ai_chat import (
     ChatRequest,
     ChatResponse,
@@ -190,7 +189,7 @@ def build_plan(goal: str, level: str, days_per_week: int, equipment: str) -> Sug
 
 
 @router.post('/ai/chat', response_model=ChatResponse)
-def ai_chat(payload: ChatRequest, user: User = Depends(get_current_user)):
+def ai_chat(payload: ChatRequest, user: Principal = Depends(get_current_user)):
     goal = payload.context.goal.strip()
     level = payload.context.level.strip() or 'beginner'
     days = payload.context.days_per_week
@@ -2,7 +2,14 @@
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.config import settings
+from app.core.security import (
+    HashingBusy,
+    create_access_token,
+    hash_password,
+    run_hash_job,
+    verify_and_update_password,
+)
 from app.models.user import User
 from app.schemas.auth import LoginRequest, RegisterRequest, TokenResponse
 from app.schemas.user import UserOut
@@ -12,6 +19,21 @@ router = APIRouter(tags=['auth'])
 ALLOWED_ROLES = {'user', 'seller', 'coach', 'admin'}
 
 
+def hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail='Too many sign-in attempts in progress, retry shortly',
+        headers={'Retry-After': str(settings.AUTH_HASH_RETRY_AFTER_SECONDS)},
+    )
+
+
+def _hash_job(func, *args):
+    try:
+        return run_hash_job(func, *args)
+    except HashingBusy as exc:
+        raise hashing_busy() from exc
+
+
 @router.post('/register', response_model=UserOut, status_code=status.HTTP_201_CREATED)
 def register(payload: RegisterRequest, db: Session = Depends(get_db)):
     existing = db.query(User).filter(User.email == payload.email).first()
@@ -25,7 +47,7 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)):
     user = User(
         name=payload.name,
         email=payload.email,
-        password_hash=hash_password(payload.password),
+        password_hash=_hash_job(hash_password, payload.password),
         role=role,
     )
     db.add(user)
@@ -37,8 +59,15 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)):
 @router.post('/login', response_model=TokenResponse)
 def login(payload: LoginRequest, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.email == payload.email).first()
-    if not user or not verify_password(payload.password, user.password_hash):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid credentials')
+    valid, new_hash = _hash_job(verify_and_update_password, payload.password, user.password_hash)
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid credentials')
+    if new_hash:
+        # The stored hash predates the current AUTH_BCRYPT_ROUNDS.
+        user.password_hash = new_hash
+        db.commit()
 
     token = create_access_token({'sub': str(user.id), 'role': user.role})
     return TokenResponse(access_token=token)
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.api.routes.auth import ALLOWED_ROLES, hashing_busy
+from app.core.security import (
+    HashingBusy,
+    create_access_token,
+    hash_password,
+    run_hash_job_async,
+    verify_and_update_password,
+)
+from app.models.user import User
+from app.schemas.auth import LoginRequest, RegisterRequest, TokenResponse
+from app.schemas.user import UserOut
+
+router = APIRouter(tags=['auth'])
+
+
+async def _hash_job(func, *args):
+    try:
+        return await run_hash_job_async(func, *args)
+    except HashingBusy as exc:
+        raise hashing_busy() from exc
+
+
+@router.post('/register', response_model=UserOut, status_code=status.HTTP_201_CREATED)
+async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_async_db)):
+    existing = await db.scalar(select(User).where(User.email == payload.email))
+    if existing:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Email already registered')
+
+    role = payload.role or 'user'
+    if role not in ALLOWED_ROLES:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Invalid role')
+
+    user = User(
+        name=payload.name,
+        email=payload.email,
+        password_hash=await _hash_job(hash_password, payload.password),
+        role=role,
+    )
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+
+@router.post('/login', response_model=TokenResponse)
+async def login(payload: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    user = await db.scalar(select(User).where(User.email == payload.email))
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid credentials')
+    valid, new_hash = await _hash_job(verify_and_update_password, payload.password, user.password_hash)
+    if not valid:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid credentials')
+    if new_hash:
+        # The stored hash predates the current AUTH_BCRYPT_ROUNDS.
+        user.password_hash = new_hash
+        await db.commit()
+
+    token = create_access_token({'sub': str(user.id), 'role': user.role})
+    return TokenResponse(access_token=token)
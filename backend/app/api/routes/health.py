@@ -1,5 +1,7 @@
 ﻿from fastapi import APIRouter
 
+from app.core.security import hash_metrics
+
 router = APIRouter()
 
 @router.get('/health')
@@ -8,3 +10,11 @@ def health_check():
         'status': 'ok',
         'service': 'GymUnity API',
     }
+
+
+@router.get('/health/auth')
+def auth_health_check():
+    return {
+        'status': 'ok',
+        'password_hashing': hash_metrics.summary(),
+    }
@@ -1,10 +1,9 @@
-from typing import List
+from typing import List, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
-from app.models.user import User
+from app.api.deps import Principal, get_current_user, get_db
 from app.schemas.news import (
     NewsArticleOut,
     NewsChatRequest,
@@ -20,12 +19,12 @@ router = APIRouter(tags=['news'])
 
 
 @router.get('/news/sources', response_model=List[NewsSourceOut])
-def list_sources(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def list_sources(db: Session = Depends(get_db), user: Principal = Depends(get_current_user)):
     return news_service.list_enabled_sources(db)
 
 
 @router.get('/news/preferences', response_model=PreferencesOut)
-def get_preferences(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def get_preferences(db: Session = Depends(get_db), user: Principal = Depends(get_current_user)):
     return news_service.get_preferences(db, user)
 
 
@@ -33,7 +32,7 @@ def get_preferences(db: Session = Depends(get_db), user: User = Depends(get_curr
 def update_preferences(
     payload: PreferencesIn,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     return news_service.update_preferences(db, user, payload)
 
@@ -47,10 +46,16 @@ def get_personalized_feed(
     to_date: str | None = Query(default=None, alias='to'),
     page: int = 1,
     page_size: int = 12,
+    sort: Literal['recent', 'relevance'] = 'recent',
+    cursor: str | None = None,
+    total_mode: Literal['exact', 'estimated', 'none'] | None = None,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
-    return news_service.get_feed(db, user, topic, source, q, from_date, to_date, page, page_size)
+    try:
+        return news_service.get_feed(db, user, topic, source, q, from_date, to_date, page, page_size, sort, cursor, total_mode)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 @router.get('/news/explore', response_model=NewsFeedResponse)
@@ -62,27 +67,38 @@ def get_explore_feed(
     to_date: str | None = Query(default=None, alias='to'),
     page: int = 1,
     page_size: int = 12,
+    sort: Literal['recent', 'relevance'] = 'recent',
+    cursor: str | None = None,
+    total_mode: Literal['exact', 'estimated', 'none'] | None = None,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
-    return news_service.get_explore(db, user, topic, source, q, from_date, to_date, page, page_size)
+    try:
+        return news_service.get_explore(db, user, topic, source, q, from_date, to_date, page, page_size, sort, cursor, total_mode)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 @router.get('/news/saved', response_model=NewsFeedResponse)
 def get_saved_feed(
     page: int = 1,
     page_size: int = 12,
+    cursor: str | None = None,
+    total_mode: Literal['exact', 'estimated', 'none'] | None = None,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
-    return news_service.get_saved(db, user, page, page_size)
+    try:
+        return news_service.get_saved(db, user, page, page_size, cursor, total_mode)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 @router.get('/news/articles/{article_id}', response_model=NewsArticleOut)
 def get_article(
     article_id: int,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     try:
         return news_service.get_article(db, user, article_id)
@@ -94,7 +110,7 @@ def get_article(
 def save_article(
     article_id: int,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     try:
         return news_service.save_article(db, user, article_id)
@@ -106,7 +122,7 @@ def save_article(
 def unsave_article(
     article_id: int,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     return news_service.unsave_article(db, user, article_id)
 
@@ -115,7 +131,7 @@ def unsave_article(
 def hide_article(
     article_id: int,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     try:
         return news_service.hide_article(db, user, article_id)
@@ -124,6 +140,6 @@ def hide_article(
 
 
 @router.post('/news/chat', response_model=NewsChatResponse)
-def news_chat(payload: NewsChatRequest, user: User = Depends(get_current_user)):
+def news_chat(payload: NewsChatRequest, user: Principal = Depends(get_current_user)):
     message = payload.message.strip() or 'No message provided'
     return NewsChatResponse(**news_service.chat_stub(message))
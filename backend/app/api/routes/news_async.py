@@ -0,0 +1,145 @@
+from typing import List, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import Principal, get_async_db, get_current_user_async
+from app.schemas.news import (
+    NewsArticleOut,
+    NewsChatRequest,
+    NewsChatResponse,
+    NewsFeedResponse,
+    NewsSourceOut,
+    PreferencesIn,
+    PreferencesOut,
+)
+from app.services import news_service, news_service_async
+
+router = APIRouter(tags=['news'])
+
+
+@router.get('/news/sources', response_model=List[NewsSourceOut])
+async def list_sources(db: AsyncSession = Depends(get_async_db), user: Principal = Depends(get_current_user_async)):
+    return await news_service_async.list_enabled_sources(db)
+
+
+@router.get('/news/preferences', response_model=PreferencesOut)
+async def get_preferences(db: AsyncSession = Depends(get_async_db), user: Principal = Depends(get_current_user_async)):
+    return await news_service_async.get_preferences(db, user)
+
+
+@router.post('/news/preferences', response_model=PreferencesOut)
+async def update_preferences(
+    payload: PreferencesIn,
+    db: AsyncSession = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+):
+    return await news_service_async.update_preferences(db, user, payload)
+
+
+@router.get('/news/feed', response_model=NewsFeedResponse)
+async def get_personalized_feed(
+    topic: str | None = None,
+    source: str | None = None,
+    q: str | None = None,
+    from_date: str | None = Query(default=None, alias='from'),
+    to_date: str | None = Query(default=None, alias='to'),
+    page: int = 1,
+    page_size: int = 12,
+    sort: Literal['recent', 'relevance'] = 'recent',
+    cursor: str | None = None,
+    total_mode: Literal['exact', 'estimated', 'none'] | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+):
+    try:
+        return await news_service_async.get_feed(db, user, topic, source, q, from_date, to_date, page, page_size, sort, cursor, total_mode)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get('/news/explore', response_model=NewsFeedResponse)
+async def get_explore_feed(
+    topic: str | None = None,
+    source: str | None = None,
+    q: str | None = None,
+    from_date: str | None = Query(default=None, alias='from'),
+    to_date: str | None = Query(default=None, alias='to'),
+    page: int = 1,
+    page_size: int = 12,
+    sort: Literal['recent', 'relevance'] = 'recent',
+    cursor: str | None = None,
+    total_mode: Literal['exact', 'estimated', 'none'] | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+):
+    try:
+        return await news_service_async.get_explore(db, user, topic, source, q, from_date, to_date, page, page_size, sort, cursor, total_mode)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get('/news/saved', response_model=NewsFeedResponse)
+async def get_saved_feed(
+    page: int = 1,
+    page_size: int = 12,
+    cursor: str | None = None,
+    total_mode: Literal['exact', 'estimated', 'none'] | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+):
+    try:
+        return await news_service_async.get_saved(db, user, page, page_size, cursor, total_mode)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get('/news/articles/{article_id}', response_model=NewsArticleOut)
+async def get_article(
+    article_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+):
+    try:
+        return await news_service_async.get_article(db, user, article_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+
+@router.post('/news/articles/{article_id}/save', status_code=status.HTTP_201_CREATED)
+async def save_article(
+    article_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+):
+    try:
+        return await news_service_async.save_article(db, user, article_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+
+@router.delete('/news/articles/{article_id}/save')
+async def unsave_article(
+    article_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+):
+    return await news_service_async.unsave_article(db, user, article_id)
+
+
+@router.post('/news/articles/{article_id}/hide', status_code=status.HTTP_201_CREATED)
+async def hide_article(
+    article_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+):
+    try:
+        return await news_service_async.hide_article(db, user, article_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+
+@router.post('/news/chat', response_model=NewsChatResponse)
+async def news_chat(payload: NewsChatRequest, user: Principal = Depends(get_current_user_async)):
+    message = payload.message.strip() or 'No message provided'
+    return NewsChatResponse(**news_service.chat_stub(message))
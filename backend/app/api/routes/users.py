@@ -1,12 +1,11 @@
 ﻿from fastapi import APIRouter, Depends
 
-from app.api.deps import get_current_user
-from app.models.user import User
+from app.api.deps import Principal, get_current_user
 from app.schemas.user import UserOut
 
 router = APIRouter(tags=['users'])
 
 
 @router.get('/me', response_model=UserOut)
-def read_me(current_user: User = Depends(get_current_user)):
+def read_me(current_user: Principal = Depends(get_current_user)):
     return current_user
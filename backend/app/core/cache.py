@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire ``ttl`` seconds after being set.
+
+    ``maxsize`` bounds the number of entries. With ``max_weight`` and ``weigh`` set, the
+    summed weight of the entries (typically an estimate of their size in bytes) is bounded
+    too, evicting least recently used entries first.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        max_weight: int | None = None,
+        weigh: Callable[[Any], int] | None = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self.weight = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        weight = self.weigh(value) if self.weigh else 0
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (time.monotonic() + self.ttl, value, weight)
+            self.weight += weight
+            while self._data and (
+                len(self._data) > self.maxsize
+                or (self.max_weight is not None and self.weight > self.max_weight)
+            ):
+                self._remove(next(iter(self._data)))
+
+    def _remove(self, key: Hashable) -> Any:
+        _, value, weight = self._data.pop(key)
+        self.weight -= weight
+        return value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            return self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.weight = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -14,9 +14,19 @@ class Settings(BaseSettings):
     ]
     ENV: str = 'dev'
     DATABASE_URL: str = 'sqlite:///./gymunity.db'
+    DATABASE_ASYNC_ENABLED: bool = False
+    ASYNC_DATABASE_URL: str | None = None
     JWT_SECRET: str = 'change_me'
     JWT_ALG: str = 'HS256'
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080
+    AUTH_TOKEN_CACHE_SIZE: int = 10_000
+    AUTH_TOKEN_CACHE_TTL_SECONDS: int = 300
+    AUTH_PRINCIPAL_CACHE_SIZE: int = 10_000
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    AUTH_BCRYPT_ROUNDS: int = 12
+    AUTH_HASH_WORKERS: int = 2
+    AUTH_HASH_QUEUE_LIMIT: int = 16
+    AUTH_HASH_RETRY_AFTER_SECONDS: int = 1
     NEWS_DATA_LAKE_PATH: str = './data/news'
     VECTOR_DB_URL: str = 'http://localhost:6333'
     VECTOR_DB_NEWS_INDEX: str = 'gymunity-news'
@@ -24,6 +34,45 @@ class Settings(BaseSettings):
     EMBEDDING_MODEL_NAME: str = 'sentence-transformers/all-MiniLM-L6-v2'
     NEWS_PIPELINE_ENABLED: bool = False
     NEWS_PIPELINE_INTERVAL_MINUTES: int = 30
+    NEWS_FETCH_CONCURRENCY: int = 32
+    NEWS_FETCH_PER_HOST_LIMIT: int = 4
+    NEWS_FETCH_TIMEOUT_SECONDS: float = 20.0
+    NEWS_FETCH_MAX_BYTES: int = 20 * 1024 * 1024
+    NEWS_FEED_MAX_ITEMS: int = 200
+    NEWS_UPSERT_BATCH_SIZE: int = 500
+    NEWS_POLL_MIN_MINUTES: float = 5
+    NEWS_POLL_MAX_MINUTES: float = 720
+    NEWS_POLL_IDLE_FACTOR: float = 1.5
+    NEWS_POLL_JITTER: float = 0.1
+    NEWS_SCHEDULER_TICK_SECONDS: int = 60
+    NEWS_LEADER_LOCK_PATH: str = './data/news-scheduler.lock'
+    NEWS_PIPELINE_WORKERS: int | None = None
+    NEWS_PIPELINE_QUEUE_SIZE: int = 8
+    NEWS_EMBEDDINGS_ENABLED: bool = False
+    NEWS_DATA_LAKE_ENABLED: bool = True
+    NEWS_DATA_LAKE_SEGMENT_BYTES: int = 64 * 1024 * 1024
+    NEWS_DEDUP_WINDOW_DAYS: int = 14
+    NEWS_DEDUP_MAX_DISTANCE: int = 5
+    NEWS_SEEN_FILTER_ENABLED: bool = True
+    NEWS_SEEN_FILTER_CAPACITY: int = 100_000
+    NEWS_SEEN_FILTER_ERROR_RATE: float = 0.001
+    NEWS_FETCH_LOG_RETENTION_DAYS: int = 30
+    NEWS_STATUS_WINDOW_HOURS: int = 24
+    NEWS_STATUS_SLOWEST_SOURCES: int = 5
+    NEWS_COUNT_CACHE_TTL_SECONDS: int = 300
+    NEWS_COUNT_CACHE_SIZE: int = 10_000
+    NEWS_FEED_CACHE_SIZE: int = 5_000
+    NEWS_FEED_CACHE_TTL_SECONDS: int = 60
+    NEWS_FEED_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    NEWS_FEED_MATERIALIZED_ENABLED: bool = True
+    NEWS_FEED_MATERIALIZED_LENGTH: int = 500
+    NEWS_FEED_ACTIVE_DAYS: int = 7
+    NEWS_PREFERENCES_CACHE_SIZE: int = 10_000
+    NEWS_PREFERENCES_CACHE_TTL_SECONDS: int = 60
+    NEWS_INTERACTION_CACHE_SIZE: int = 10_000
+    NEWS_INTERACTION_CACHE_TTL_SECONDS: int = 600
+    NEWS_INTERACTION_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    NEWS_HIDDEN_INLINE_LIMIT: int = 500
 
     @field_validator('CORS_ORIGINS', mode='before')
     @classmethod
@@ -1,11 +1,21 @@
-﻿from datetime import datetime, timedelta
+﻿import asyncio
+import hashlib
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+# Changing AUTH_BCRYPT_ROUNDS marks existing hashes for an upgrade on next login.
+pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto', bcrypt__rounds=settings.AUTH_BCRYPT_ROUNDS)
 
 
 def hash_password(password: str) -> str:
@@ -16,6 +26,151 @@ def verify_password(password: str, password_hash: str) -> bool:
     return pwd_context.verify(password, password_hash)
 
 
+def verify_and_update_password(password: str, password_hash: str) -> tuple[bool, str | None]:
+    """Verify ``password``; also return a fresh hash when the stored one uses outdated settings."""
+    return pwd_context.verify_and_update(password, password_hash)
+
+
+class HashingBusy(Exception):
+    """Raised instead of queueing when AUTH_HASH_QUEUE_LIMIT hash jobs are already pending."""
+
+
+class HashMetrics:
+    def __init__(self):
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.latencies: deque[float] = deque(maxlen=1000)
+
+    def summary(self) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+        return {
+            'workers': settings.AUTH_HASH_WORKERS,
+            'queue_limit': settings.AUTH_HASH_QUEUE_LIMIT,
+            'in_flight': self.in_flight,
+            'queue_depth': max(0, self.in_flight - settings.AUTH_HASH_WORKERS),
+            'completed': self.completed,
+            'failed': self.failed,
+            'rejected': self.rejected,
+            'latency_ms_p50': round(percentile(0.5), 2),
+            'latency_ms_p95': round(percentile(0.95), 2),
+        }
+
+
+hash_metrics = HashMetrics()
+_hash_lock = threading.Lock()
+_hash_pool: ProcessPoolExecutor | None = None
+
+
+def _get_hash_pool() -> ProcessPoolExecutor | None:
+    """Return the bcrypt pool, or None to hash on the calling thread."""
+    global _hash_pool
+    if settings.AUTH_HASH_WORKERS <= 0:
+        return None
+    with _hash_lock:
+        if _hash_pool is None:
+            _hash_pool = ProcessPoolExecutor(
+                max_workers=settings.AUTH_HASH_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+    return _hash_pool
+
+
+def _discard_hash_pool(broken: ProcessPoolExecutor) -> None:
+    """Drop a pool whose worker died so the next job starts a fresh one."""
+    global _hash_pool
+    with _hash_lock:
+        if _hash_pool is broken:
+            _hash_pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_hash_pool() -> None:
+    global _hash_pool
+    with _hash_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown(wait=False, cancel_futures=True)
+            _hash_pool = None
+
+
+def _admit_hash_job() -> float:
+    with _hash_lock:
+        if hash_metrics.in_flight >= settings.AUTH_HASH_QUEUE_LIMIT:
+            hash_metrics.rejected += 1
+            raise HashingBusy('Too many password checks in progress')
+        hash_metrics.in_flight += 1
+    return time.perf_counter()
+
+
+def _finish_hash_job(started: float, succeeded: bool) -> None:
+    with _hash_lock:
+        hash_metrics.in_flight -= 1
+        if succeeded:
+            hash_metrics.completed += 1
+            hash_metrics.latencies.append(time.perf_counter() - started)
+        else:
+            hash_metrics.failed += 1
+
+
+def run_hash_job(func, *args):
+    """Run a password hashing function on the bcrypt pool and wait for the result.
+
+    At most AUTH_HASH_QUEUE_LIMIT jobs are admitted at once; past that the call fails
+    fast with ``HashingBusy``. That also caps how many request threads a login storm
+    can tie up waiting for hashes, leaving the rest for other endpoints. A job that
+    hits a broken pool (a worker died) is retried once on a fresh one.
+    """
+    started = _admit_hash_job()
+    succeeded = False
+    try:
+        for attempt in range(2):
+            pool = _get_hash_pool()
+            if pool is None:
+                result = func(*args)
+                break
+            try:
+                result = pool.submit(func, *args).result()
+                break
+            except BrokenProcessPool:
+                _discard_hash_pool(pool)
+                if attempt:
+                    raise
+        succeeded = True
+        return result
+    finally:
+        _finish_hash_job(started, succeeded)
+
+
+async def run_hash_job_async(func, *args):
+    """``run_hash_job`` for async handlers: awaits the pool without holding a thread."""
+    started = _admit_hash_job()
+    succeeded = False
+    loop = asyncio.get_running_loop()
+    try:
+        for attempt in range(2):
+            pool = _get_hash_pool()
+            try:
+                result = await loop.run_in_executor(pool, func, *args)
+                break
+            except BrokenProcessPool:
+                if pool is None:
+                    raise
+                _discard_hash_pool(pool)
+                if attempt:
+                    raise
+        succeeded = True
+        return result
+    finally:
+        _finish_hash_job(started, succeeded)
+
+
 def create_access_token(data: dict, expires_minutes: int | None = None) -> str:
     to_encode = data.copy()
     expire_minutes = expires_minutes or settings.ACCESS_TOKEN_EXPIRE_MINUTES
@@ -29,3 +184,23 @@ def decode_token(token: str) -> dict:
         return jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALG])
     except JWTError as exc:
         raise ValueError('Invalid token') from exc
+
+
+token_cache = TTLCache(settings.AUTH_TOKEN_CACHE_SIZE, settings.AUTH_TOKEN_CACHE_TTL_SECONDS)
+
+
+def verify_token(token: str) -> dict:
+    """``decode_token`` with verified payloads cached by token digest.
+
+    A cached payload is only reused until its ``exp``, so expiry is enforced exactly
+    as if the signature were checked again. Invalid tokens are not cached.
+    """
+    key = hashlib.sha256(token.encode('utf-8')).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        if payload.get('exp', 0) > time.time():
+            return payload
+        token_cache.pop(key)
+    payload = decode_token(token)
+    token_cache.set(key, payload)
+    return payload
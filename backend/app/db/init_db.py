@@ -1,15 +1,23 @@
 from app.db.base import Base
+from app.db.migrations import add_missing_columns, add_missing_indexes, backfill_published_at
 from app.db.session import SessionLocal, engine
 import app.models.user
 import app.models.news
+from app.pipeline.tags import backfill_tags
+from app.services.news_search import ensure_search_index
 from app.services.news_seed import seed_mock_articles, seed_news_sources
 
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+    add_missing_columns(engine)
+    add_missing_indexes(engine)
+    backfill_published_at(engine)
+    ensure_search_index(engine)
     db = SessionLocal()
     try:
         seed_news_sources(db)
         seed_mock_articles(db)
+        backfill_tags(db)
     finally:
         db.close()
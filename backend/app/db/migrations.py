@@ -0,0 +1,69 @@
+from sqlalchemy import inspect, update
+from sqlalchemy.engine import Engine
+
+from app.db.base import Base
+
+
+def add_missing_columns(engine: Engine) -> list[str]:
+    """Add columns declared on the models but missing from existing tables.
+
+    ``create_all`` only creates missing tables, so databases created before a column
+    was introduced need it added in place. New columns must be nullable or carry a
+    server default for this to work.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                ddl = f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'
+                if column.server_default is not None:
+                    default = column.server_default.arg
+                    ddl += f" DEFAULT {default.text if hasattr(default, 'text') else repr(str(default))}"
+                connection.exec_driver_sql(ddl)
+                added.append(f'{table.name}.{column.name}')
+
+    return added
+
+
+def add_missing_indexes(engine: Engine) -> list[str]:
+    """Create indexes declared on the models but missing from existing tables."""
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            index.create(bind=engine)
+            added.append(index.name)
+
+    return added
+
+
+def backfill_published_at(engine: Engine) -> int:
+    """Default missing ``published_at`` values to ``created_at``.
+
+    Feed pagination seeks on ``(published_at, id)``, so the column must never be NULL.
+    """
+    from app.models.news import NewsArticle
+
+    with engine.begin() as connection:
+        result = connection.execute(
+            update(NewsArticle)
+            .where(NewsArticle.published_at.is_(None))
+            .values(published_at=NewsArticle.created_at)
+        )
+    return result.rowcount
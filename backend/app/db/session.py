@@ -1,4 +1,6 @@
 ﻿from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
@@ -7,3 +9,22 @@ connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith(
 
 engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+ASYNC_DRIVERS = {'sqlite': 'aiosqlite', 'postgresql': 'asyncpg'}
+
+
+def async_database_url(url: str) -> str:
+    """Point a sync DATABASE_URL at the asyncio driver for the same database."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f'No async driver configured for {backend}')
+    return parsed.set(drivername=f'{backend}+{ASYNC_DRIVERS[backend]}').render_as_string(hide_password=False)
+
+
+# Only built when enabled, so the async drivers stay optional.
+async_engine = None
+AsyncSessionLocal = None
+if settings.DATABASE_ASYNC_ENABLED:
+    async_engine = create_async_engine(settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL))
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
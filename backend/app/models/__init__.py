@@ -1,17 +1,29 @@
 from app.models.user import User
 from app.models.news import (
     NewsArticle,
+    NewsArticleTag,
+    NewsFetchLog,
+    NewsFetchRun,
     NewsSource,
+    NewsTag,
+    UserFeedEntry,
     UserHiddenArticle,
     UserNewsPreference,
+    UserNewsTopic,
     UserSavedArticle,
 )
 
 __all__ = [
     'User',
     'NewsArticle',
+    'NewsArticleTag',
+    'NewsFetchLog',
+    'NewsFetchRun',
     'NewsSource',
+    'NewsTag',
+    'UserFeedEntry',
     'UserHiddenArticle',
     'UserNewsPreference',
+    'UserNewsTopic',
     'UserSavedArticle',
 ]
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import BigInteger, Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -17,8 +17,15 @@ class NewsSource(Base):
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     last_fetched_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    etag: Mapped[str | None] = mapped_column(String, nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String, nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String, nullable=True)
+    poll_interval_minutes: Mapped[float | None] = mapped_column(Float, nullable=True)
+    next_fetch_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
+    consecutive_failures: Mapped[int] = mapped_column(Integer, default=0, server_default='0', nullable=False)
 
     articles = relationship('NewsArticle', back_populates='source', cascade='all, delete-orphan')
+    fetch_logs = relationship('NewsFetchLog', back_populates='source', cascade='all, delete-orphan')
 
 
 class NewsArticle(Base):
@@ -36,18 +43,47 @@ class NewsArticle(Base):
     content: Mapped[str | None] = mapped_column(Text, nullable=True)
     image_url: Mapped[str | None] = mapped_column(String, nullable=True)
     tags: Mapped[str | None] = mapped_column(String, nullable=True)
+    simhash: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
     source = relationship('NewsSource', back_populates='articles')
     saved_by = relationship('UserSavedArticle', back_populates='article', cascade='all, delete-orphan')
     hidden_by = relationship('UserHiddenArticle', back_populates='article', cascade='all, delete-orphan')
+    tag_links = relationship('NewsArticleTag', cascade='all, delete-orphan')
+    feed_entries = relationship('UserFeedEntry', cascade='all, delete-orphan')
 
     __table_args__ = (
         Index('ix_news_article_source_unique', 'source_id', 'unique_hash', unique=True),
         Index('ix_news_article_source_published', 'source_id', 'published_at'),
+        Index('ix_news_article_published_id', 'published_at', 'id'),
     )
 
 
+class NewsTag(Base):
+    __tablename__ = 'news_tags'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String, nullable=False, unique=True, index=True)
+
+
+class NewsArticleTag(Base):
+    __tablename__ = 'news_article_tags'
+
+    article_id: Mapped[int] = mapped_column(ForeignKey('news_articles.id', ondelete='CASCADE'), primary_key=True)
+    tag_id: Mapped[int] = mapped_column(ForeignKey('news_tags.id'), primary_key=True)
+
+    __table_args__ = (
+        Index('ix_news_article_tag_tag_article', 'tag_id', 'article_id'),
+    )
+
+
+class UserNewsTopic(Base):
+    __tablename__ = 'user_news_topics'
+
+    user_id: Mapped[int] = mapped_column(ForeignKey('user_news_preferences.user_id', ondelete='CASCADE'), primary_key=True)
+    tag_id: Mapped[int] = mapped_column(ForeignKey('news_tags.id'), primary_key=True)
+
+
 class UserNewsPreference(Base):
     __tablename__ = 'user_news_preferences'
 
@@ -56,9 +92,27 @@ class UserNewsPreference(Base):
     level: Mapped[str] = mapped_column(String, default='beginner', nullable=False)
     equipment: Mapped[str] = mapped_column(String, default='gym', nullable=False)
     blocked_keywords: Mapped[str] = mapped_column(String, default='', nullable=False)
+    feed_version: Mapped[int] = mapped_column(Integer, default=0, server_default='0', nullable=False)
+    last_feed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    feed_materialized_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    feed_truncated: Mapped[bool] = mapped_column(Boolean, default=False, server_default='0', nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
     user = relationship('User', back_populates='news_preference')
+    topic_links = relationship('UserNewsTopic', cascade='all, delete-orphan')
+
+
+class UserFeedEntry(Base):
+    __tablename__ = 'user_feed_entries'
+
+    user_id: Mapped[int] = mapped_column(ForeignKey('users.id'), primary_key=True)
+    article_id: Mapped[int] = mapped_column(ForeignKey('news_articles.id', ondelete='CASCADE'), primary_key=True)
+    score: Mapped[int] = mapped_column(Integer, nullable=False)
+    published_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('ix_user_feed_entry_rank', 'user_id', 'score', 'published_at', 'article_id'),
+    )
 
 
 class UserSavedArticle(Base):
@@ -91,3 +145,44 @@ class UserHiddenArticle(Base):
     __table_args__ = (
         Index('ix_user_hidden_unique', 'user_id', 'article_id', unique=True),
     )
+
+
+class NewsFetchRun(Base):
+    __tablename__ = 'news_fetch_runs'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    trigger: Mapped[str] = mapped_column(String, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    finished_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    sources_checked: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    sources_success: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    sources_failed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    sources_cached: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    items_ingested: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    fetches = relationship('NewsFetchLog', back_populates='run', cascade='all, delete-orphan')
+
+
+class NewsFetchLog(Base):
+    __tablename__ = 'news_fetch_logs'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    run_id: Mapped[int] = mapped_column(ForeignKey('news_fetch_runs.id'), nullable=False, index=True)
+    source_id: Mapped[int] = mapped_column(ForeignKey('news_sources.id'), nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    status_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    bytes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    fetch_ms: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    parse_ms: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    items_seen: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    items_new: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    not_modified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    run = relationship('NewsFetchRun', back_populates='fetches')
+    source = relationship('NewsSource', back_populates='fetch_logs')
+
+    __table_args__ = (
+        Index('ix_news_fetch_log_source_fetched', 'source_id', 'fetched_at'),
+    )
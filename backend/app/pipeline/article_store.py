@@ -0,0 +1,154 @@
+from collections import Counter
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.news import NewsArticle
+from app.pipeline.tags import sync_article_tags
+
+ARTICLE_COLUMNS = (
+    'source_id',
+    'title',
+    'link',
+    'guid',
+    'unique_hash',
+    'published_at',
+    'author',
+    'summary',
+    'content',
+    'image_url',
+    'tags',
+    'simhash',
+)
+# published_at is left alone on conflict so an article keeps its place in the feed.
+UPDATABLE_COLUMNS = ('title', 'guid', 'author', 'summary', 'content', 'image_url', 'tags', 'simhash')
+
+DIALECT_INSERTS = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert,
+}
+
+
+def _batches(records: list[dict], size: int) -> Iterable[list[dict]]:
+    for offset in range(0, len(records), size):
+        yield records[offset:offset + size]
+
+
+def _upsert_batch(
+    db: Session,
+    insert,
+    batch: list[dict],
+    update: bool,
+    inserted_by_source: Counter,
+    inserted_ids: list[int],
+    updated_ids: list[int],
+) -> tuple[int, int]:
+    created_at = datetime.utcnow()
+    rows = [{**{column: record.get(column) for column in ARTICLE_COLUMNS}, 'created_at': created_at} for record in batch]
+    for row in rows:
+        # Feed cursors seek on (published_at, id), which needs published_at set.
+        row['published_at'] = row['published_at'] or created_at
+
+    table = NewsArticle.__table__
+    stmt = insert(table)
+    if update:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['source_id', 'unique_hash'],
+            set_={column: stmt.excluded[column] for column in UPDATABLE_COLUMNS},
+            where=or_(*(table.c[column].is_distinct_from(stmt.excluded[column]) for column in UPDATABLE_COLUMNS)),
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=['source_id', 'unique_hash'])
+
+    # Rows skipped by the conflict clause are not returned. Conflicting rows keep their
+    # original created_at, which tells updates apart from inserts without a second query.
+    returned = db.execute(
+        stmt.returning(table.c.id, table.c.source_id, table.c.tags, table.c.created_at), rows
+    ).all()
+    inserted = 0
+    for article_id, source_id, _, row_created_at in returned:
+        if row_created_at == created_at:
+            inserted += 1
+            inserted_by_source[source_id] += 1
+            inserted_ids.append(article_id)
+        else:
+            updated_ids.append(article_id)
+    sync_article_tags(db, {article_id: tags for article_id, _, tags, _ in returned})
+    return inserted, len(returned) - inserted
+
+
+def _insert_missing(db: Session, batch: list[dict], inserted_by_source: Counter, inserted_ids: list[int]) -> int:
+    keys = [(record['source_id'], record['unique_hash']) for record in batch]
+    existing = set(
+        db.execute(
+            select(NewsArticle.source_id, NewsArticle.unique_hash).where(
+                tuple_(NewsArticle.source_id, NewsArticle.unique_hash).in_(keys)
+            )
+        ).all()
+    )
+    new_records = [record for record in batch if (record['source_id'], record['unique_hash']) not in existing]
+    now = datetime.utcnow()
+    articles = [
+        NewsArticle(**{column: record.get(column) for column in ARTICLE_COLUMNS}, created_at=now)
+        for record in new_records
+    ]
+    for article in articles:
+        article.published_at = article.published_at or now
+    db.add_all(articles)
+    db.flush()
+    sync_article_tags(db, {article.id: article.tags for article in articles})
+    inserted_by_source.update(record['source_id'] for record in new_records)
+    inserted_ids.extend(article.id for article in articles)
+    return len(new_records)
+
+
+def upsert_articles(
+    db: Session,
+    records: Iterable[dict],
+    update: bool = True,
+    batch_size: int | None = None,
+) -> dict:
+    """Write normalized article rows in batches keyed on (source_id, unique_hash).
+
+    Uses a single ``INSERT ... ON CONFLICT`` per batch on SQLite and PostgreSQL. With
+    ``update`` set, existing rows are refreshed only when one of their mutable columns
+    actually changed; otherwise conflicts are ignored. Tag links are rewritten for every
+    inserted or changed row. The caller owns the transaction.
+    Returns inserted/updated/skipped counts, inserted counts per source and the ids of
+    new and changed rows.
+    """
+    # A statement may not touch the same conflict key twice, so collapse repeats first.
+    unique = {}
+    for record in records:
+        unique[(record['source_id'], record['unique_hash'])] = record
+    records = list(unique.values())
+    batch_size = batch_size or settings.NEWS_UPSERT_BATCH_SIZE
+
+    insert = DIALECT_INSERTS.get(db.get_bind().dialect.name)
+    inserted = updated = 0
+    inserted_by_source = Counter()
+    inserted_ids: list[int] = []
+    updated_ids: list[int] = []
+    for batch in _batches(records, batch_size):
+        if insert is None:
+            inserted += _insert_missing(db, batch, inserted_by_source, inserted_ids)
+            continue
+        batch_inserted, batch_updated = _upsert_batch(
+            db, insert, batch, update, inserted_by_source, inserted_ids, updated_ids
+        )
+        inserted += batch_inserted
+        updated += batch_updated
+
+    return {
+        'inserted': inserted,
+        'updated': updated,
+        'skipped': len(records) - inserted - updated,
+        'inserted_by_source': dict(inserted_by_source),
+        'inserted_ids': inserted_ids,
+        'updated_ids': updated_ids,
+    }
@@ -0,0 +1,157 @@
+import json
+import os
+import struct
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from app.core.config import settings
+
+SEGMENT_SUFFIX = '.seg'
+INDEX_SUFFIX = '.idx'
+LENGTH_PREFIX = struct.Struct('>I')
+
+
+class PayloadFrame:
+    """One lake frame, compressed incrementally while its payload downloads.
+
+    Only the compressed bytes are kept, so archiving never needs the raw body in
+    memory. The header is written first and holds what is known before the body.
+    """
+
+    def __init__(self, record: dict):
+        header = {
+            'source_id': record['source_id'],
+            'rss_url': record['rss_url'],
+            'fetched_at': record['fetched_at'].isoformat(),
+        }
+        self._compressor = zlib.compressobj()
+        self._parts = [self._compressor.compress(json.dumps(header).encode('utf-8') + b'\n')]
+
+    def feed(self, chunk: bytes) -> None:
+        self._parts.append(self._compressor.compress(chunk))
+
+    def finish(self) -> bytes:
+        self._parts.append(self._compressor.flush())
+        return b''.join(self._parts)
+
+
+class DataLakeWriter:
+    """Append raw feed payloads to compressed, size-rotated segment files.
+
+    Each payload is stored as a length-prefixed zlib frame holding a JSON header line
+    followed by the raw body. Every segment has a sidecar index of JSON lines with
+    ``source_id``, ``fetched_at``, ``offset`` and ``length`` so readers can seek straight
+    to the frames they need. Segment names start with their creation time and include
+    the writer's pid, so several processes never append to the same file.
+    """
+
+    def __init__(self, root: str | Path, segment_bytes: int):
+        self.root = Path(root)
+        self.segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._segment = None
+        self._index = None
+
+    def _rotate(self) -> None:
+        self.close()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._sequence += 1
+        name = f'{datetime.utcnow():%Y%m%dT%H%M%S}-{os.getpid()}-{self._sequence:04d}'
+        self._segment = open(self.root / f'{name}{SEGMENT_SUFFIX}', 'ab')
+        self._index = open(self.root / f'{name}{INDEX_SUFFIX}', 'a', encoding='utf-8')
+
+    def append(self, record: dict) -> None:
+        """Archive a record whose whole body is in ``content``."""
+        frame = PayloadFrame(record)
+        frame.feed(record['content'])
+        self.append_frame(record, frame.finish())
+
+    def append_frame(self, record: dict, frame: bytes) -> None:
+        """Archive a frame built by ``PayloadFrame`` for ``record``."""
+        with self._lock:
+            if self._segment is None or self._segment.tell() >= self.segment_bytes:
+                self._rotate()
+            offset = self._segment.tell()
+            self._segment.write(LENGTH_PREFIX.pack(len(frame)) + frame)
+            self._segment.flush()
+            # The index line is written after the frame, so an indexed frame is always complete.
+            entry = {
+                'source_id': record['source_id'],
+                'fetched_at': record['fetched_at'].isoformat(),
+                'offset': offset,
+                'length': LENGTH_PREFIX.size + len(frame),
+            }
+            self._index.write(json.dumps(entry) + '\n')
+            self._index.flush()
+
+    def close(self) -> None:
+        for handle in (self._segment, self._index):
+            if handle is not None:
+                handle.close()
+        self._segment = None
+        self._index = None
+
+
+_writer: DataLakeWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> DataLakeWriter | None:
+    """Return the process-wide lake writer, or None when the lake is disabled."""
+    global _writer
+    if not settings.NEWS_DATA_LAKE_ENABLED:
+        return None
+    with _writer_lock:
+        if _writer is None:
+            _writer = DataLakeWriter(Path(settings.NEWS_DATA_LAKE_PATH) / 'raw', settings.NEWS_DATA_LAKE_SEGMENT_BYTES)
+    return _writer
+
+
+def _read_index(path: Path) -> Iterator[dict]:
+    with open(path, encoding='utf-8') as handle:
+        for line in handle:
+            # A crash can leave a partial last line; everything before it is intact.
+            if line.endswith('\n'):
+                yield json.loads(line)
+
+
+def iter_payloads(
+    start: datetime,
+    end: datetime,
+    source_ids: Iterable[int] | None = None,
+    root: str | Path | None = None,
+) -> Iterator[dict]:
+    """Yield archived payloads fetched in ``[start, end]``, oldest segment first.
+
+    Only the index files are scanned to select frames; each segment is then read
+    sequentially in offset order, so replay runs at disk speed. ``source_ids`` of None
+    means every source; an empty collection matches nothing.
+    """
+    root = Path(root or Path(settings.NEWS_DATA_LAKE_PATH) / 'raw')
+    wanted = None if source_ids is None else set(source_ids)
+    if not root.exists() or wanted == set():
+        return
+
+    for index_path in sorted(root.glob(f'*{INDEX_SUFFIX}')):
+        entries = [
+            entry
+            for entry in _read_index(index_path)
+            if start <= datetime.fromisoformat(entry['fetched_at']) <= end
+            and (wanted is None or entry['source_id'] in wanted)
+        ]
+        if not entries:
+            continue
+
+        with open(index_path.with_suffix(SEGMENT_SUFFIX), 'rb') as segment:
+            for entry in sorted(entries, key=lambda item: item['offset']):
+                segment.seek(entry['offset'] + LENGTH_PREFIX.size)
+                frame = zlib.decompress(segment.read(entry['length'] - LENGTH_PREFIX.size))
+                header, _, content = frame.partition(b'\n')
+                payload = json.loads(header)
+                payload['fetched_at'] = datetime.fromisoformat(payload['fetched_at'])
+                payload['content'] = content
+                yield payload
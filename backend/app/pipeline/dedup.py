@@ -0,0 +1,126 @@
+import hashlib
+import re
+from datetime import datetime, timedelta
+from itertools import combinations
+from typing import Iterable, Iterator
+
+from sqlalchemy.orm import Session
+
+from app.models.news import NewsArticle
+
+SIMHASH_BITS = 64
+SIMHASH_MASK = (1 << SIMHASH_BITS) - 1
+# Word bigrams: a one-word edit touches only the two shingles around it, while unrelated
+# texts that share common words no longer share most of their shingles.
+SHINGLE_SIZE = 2
+WORD_RE = re.compile(r'\w+')
+
+
+def _shingles(text: str) -> list[str]:
+    words = WORD_RE.findall(text.lower())
+    if len(words) <= SHINGLE_SIZE:
+        return [' '.join(words)] if words else []
+    return [' '.join(words[index:index + SHINGLE_SIZE]) for index in range(len(words) - SHINGLE_SIZE + 1)]
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of word shingles, returned signed so it fits a BIGINT column."""
+    weights = [0] * SIMHASH_BITS
+    for shingle in _shingles(text):
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    signature = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            signature |= 1 << bit
+    return signature - (1 << SIMHASH_BITS) if signature >= 1 << (SIMHASH_BITS - 1) else signature
+
+
+def hamming_distance(left: int, right: int) -> int:
+    return bin((left ^ right) & SIMHASH_MASK).count('1')
+
+
+class NearDuplicateIndex:
+    """LSH index over SimHash signatures for near-duplicate lookups.
+
+    Signatures are cut into ``max_distance + 2`` blocks and one table is kept per pair
+    of blocks, keyed on the bits of those two blocks. Two signatures within
+    ``max_distance`` bits differ in at most that many blocks, so at least two blocks
+    agree and the pair shares a key in some table: no near-duplicate is missed. Each
+    key spans about 2/(max_distance + 2) of the bits (18 at the default distance of 5),
+    so a lookup only compares against entries colliding on that many bits, a few per
+    table even for a large index.
+    """
+
+    def __init__(self, max_distance: int = 5):
+        self.max_distance = max_distance
+        block_count = max_distance + 2
+        bounds = [SIMHASH_BITS * block // block_count for block in range(block_count + 1)]
+        self.blocks = [(start, (1 << (end - start)) - 1) for start, end in zip(bounds, bounds[1:])]
+        self.tables = list(combinations(range(block_count), 2))
+        self.buckets: list[dict[int, list[tuple[int, tuple]]]] = [{} for _ in self.tables]
+        self.keys: set[tuple] = set()
+
+    def _table_keys(self, signature: int) -> Iterator[tuple[int, int]]:
+        unsigned = signature & SIMHASH_MASK
+        parts = [(unsigned >> start) & mask for start, mask in self.blocks]
+        for table, (first, second) in enumerate(self.tables):
+            yield table, parts[first] << SIMHASH_BITS | parts[second]
+
+    def candidates(self, signature: int) -> dict[tuple, int]:
+        """Indexed entries sharing a table key with ``signature``: the ones ``find`` compares."""
+        found = {}
+        for table, value in self._table_keys(signature):
+            for candidate, candidate_key in self.buckets[table].get(value, ()):
+                found[candidate_key] = candidate
+        return found
+
+    def find(self, signature: int, key: tuple | None = None) -> tuple | None:
+        """Return the key of an indexed near-duplicate of ``signature``, other than ``key``."""
+        for candidate_key, candidate in self.candidates(signature).items():
+            if candidate_key != key and hamming_distance(candidate, signature) <= self.max_distance:
+                return candidate_key
+        return None
+
+    def add(self, signature: int, key: tuple) -> None:
+        if key in self.keys:
+            return
+        self.keys.add(key)
+        entry = (signature, key)
+        for table, value in self._table_keys(signature):
+            self.buckets[table].setdefault(value, []).append(entry)
+
+
+def load_index(db: Session, days: int, max_distance: int = 5) -> NearDuplicateIndex:
+    """Build an index from the signatures of articles published in the last ``days``."""
+    index = NearDuplicateIndex(max_distance)
+    since = datetime.utcnow() - timedelta(days=days)
+    rows = (
+        db.query(NewsArticle.simhash, NewsArticle.source_id, NewsArticle.unique_hash)
+        .filter(NewsArticle.simhash.isnot(None), NewsArticle.published_at >= since)
+        .yield_per(5000)
+    )
+    for signature, source_id, unique_hash in rows:
+        index.add(signature, (source_id, unique_hash))
+    return index
+
+
+def drop_near_duplicates(records: Iterable[dict], index: NearDuplicateIndex) -> Iterator[dict]:
+    """Yield only records that are not near-duplicates of an indexed article.
+
+    The first article seen in a cluster is canonical; kept records are added to the
+    index so later copies in the same run are dropped too. A record never matches its
+    own (source_id, unique_hash), so re-fetching a stored article still updates it.
+    """
+    for record in records:
+        signature = record.get('simhash')
+        if signature is None:
+            yield record
+            continue
+        key = (record['source_id'], record['unique_hash'])
+        if index.find(signature, key) is not None:
+            continue
+        index.add(signature, key)
+        yield record
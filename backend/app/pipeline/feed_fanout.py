@@ -0,0 +1,263 @@
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import bindparam, delete, func, insert, or_, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.news import (
+    NewsArticle,
+    NewsArticleTag,
+    NewsSource,
+    UserFeedEntry,
+    UserHiddenArticle,
+    UserNewsPreference,
+    UserNewsTopic,
+)
+from app.pipeline.tags import split_tags
+
+FANOUT_BATCH_SIZE = 500
+
+_pending_activity: dict[int, datetime] = {}
+_activity_lock = threading.Lock()
+
+
+def note_feed_activity(user_id: int) -> None:
+    """Remember that the user read their feed; written out by ``flush_feed_activity``."""
+    with _activity_lock:
+        _pending_activity[user_id] = datetime.utcnow()
+
+
+def flush_feed_activity(db: Session) -> int:
+    """Write this process's pending feed reads to ``last_feed_at`` in one statement.
+
+    Keeps feed requests free of writes: every worker flushes on the scheduler tick, and
+    the ingest flushes its own process before deciding who is active. Users without a
+    preference row are skipped, having no topics to materialize. The caller commits.
+    """
+    global _pending_activity
+    with _activity_lock:
+        pending, _pending_activity = _pending_activity, {}
+    if not pending:
+        return 0
+    table = UserNewsPreference.__table__
+    db.execute(
+        update(table).where(table.c.user_id == bindparam('key')).values(last_feed_at=bindparam('seen')),
+        [{'key': user_id, 'seen': seen} for user_id, seen in pending.items()],
+    )
+    return len(pending)
+
+
+def _blocked_clause(db: Session, blocked_keywords: list[str]):
+    # app.services imports this module through news_service, so import on use.
+    from app.services.news_search import blocked_clause
+
+    return blocked_clause(db.get_bind(), blocked_keywords)
+
+
+def _user_topic_ids(db: Session, user_ids: list[int]) -> dict[int, set[int]]:
+    topics = defaultdict(set)
+    rows = db.execute(select(UserNewsTopic.user_id, UserNewsTopic.tag_id).where(UserNewsTopic.user_id.in_(user_ids)))
+    for user_id, tag_id in rows:
+        topics[user_id].add(tag_id)
+    return topics
+
+
+def _trim(db: Session, pref: UserNewsPreference) -> None:
+    """Drop the user's entries ranked below NEWS_FEED_MATERIALIZED_LENGTH."""
+    rank = (UserFeedEntry.score, UserFeedEntry.published_at, UserFeedEntry.article_id)
+    boundary = db.execute(
+        select(*rank)
+        .where(UserFeedEntry.user_id == pref.user_id)
+        .order_by(*(column.desc() for column in rank))
+        .offset(settings.NEWS_FEED_MATERIALIZED_LENGTH)
+        .limit(1)
+    ).first()
+    if boundary is None:
+        return
+    db.execute(
+        delete(UserFeedEntry).where(UserFeedEntry.user_id == pref.user_id, tuple_(*rank) <= tuple(boundary))
+    )
+    pref.feed_truncated = True
+
+
+def drop_feed(db: Session, pref: UserNewsPreference) -> None:
+    """Stop materializing the user's feed; reads fall back to ranking at request time."""
+    db.execute(delete(UserFeedEntry).where(UserFeedEntry.user_id == pref.user_id))
+    pref.feed_materialized_at = None
+    pref.feed_truncated = False
+
+
+def materialize_feed(db: Session, pref: UserNewsPreference) -> int:
+    """(Re)build the user's materialized feed from the articles already stored.
+
+    Ranks like the read path: enabled sources only, hidden and blocked articles left
+    out, articles scored by how many of the user's topic tags they carry. Only the top
+    NEWS_FEED_MATERIALIZED_LENGTH are kept. Users without topics get no materialized
+    feed, since their feed is a plain published_at range scan anyway. Returns the
+    entries written; the caller commits.
+    """
+    db.execute(delete(UserFeedEntry).where(UserFeedEntry.user_id == pref.user_id))
+    topic_ids = _user_topic_ids(db, [pref.user_id]).get(pref.user_id)
+    if not topic_ids:
+        drop_feed(db, pref)
+        return 0
+
+    limit = settings.NEWS_FEED_MATERIALIZED_LENGTH
+    scores = (
+        select(NewsArticleTag.article_id, func.count().label('score'))
+        .where(NewsArticleTag.tag_id.in_(topic_ids))
+        .group_by(NewsArticleTag.article_id)
+        .subquery()
+    )
+    hidden = select(UserHiddenArticle.article_id).where(UserHiddenArticle.user_id == pref.user_id)
+    ranked = (
+        select(NewsArticle.id, scores.c.score, NewsArticle.published_at)
+        .join(scores, scores.c.article_id == NewsArticle.id)
+        .join(NewsSource, NewsSource.id == NewsArticle.source_id)
+        .where(NewsSource.enabled.is_(True), NewsArticle.id.not_in(hidden))
+        .order_by(scores.c.score.desc(), NewsArticle.published_at.desc(), NewsArticle.id.desc())
+        .limit(limit + 1)
+    )
+    blocked = _blocked_clause(db, split_tags(pref.blocked_keywords))
+    if blocked is not None:
+        ranked = ranked.where(~blocked)
+    entries = [
+        {'user_id': pref.user_id, 'article_id': article_id, 'score': score, 'published_at': published_at}
+        for article_id, score, published_at in db.execute(ranked)
+    ]
+    # The extra row only says whether the feed holds every matching article.
+    pref.feed_truncated = len(entries) > limit
+    entries = entries[:limit]
+
+    for offset in range(0, len(entries), FANOUT_BATCH_SIZE):
+        db.execute(insert(UserFeedEntry), entries[offset:offset + FANOUT_BATCH_SIZE])
+    pref.feed_materialized_at = datetime.utcnow()
+    return len(entries)
+
+
+def _refresh_membership(db: Session, now: datetime) -> tuple[list[UserNewsPreference], int, int]:
+    """Materialize newly active users and drop inactive ones.
+
+    Returns the prefs of users whose feed existed before this call, plus the number of
+    feeds built and dropped.
+    """
+    active_since = now - timedelta(days=settings.NEWS_FEED_ACTIVE_DAYS)
+    prefs = (
+        db.query(UserNewsPreference)
+        .filter(
+            or_(
+                UserNewsPreference.feed_materialized_at.isnot(None),
+                UserNewsPreference.last_feed_at >= active_since,
+            )
+        )
+        .all()
+    )
+    existing = []
+    built = dropped = 0
+    for pref in prefs:
+        active = pref.last_feed_at is not None and pref.last_feed_at >= active_since
+        if pref.feed_materialized_at is None:
+            if pref.topics:
+                materialize_feed(db, pref)
+                built += 1
+        elif not active:
+            drop_feed(db, pref)
+            dropped += 1
+        else:
+            existing.append(pref)
+    return existing, built, dropped
+
+
+def fan_out_articles(db: Session, article_ids: list[int], updated_ids: list[int] | None = None) -> dict:
+    """Append newly ingested articles to the materialized feeds of active users.
+
+    Only users who read their feed within NEWS_FEED_ACTIVE_DAYS have one, so the write
+    cost of an ingest is bounded by the active users rather than every account; the
+    rest are ranked at request time. Each new article is scored against each active
+    user's topics and blocked keywords, then every touched feed is trimmed back to
+    NEWS_FEED_MATERIALIZED_LENGTH. Articles in ``updated_ids`` (new title or tags) have
+    their existing entries dropped and are scored again the same way, leaving out
+    users who hid them. The caller commits.
+    """
+    if not settings.NEWS_FEED_MATERIALIZED_ENABLED:
+        return {'feeds': 0, 'built': 0, 'dropped': 0, 'entries': 0}
+
+    flush_feed_activity(db)
+    prefs, built, dropped = _refresh_membership(db, datetime.utcnow())
+    entries = 0
+    updated_ids = updated_ids or []
+    if prefs and updated_ids:
+        user_ids = [pref.user_id for pref in prefs]
+        for offset in range(0, len(updated_ids), FANOUT_BATCH_SIZE):
+            db.execute(
+                delete(UserFeedEntry).where(
+                    UserFeedEntry.article_id.in_(updated_ids[offset:offset + FANOUT_BATCH_SIZE]),
+                    UserFeedEntry.user_id.in_(user_ids),
+                )
+            )
+    article_ids = [*article_ids, *updated_ids]
+    if prefs and article_ids:
+        topics = _user_topic_ids(db, [pref.user_id for pref in prefs])
+        users_by_tag = defaultdict(list)
+        for pref in prefs:
+            for tag_id in topics.get(pref.user_id, ()):
+                users_by_tag[tag_id].append(pref.user_id)
+        blocklists = defaultdict(list)
+        for pref in prefs:
+            keywords = tuple(split_tags(pref.blocked_keywords))
+            if keywords:
+                blocklists[keywords].append(pref.user_id)
+        touched = set()
+
+        for offset in range(0, len(article_ids), FANOUT_BATCH_SIZE):
+            batch = article_ids[offset:offset + FANOUT_BATCH_SIZE]
+            articles = dict(
+                db.execute(
+                    select(NewsArticle.id, NewsArticle.published_at)
+                    .join(NewsSource, NewsSource.id == NewsArticle.source_id)
+                    .where(NewsArticle.id.in_(batch), NewsSource.enabled.is_(True))
+                ).all()
+            )
+            # One lookup per distinct blocklist, however many users share it.
+            blocked = defaultdict(set)
+            hidden = db.execute(
+                select(UserHiddenArticle.user_id, UserHiddenArticle.article_id).where(
+                    UserHiddenArticle.user_id.in_([pref.user_id for pref in prefs]),
+                    UserHiddenArticle.article_id.in_(list(articles)),
+                )
+            )
+            for user_id, article_id in hidden:
+                blocked[user_id].add(article_id)
+            for keywords, user_ids in blocklists.items():
+                clause = _blocked_clause(db, list(keywords))
+                if clause is None:
+                    continue
+                hits = db.execute(select(NewsArticle.id).where(NewsArticle.id.in_(list(articles)), clause)).scalars().all()
+                for user_id in user_ids:
+                    blocked[user_id].update(hits)
+            scores = defaultdict(lambda: defaultdict(int))
+            links = db.execute(
+                select(NewsArticleTag.article_id, NewsArticleTag.tag_id).where(NewsArticleTag.article_id.in_(list(articles)))
+            )
+            for article_id, tag_id in links:
+                for user_id in users_by_tag.get(tag_id, ()):
+                    scores[article_id][user_id] += 1
+
+            rows = [
+                {'user_id': user_id, 'article_id': article_id, 'score': score, 'published_at': articles[article_id]}
+                for article_id, user_scores in scores.items()
+                for user_id, score in user_scores.items()
+                if article_id not in blocked[user_id]
+            ]
+            if rows:
+                db.execute(insert(UserFeedEntry), rows)
+                entries += len(rows)
+                touched.update(row['user_id'] for row in rows)
+
+        for pref in prefs:
+            if pref.user_id in touched:
+                _trim(db, pref)
+
+    return {'feeds': len(prefs) + built, 'built': built, 'dropped': dropped, 'entries': entries}
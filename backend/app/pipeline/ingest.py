@@ -1,6 +1,372 @@
-from typing import Iterable
+import asyncio
+import hashlib
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from typing import AsyncIterator, Iterable, Iterator
+from urllib.parse import urlsplit
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
 
+import httpx
 
-def pull_sources() -> Iterable[dict]:
-    """TODO: Pull RSS sources into a raw data lake."""
-    raise NotImplementedError('Pipeline ingest is not wired yet.')
+from app.core.config import settings
+from app.pipeline.data_lake import PayloadFrame
+
+USER_AGENT = 'GymUnityNewsBot/1.0'
+PARSE_CHUNK_BYTES = 64 * 1024
+ITEM_TAGS = {'item', 'entry'}
+MEDIA_NS = 'http://search.yahoo.com/mrss/'
+
+
+async def _download(
+    client: httpx.AsyncClient,
+    source: dict,
+    headers: dict,
+    record: dict,
+    max_bytes: int,
+    max_items: int,
+    archive: bool,
+) -> None:
+    async with client.stream('GET', source['rss_url'], headers=headers) as response:
+        record['status_code'] = response.status_code
+        if response.status_code == 304:
+            record['not_modified'] = True
+            return
+        if response.status_code >= 400:
+            record['error'] = f'HTTP {response.status_code}'
+            return
+
+        # Each chunk is hashed, parsed and (optionally) compressed for the data lake as it
+        # arrives, so only the parsed items and the compressed frame are held, never the
+        # raw body. That work runs in a worker thread so a large feed does not stall the
+        # event loop, and with it every other download, while it parses.
+        digest = hashlib.sha256()
+        parser = FeedItemParser(max_items=max_items, stop_before=source.get('newest_published_at'))
+        frame = PayloadFrame(record) if archive else None
+        items: list[dict] = []
+        parse_error = None
+
+        def consume(chunk: bytes) -> None:
+            nonlocal parse_error
+            digest.update(chunk)
+            if frame is not None:
+                frame.feed(chunk)
+            if parse_error is None and not parser.done:
+                try:
+                    items.extend(parser.feed(chunk))
+                except ValueError as exc:
+                    parse_error = str(exc)
+
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            record['bytes'] = size
+            if size > max_bytes:
+                record['error'] = f'Feed larger than {max_bytes} bytes'
+                return
+            await asyncio.to_thread(consume, chunk)
+
+    record['etag'] = response.headers.get('etag')
+    record['last_modified'] = response.headers.get('last-modified')
+    content_hash = digest.hexdigest()
+    if content_hash == source.get('content_hash'):
+        # Servers without validators still often serve byte-identical feeds.
+        record['not_modified'] = True
+        return
+    record['content_hash'] = content_hash
+    if frame is not None:
+        # Archived even when malformed, so the payload can be replayed once the parser copes.
+        record['archive'] = frame.finish()
+    if parse_error:
+        record['error'] = parse_error
+    else:
+        record['items'] = items
+
+
+async def _fetch_source(
+    client: httpx.AsyncClient,
+    source: dict,
+    host_limit: asyncio.Semaphore,
+    timeout: float,
+    max_bytes: int,
+    max_items: int,
+    archive: bool,
+) -> dict:
+    record = {
+        'source_id': source['source_id'],
+        'rss_url': source['rss_url'],
+        'fetched_at': datetime.utcnow(),
+        'status_code': None,
+        'items': None,
+        'archive': None,
+        'content_hash': source.get('content_hash'),
+        'etag': source.get('etag'),
+        'last_modified': source.get('last_modified'),
+        'not_modified': False,
+        'error': None,
+        'bytes': 0,
+        'elapsed_ms': 0.0,
+    }
+
+    headers = {}
+    if source.get('etag'):
+        headers['If-None-Match'] = source['etag']
+    if source.get('last_modified'):
+        headers['If-Modified-Since'] = source['last_modified']
+
+    async with host_limit:
+        started = time.perf_counter()
+        try:
+            # The client timeout is per network operation; wait_for caps the whole request
+            # so a feed that trickles bytes cannot hold a slot for the entire cycle.
+            await asyncio.wait_for(
+                _download(client, source, headers, record, max_bytes, max_items, archive),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            record['error'] = f'Timed out after {timeout:g}s'
+        except Exception as exc:
+            # Anything else (httpx.InvalidURL is not an HTTPError) fails this source only.
+            record['error'] = f'{type(exc).__name__}: {exc}'
+        record['elapsed_ms'] = (time.perf_counter() - started) * 1000
+
+    return record
+
+
+async def stream_sources(
+    sources: Iterable[dict],
+    concurrency: int | None = None,
+    per_host: int | None = None,
+    timeout: float | None = None,
+    max_bytes: int | None = None,
+    max_items: int | None = None,
+    archive: bool = False,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> AsyncIterator[dict]:
+    """Fetch sources concurrently over one pooled, keep-alive HTTP client.
+
+    ``sources`` are dicts with ``source_id`` and ``rss_url`` plus the optional cache
+    validators ``etag``, ``last_modified`` and ``content_hash`` from the previous poll,
+    and ``newest_published_at``. Bodies are parsed while they stream in, so per-source
+    memory is bounded by ``max_items`` parsed items rather than the feed size. One
+    record per source is yielded as soon as it completes, with its raw items in
+    ``items``; with ``archive`` set it also carries the compressed data-lake frame in
+    ``archive``. A 304 or a body identical to the last one sets ``not_modified`` and
+    leaves ``items`` empty; failures, including malformed XML, are reported in
+    ``error`` instead of raising so a single bad feed never aborts the batch.
+
+    At most ``concurrency`` requests are in flight, and a new one only starts once the
+    consumer has taken a finished record, so a slow consumer throttles fetching.
+    """
+    concurrency = concurrency or settings.NEWS_FETCH_CONCURRENCY
+    per_host = per_host or settings.NEWS_FETCH_PER_HOST_LIMIT
+    timeout = timeout or settings.NEWS_FETCH_TIMEOUT_SECONDS
+    max_bytes = max_bytes or settings.NEWS_FETCH_MAX_BYTES
+    max_items = max_items or settings.NEWS_FEED_MAX_ITEMS
+
+    host_limits: dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(per_host))
+    limits = httpx.Limits(
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+        keepalive_expiry=30,
+    )
+    remaining = iter(sources)
+    pending: set[asyncio.Task] = set()
+
+    async with httpx.AsyncClient(
+        limits=limits,
+        timeout=httpx.Timeout(timeout),
+        follow_redirects=True,
+        headers={'User-Agent': USER_AGENT},
+        transport=transport,
+    ) as client:
+
+        def launch() -> None:
+            for source in islice(remaining, concurrency - len(pending)):
+                host_limit = host_limits[urlsplit(source['rss_url']).netloc.lower()]
+                pending.add(asyncio.create_task(_fetch_source(client, source, host_limit, timeout, max_bytes, max_items, archive)))
+
+        launch()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    yield task.result()
+                launch()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+async def fetch_sources(sources: Iterable[dict], **options) -> list[dict]:
+    """Fetch all sources and return their records in input order."""
+    sources = list(sources)
+    results = {}
+    async for record in stream_sources(sources, **options):
+        results[record['source_id']] = record
+    return [results[source['source_id']] for source in sources]
+
+
+def pull_sources(sources: Iterable[dict], **options) -> list[dict]:
+    """Pull RSS sources concurrently; blocking wrapper around ``fetch_sources``."""
+    return asyncio.run(fetch_sources(sources, **options))
+
+
+def _split_tag(tag: str) -> tuple[str, str]:
+    if tag.startswith('{'):
+        namespace, _, local = tag[1:].partition('}')
+        return namespace, local
+    return '', tag
+
+
+def _text(element: Element) -> str:
+    return (element.text or '').strip()
+
+
+def parse_feed_date(value: str | None) -> datetime | None:
+    """Parse RFC 822 (RSS) or ISO 8601 (Atom) dates into naive UTC datetimes."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _item_to_record(item: Element) -> dict:
+    record = {
+        'title': '',
+        'link': '',
+        'guid': None,
+        'published_at': None,
+        'author': None,
+        'summary': '',
+        'content': None,
+        'image_url': None,
+        'categories': [],
+    }
+    updated = None
+
+    for child in item.iter():
+        if child is item:
+            continue
+        namespace, tag = _split_tag(child.tag)
+
+        if namespace == MEDIA_NS:
+            if tag in ('content', 'thumbnail') and not record['image_url'] and child.get('url'):
+                record['image_url'] = child.get('url')
+        elif tag == 'title' and not record['title']:
+            record['title'] = _text(child)
+        elif tag == 'link':
+            href = child.get('href')
+            if href is None:
+                record['link'] = record['link'] or _text(child)
+            elif child.get('rel', 'alternate') == 'alternate' and not record['link']:
+                record['link'] = href.strip()
+        elif tag in ('guid', 'id') and not record['guid']:
+            record['guid'] = _text(child) or None
+        elif tag in ('pubDate', 'published', 'date'):
+            record['published_at'] = record['published_at'] or parse_feed_date(child.text)
+        elif tag == 'updated':
+            updated = parse_feed_date(child.text)
+        elif tag in ('description', 'summary') and not record['summary']:
+            record['summary'] = _text(child)
+        elif tag in ('encoded', 'content'):
+            record['content'] = record['content'] or _text(child) or None
+        elif tag in ('creator', 'name') or (tag == 'author' and _text(child)):
+            record['author'] = record['author'] or _text(child) or None
+        elif tag == 'category':
+            value = child.get('term') or _text(child)
+            if value:
+                record['categories'].append(value)
+        elif tag == 'enclosure' and (child.get('type') or '').startswith('image/'):
+            record['image_url'] = record['image_url'] or child.get('url')
+
+    record['published_at'] = record['published_at'] or updated
+    return record
+
+
+class FeedItemParser:
+    """Push-style RSS/Atom parser: ``feed`` takes the next chunk of the document and
+    returns the raw records of the items it completed.
+
+    Each ``<item>``/``<entry>`` is detached from the tree as soon as it has been read,
+    so memory stays bounded by a single item regardless of document size. ``done`` is
+    set after ``max_items`` records, or at the first item published before
+    ``stop_before`` since feeds list their newest items first; later chunks are ignored.
+    """
+
+    def __init__(self, max_items: int | None = None, stop_before: datetime | None = None):
+        self.max_items = max_items
+        self.stop_before = stop_before
+        self.done = False
+        self._parser = XMLPullParser(events=('start', 'end'))
+        self._stack: list[Element] = []
+        self._emitted = 0
+
+    def feed(self, chunk: bytes) -> list[dict]:
+        if self.done:
+            return []
+        try:
+            self._parser.feed(chunk)
+            events = list(self._parser.read_events())
+        except ParseError as exc:
+            self.done = True
+            raise ValueError(f'Malformed feed: {exc}') from exc
+
+        records = []
+        for event, element in events:
+            if event == 'start':
+                self._stack.append(element)
+                continue
+
+            self._stack.pop()
+            if _split_tag(element.tag)[1] not in ITEM_TAGS:
+                continue
+
+            record = _item_to_record(element)
+            element.clear()
+            if self._stack:
+                self._stack[-1].remove(element)
+
+            if self.stop_before and record['published_at'] and record['published_at'] < self.stop_before:
+                self.done = True
+                break
+            records.append(record)
+            self._emitted += 1
+            if self.max_items is not None and self._emitted >= self.max_items:
+                self.done = True
+                break
+        return records
+
+
+def iter_feed_items(
+    chunks: Iterable[bytes],
+    max_items: int | None = None,
+    stop_before: datetime | None = None,
+) -> Iterator[dict]:
+    """Incrementally parse an RSS or Atom document, yielding one raw record per item.
+
+    Pull-style wrapper around ``FeedItemParser`` for documents already in hand.
+    """
+    parser = FeedItemParser(max_items=max_items, stop_before=stop_before)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+
+
+def iter_chunks(content: bytes, size: int = PARSE_CHUNK_BYTES) -> Iterator[bytes]:
+    view = memoryview(content)
+    for offset in range(0, len(view), size):
+        yield view[offset:offset + size]
@@ -1,6 +1,34 @@
+import re
 from typing import Iterable
 
+TOPIC_KEYWORDS = {
+    'strength': ['strength', 'deadlift', 'squat', 'bench press', 'powerlifting', 'barbell'],
+    'cardio': ['cardio', 'running', 'endurance', 'hiit', 'zone 2', 'cycling', 'conditioning'],
+    'nutrition': ['nutrition', 'protein', 'diet', 'calorie', 'calories', 'meal', 'supplement'],
+    'recovery': ['recovery', 'sleep', 'rest day', 'mobility', 'stretching', 'soreness'],
+    'weight loss': ['weight loss', 'fat loss', 'lose weight'],
+    'muscle gain': ['muscle gain', 'hypertrophy', 'bulking', 'bodybuilding'],
+    'injury prevention': ['injury', 'injuries', 'rehab', 'joint pain', 'prehab'],
+    'mental fitness': ['stress', 'mindfulness', 'mental health', 'motivation'],
+}
+
+TOPIC_PATTERNS = {
+    topic: re.compile(r'\b(?:' + '|'.join(re.escape(keyword) for keyword in keywords) + r')\b', re.IGNORECASE)
+    for topic, keywords in TOPIC_KEYWORDS.items()
+}
+
 
 def classify_topics(records: Iterable[dict]) -> list[dict]:
-    """TODO: Run topic classification, keyword extraction, summarization."""
-    raise NotImplementedError('Pipeline NLP is not wired yet.')
+    """Tag records with topics detected in their title and summary.
+
+    Detected topics are appended to the record's CSV ``tags`` without duplicates.
+    """
+    classified = []
+    for record in records:
+        text = f"{record.get('title', '')} {record.get('summary', '')}"
+        tags = [tag for tag in (record.get('tags') or '').split(',') if tag]
+        for topic, pattern in TOPIC_PATTERNS.items():
+            if topic not in tags and pattern.search(text):
+                tags.append(topic)
+        classified.append({**record, 'tags': ','.join(tags)})
+    return classified
@@ -0,0 +1,121 @@
+import hashlib
+import math
+import threading
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.news import NewsArticle
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bit_count = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.bits = bytearray(math.ceil(self.bit_count / 8))
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'big')
+        second = int.from_bytes(digest[8:], 'big') | 1
+        for index in range(self.hash_count):
+            yield (first + index * second) % self.bit_count
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    @property
+    def false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.hash_count * self.count / self.bit_count)) ** self.hash_count
+
+
+class ScalableBloomFilter:
+    """Bloom filter that grows by adding layers instead of degrading when full.
+
+    Each new layer doubles capacity and halves its error rate, so the combined false
+    positive rate stays below roughly twice the initial target however many keys arrive.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.layers = [BloomFilter(capacity, error_rate / 2)]
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in layer for layer in self.layers)
+
+    def add(self, key: str) -> None:
+        if key in self:
+            return
+        layer = self.layers[-1]
+        if layer.count >= layer.capacity:
+            layer = BloomFilter(layer.capacity * 2, layer.error_rate / 2)
+            self.layers.append(layer)
+        layer.add(key)
+
+    def __len__(self) -> int:
+        return sum(layer.count for layer in self.layers)
+
+    @property
+    def false_positive_rate(self) -> float:
+        return 1 - math.prod(1 - layer.false_positive_rate for layer in self.layers)
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(len(layer.bits) for layer in self.layers)
+
+
+_filter: ScalableBloomFilter | None = None
+_lock = threading.Lock()
+
+
+def article_key(source_id: int, unique_hash: str) -> str:
+    return f'{source_id}:{unique_hash}'
+
+
+def get_seen_filter(db: Session) -> ScalableBloomFilter:
+    """Return the process-wide filter of stored (source_id, unique_hash) keys.
+
+    The first call warms it from ``news_articles``; afterwards ``remember_seen`` keeps it
+    current with the keys of every committed fetch.
+    """
+    global _filter
+    with _lock:
+        if _filter is None:
+            seen = ScalableBloomFilter(settings.NEWS_SEEN_FILTER_CAPACITY, settings.NEWS_SEEN_FILTER_ERROR_RATE)
+            rows = db.query(NewsArticle.source_id, NewsArticle.unique_hash).yield_per(10000)
+            for source_id, unique_hash in rows:
+                seen.add(article_key(source_id, unique_hash))
+            _filter = seen
+    return _filter
+
+
+def remember_seen(keys: list[str]) -> None:
+    """Add keys whose articles are committed.
+
+    Only call this after the commit: a key added for a batch that later rolls back
+    would make this process skip that article for good.
+    """
+    with _lock:
+        if _filter is None:
+            # The next warm-up reads them from the table.
+            return
+        for key in keys:
+            _filter.add(key)
+
+
+def seen_filter_stats() -> dict:
+    seen = _filter
+    if seen is None:
+        return {'items': 0, 'false_positive_rate': 0.0, 'memory_bytes': 0}
+    return {
+        'items': len(seen),
+        'false_positive_rate': seen.false_positive_rate,
+        'memory_bytes': seen.memory_bytes,
+    }
@@ -0,0 +1,112 @@
+from typing import Iterable
+
+from sqlalchemy import delete, exists, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.news import NewsArticle, NewsArticleTag, NewsTag, UserNewsPreference, UserNewsTopic
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def split_tags(value: str | None) -> list[str]:
+    """Split a CSV tag column into normalized, de-duplicated names."""
+    names = []
+    for item in (value or '').split(','):
+        name = item.strip().lower()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def tag_ids(db: Session, names: Iterable[str]) -> dict[str, int]:
+    """Map the given tag names to ids, ignoring names that have no tag yet."""
+    names = {name.strip().lower() for name in names if name.strip()}
+    if not names:
+        return {}
+    return dict(db.execute(select(NewsTag.name, NewsTag.id).where(NewsTag.name.in_(names))).all())
+
+
+def ensure_tag_ids(db: Session, names: Iterable[str]) -> dict[str, int]:
+    """Like ``tag_ids`` but creates the missing tags first."""
+    names = {name.strip().lower() for name in names if name.strip()}
+    known = tag_ids(db, names)
+    missing = names - known.keys()
+    if missing:
+        try:
+            with db.begin_nested():
+                db.execute(insert(NewsTag), [{'name': name} for name in sorted(missing)])
+        except IntegrityError:
+            # Another writer created some of them first; add the rest one at a time.
+            for name in sorted(missing - tag_ids(db, missing).keys()):
+                try:
+                    with db.begin_nested():
+                        db.execute(insert(NewsTag), [{'name': name}])
+                except IntegrityError:
+                    pass
+        known = tag_ids(db, names)
+    return known
+
+
+def sync_article_tags(db: Session, article_tags: dict[int, str | None]) -> None:
+    """Replace the tag links of each article id with the tags in its CSV value."""
+    if not article_tags:
+        return
+    parsed = {article_id: split_tags(value) for article_id, value in article_tags.items()}
+    ids = ensure_tag_ids(db, {name for names in parsed.values() for name in names})
+    db.execute(delete(NewsArticleTag).where(NewsArticleTag.article_id.in_(list(parsed))))
+    links = [
+        {'article_id': article_id, 'tag_id': ids[name]}
+        for article_id, names in parsed.items()
+        for name in names
+    ]
+    if links:
+        db.execute(insert(NewsArticleTag), links)
+
+
+def sync_preference_topics(db: Session, user_id: int, topics: str | None) -> None:
+    """Replace a user's topic links with the topics in the CSV preference value."""
+    ids = ensure_tag_ids(db, split_tags(topics))
+    db.execute(delete(UserNewsTopic).where(UserNewsTopic.user_id == user_id))
+    if ids:
+        db.execute(insert(UserNewsTopic), [{'user_id': user_id, 'tag_id': tag_id} for tag_id in ids.values()])
+
+
+def backfill_tags(db: Session) -> int:
+    """Link articles and preferences whose CSV tags have not been normalized yet.
+
+    Safe to run on every start: only rows with a non-empty CSV value and no links are
+    touched, so it picks up databases created before the tag tables existed and rows
+    written outside the pipeline (such as seed data). Returns the rows linked.
+    """
+    linked = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(NewsArticle.id, NewsArticle.tags)
+            .where(
+                NewsArticle.id > last_id,
+                NewsArticle.tags.isnot(None),
+                NewsArticle.tags != '',
+                ~exists().where(NewsArticleTag.article_id == NewsArticle.id),
+            )
+            .order_by(NewsArticle.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        sync_article_tags(db, dict(rows))
+        db.commit()
+        linked += len(rows)
+        last_id = rows[-1][0]
+
+    preferences = db.execute(
+        select(UserNewsPreference.user_id, UserNewsPreference.topics).where(
+            UserNewsPreference.topics != '',
+            ~exists().where(UserNewsTopic.user_id == UserNewsPreference.user_id),
+        )
+    ).all()
+    for user_id, topics in preferences:
+        sync_preference_topics(db, user_id, topics)
+    db.commit()
+    return linked + len(preferences)
@@ -1,6 +1,64 @@
-from typing import Iterable
+import hashlib
+import html
+import re
+from datetime import datetime
+from typing import Iterable, Iterator
 
+from app.pipeline.dedup import simhash
 
-def normalize_records(records: Iterable[dict]) -> list[dict]:
-    """TODO: Clean and normalize raw RSS items."""
-    raise NotImplementedError('Pipeline transform is not wired yet.')
+TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+SUMMARY_MAX_CHARS = 1000
+
+
+def _clean_text(value: str | None) -> str:
+    if not value:
+        return ''
+    text = TAG_RE.sub(' ', html.unescape(value))
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+
+def _normalize_tags(values: Iterable[str]) -> str:
+    normalized = []
+    for value in values:
+        cleaned = _clean_text(value).lower()
+        if cleaned and cleaned not in normalized:
+            normalized.append(cleaned)
+    return ','.join(normalized)
+
+
+def normalize_records(records: Iterable[dict], source: dict) -> Iterator[dict]:
+    """Clean raw feed items into article rows for ``source``.
+
+    ``records`` may be a lazy iterator straight from the parser; rows are yielded one at
+    a time so the whole feed never has to be held in memory. Items without a title or
+    link are dropped. Every row gets a SimHash of its title and summary, which the
+    store stage checks against recent articles from every source.
+    """
+    source_tags = [tag for tag in (source.get('tags') or '').split(',') if tag]
+    fetched_at = source.get('fetched_at') or datetime.utcnow()
+
+    for record in records:
+        title = _clean_text(record.get('title'))
+        link = (record.get('link') or record.get('guid') or '').strip()
+        if not title or not link:
+            continue
+
+        summary = _clean_text(record.get('summary') or record.get('content'))
+        if len(summary) > SUMMARY_MAX_CHARS:
+            summary = summary[:SUMMARY_MAX_CHARS].rsplit(' ', 1)[0] + '...'
+
+        yield {
+            'source_id': source['source_id'],
+            'title': title,
+            'link': link,
+            'guid': record.get('guid'),
+            'unique_hash': hashlib.sha256(link.encode('utf-8')).hexdigest(),
+            'published_at': record.get('published_at') or fetched_at,
+            'author': _clean_text(record.get('author')) or None,
+            'summary': summary,
+            'content': record.get('content'),
+            'image_url': record.get('image_url'),
+            'tags': _normalize_tags(list(record.get('categories') or []) + source_tags),
+            'simhash': simhash(f'{title} {summary}'),
+        }
@@ -1,7 +1,19 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field, HttpUrl, TypeAdapter
+
+_http_url = TypeAdapter(HttpUrl)
+
+
+def _check_feed_url(value: str) -> str:
+    # Validated as an http(s) URL but stored as entered, so lookups by rss_url still match.
+    value = value.strip()
+    _http_url.validate_python(value)
+    return value
+
+
+FeedUrl = Annotated[str, AfterValidator(_check_feed_url)]
 
 
 class NewsSourceOut(BaseModel):
@@ -20,7 +32,7 @@ class NewsSourceOut(BaseModel):
 
 class NewsSourceCreate(BaseModel):
     name: str
-    rss_url: str
+    rss_url: FeedUrl
     category: Optional[str] = None
     tags: List[str] = Field(default_factory=list)
     enabled: bool = True
@@ -28,13 +40,13 @@ class NewsSourceCreate(BaseModel):
 
 class NewsSourceUpdate(BaseModel):
     name: Optional[str] = None
-    rss_url: Optional[str] = None
+    rss_url: Optional[FeedUrl] = None
     category: Optional[str] = None
     tags: Optional[List[str]] = None
     enabled: Optional[bool] = None
 
 
-class NewsArticleOut(BaseModel):
+class NewsArticleListItem(BaseModel):
     id: int
     title: str
     link: str
@@ -42,7 +54,6 @@ class NewsArticleOut(BaseModel):
     published_at: Optional[datetime] = None
     author: Optional[str] = None
     summary: str
-    content: Optional[str] = None
     image_url: Optional[str] = None
     tags: List[str] = Field(default_factory=list)
     source: NewsSourceOut
@@ -52,11 +63,17 @@ class NewsArticleOut(BaseModel):
         from_attributes = True
 
 
+class NewsArticleOut(NewsArticleListItem):
+    content: Optional[str] = None
+
+
 class NewsFeedResponse(BaseModel):
-    items: List[NewsArticleOut]
+    items: List[NewsArticleListItem]
     page: int
     page_size: int
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
 
 class PreferencesOut(BaseModel):
@@ -73,13 +90,43 @@ class PreferencesIn(BaseModel):
     blocked_keywords: List[str] = Field(default_factory=list)
 
 
+class NewsSourceFetchStatsOut(BaseModel):
+    source_id: int
+    source_name: str
+    fetches: int
+    failures: int
+    not_modified: int
+    items_new: int
+    bytes_total: int
+    latency_ms_p50: float
+    latency_ms_p95: float
+    parse_ms_total: float
+
+
 class NewsStatusOut(BaseModel):
     last_run: Optional[datetime] = None
     sources_checked: int
     sources_success: int
     sources_failed: int
+    sources_cached: int = 0
     items_ingested: int
     last_error: Optional[str] = None
+    window_hours: int = 24
+    source_stats: List[NewsSourceFetchStatsOut] = []
+    slowest_sources: List[NewsSourceFetchStatsOut] = []
+    seen_filter_items: int = 0
+    seen_filter_false_positive_rate: float = 0.0
+    seen_filter_memory_bytes: int = 0
+
+
+class PipelineStageOut(BaseModel):
+    name: str
+    items: int
+    batches: int
+    wall_seconds: float
+    throughput_per_second: float
+    latency_ms_p50: float
+    latency_ms_p95: float
 
 
 class FetchNowResponse(BaseModel):
@@ -87,8 +134,10 @@ class FetchNowResponse(BaseModel):
     sources_checked: int
     sources_success: int
     sources_failed: int
+    sources_cached: int = 0
     items_ingested: int
     last_error: Optional[str] = None
+    stages: List[PipelineStageOut] = Field(default_factory=list)
 
 
 class NewsChatRequest(BaseModel):
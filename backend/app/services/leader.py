@@ -0,0 +1,128 @@
+import os
+import threading
+import zlib
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class LeaderLease:
+    """Non-blocking leadership lease shared by every worker process.
+
+    On PostgreSQL this is a session-level advisory lock held on a dedicated connection;
+    elsewhere (SQLite) it is an exclusive lock on a local file. Both are released by the
+    server or the OS when the holder dies, so a follower calling ``acquire`` on its next
+    tick takes over without any expiry bookkeeping.
+    """
+
+    def __init__(self, engine: Engine, name: str, lock_path: str | Path):
+        self.engine = engine
+        self.name = name
+        self.key = zlib.crc32(name.encode('utf-8'))
+        self.lock_path = Path(lock_path)
+        self._connection: Connection | None = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_leader(self) -> bool:
+        return self._connection is not None or self._file is not None
+
+    def acquire(self) -> bool:
+        """Return True if this process holds the lease, trying to take it if not."""
+        with self._lock:
+            if self.engine.dialect.name == 'postgresql':
+                return self._acquire_advisory()
+            return self._acquire_file()
+
+    def _acquire_advisory(self) -> bool:
+        if self._connection is not None:
+            try:
+                self._connection.execute(text('SELECT 1'))
+                # End the autobegun transaction so the connection is not left idle in
+                # transaction (and killed by idle_in_transaction_session_timeout); the
+                # advisory lock is session-level and survives the commit.
+                self._connection.commit()
+                return True
+            except DBAPIError:
+                # The lock died with the session; fall through and compete again.
+                self._connection.invalidate()
+                self._connection = None
+
+        connection = self.engine.connect()
+        try:
+            acquired = connection.execute(text('SELECT pg_try_advisory_lock(:key)'), {'key': self.key}).scalar()
+            connection.commit()
+        except DBAPIError:
+            connection.close()
+            raise
+        if not acquired:
+            connection.close()
+            return False
+        self._connection = connection
+        return True
+
+    def _acquire_file(self) -> bool:
+        if self._file is not None:
+            return True
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(self.lock_path, 'a+')
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            handle.close()
+            return False
+
+        handle.seek(0)
+        handle.truncate()
+        handle.write(str(os.getpid()))
+        handle.flush()
+        self._file = handle
+        return True
+
+    def release(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._connection.execute(text('SELECT pg_advisory_unlock(:key)'), {'key': self.key})
+                    self._connection.commit()
+                except DBAPIError:
+                    pass
+                self._connection.close()
+                self._connection = None
+            if self._file is not None:
+                # Closing the handle drops the lock on every platform.
+                self._file.close()
+                self._file = None
+
+
+_leases: dict[str, LeaderLease] = {}
+_leases_lock = threading.Lock()
+
+
+def news_scheduler_lease(engine: Engine) -> LeaderLease:
+    """Return this process's news fetch lease, shared by the scheduler and admin triggers.
+
+    One object per process matters: the file lock is per open handle, so a second
+    lease in the leader process would fail to take a lock the process already holds.
+    """
+    key = str(engine.url)
+    with _leases_lock:
+        if key not in _leases:
+            _leases[key] = LeaderLease(engine, 'gymunity-news-scheduler', settings.NEWS_LEADER_LOCK_PATH)
+        return _leases[key]
@@ -0,0 +1,66 @@
+import threading
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.news import NewsArticle
+
+
+def _response_weight(response) -> int:
+    # Rough byte size of a cached feed page: the text fields dominate.
+    return 512 + sum(
+        256 + len(item.title) + len(item.link) + len(item.summary or '')
+        for item in response.items
+    )
+
+
+count_cache = TTLCache(settings.NEWS_COUNT_CACHE_SIZE, settings.NEWS_COUNT_CACHE_TTL_SECONDS)
+# Personalized feed pages, keyed on the user's preference feed_version and the news
+# version. Changes made in this process retire pages at once; a save, hide or
+# preference change on another worker is seen here when this process's preference
+# snapshot reloads, so pages can be up to NEWS_PREFERENCES_CACHE_TTL_SECONDS stale.
+feed_cache = TTLCache(
+    settings.NEWS_FEED_CACHE_SIZE,
+    settings.NEWS_FEED_CACHE_TTL_SECONDS,
+    max_weight=settings.NEWS_FEED_CACHE_MAX_BYTES,
+    weigh=_response_weight,
+)
+
+_version = 0
+_version_lock = threading.Lock()
+
+
+def bump_news_version() -> None:
+    """Invalidate this process's cached news results after sources or articles change."""
+    global _version
+    with _version_lock:
+        _version += 1
+
+
+def news_version(db: Session) -> tuple[int, int]:
+    """Version of the article set, for use in cache keys.
+
+    The newest article id (a primary-key lookup) moves whenever any worker ingests, so
+    other processes see new articles without being told; the local counter covers
+    changes made in this process that do not insert rows, such as disabling a source.
+    """
+    newest = db.query(func.max(NewsArticle.id)).scalar() or 0
+    return newest, _version
+
+
+def query_signature(query) -> tuple[str, str]:
+    """Cache key for a query: its SQL text plus bound parameters."""
+    compiled = query.statement.compile(dialect=query.session.get_bind().dialect)
+    return str(compiled), repr(sorted(compiled.params.items()))
+
+
+def estimated_count(db: Session, query) -> int:
+    """Row count of ``query``, reused from cache while the article set is unchanged."""
+    key = (query_signature(query), news_version(db))
+    total = count_cache.get(key)
+    if total is None:
+        total = query.count()
+        count_cache.set(key, total)
+    return total
@@ -1,21 +1,183 @@
-from datetime import datetime
+import random
+import threading
+from datetime import datetime, timedelta
 
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
-from app.models.news import NewsSource
+from app.core.config import settings
+from app.models.news import NewsArticle, NewsSource
+from app.pipeline.feed_fanout import fan_out_articles
+from app.pipeline.orchestrator import run_pipeline
+from app.pipeline.seen_filter import remember_seen
+from app.services.leader import news_scheduler_lease
+from app.services.news_cache import bump_news_version
+from app.services.news_telemetry import record_run
 
 
-def fetch_news(db: Session) -> dict:
-    sources = db.query(NewsSource).filter(NewsSource.enabled.is_(True)).all()
-    for source in sources:
-        source.last_fetched_at = datetime.utcnow()
-    db.commit()
+# Serializes fetches within a process; the lease does the same across processes.
+fetch_lock = threading.Lock()
+
+
+class FetchInProgress(Exception):
+    """Raised by ``fetch_news_now`` when another fetch is running here or on the leader."""
+
+
+def _newest_published(db: Session, source_ids: list[int]) -> dict[int, datetime]:
+    if not source_ids:
+        return {}
+    rows = (
+        db.query(NewsArticle.source_id, func.max(NewsArticle.published_at))
+        .filter(NewsArticle.source_id.in_(source_ids))
+        .group_by(NewsArticle.source_id)
+        .all()
+    )
+    return {source_id: newest for source_id, newest in rows if newest}
+
+
+def next_poll_interval(source: NewsSource, new_items: int, failed: bool, now: datetime) -> float:
+    """Return the minutes until ``source`` should be polled again.
 
+    Failing sources back off exponentially. Otherwise the interval drifts toward the
+    observed time between new articles: it halves the gap to that cadence when new
+    items arrive and stretches when a poll finds nothing, within the configured bounds.
+    """
+    current = source.poll_interval_minutes or settings.NEWS_PIPELINE_INTERVAL_MINUTES
+    minimum = settings.NEWS_POLL_MIN_MINUTES
+    maximum = settings.NEWS_POLL_MAX_MINUTES
+
+    if failed:
+        return min(maximum, current * 2 ** min(source.consecutive_failures, 10))
+
+    if new_items:
+        elapsed = current
+        if source.last_fetched_at:
+            elapsed = max((now - source.last_fetched_at).total_seconds() / 60, minimum)
+        interval = (current + elapsed / new_items) / 2
+    else:
+        interval = current * settings.NEWS_POLL_IDLE_FACTOR
+    return max(minimum, min(maximum, interval))
+
+
+def _schedule_next_poll(source: NewsSource, new_items: int, failed: bool, now: datetime) -> None:
+    interval = next_poll_interval(source, new_items, failed, now)
+    if not failed:
+        # Failure backoff is derived from the healthy interval, so only learn from successes.
+        source.poll_interval_minutes = interval
+    jitter = 1 + random.uniform(-settings.NEWS_POLL_JITTER, settings.NEWS_POLL_JITTER)
+    source.next_fetch_at = now + timedelta(minutes=interval * jitter)
+
+
+def _idle_summary(now: datetime) -> dict:
     return {
-        'fetched_at': datetime.utcnow(),
-        'sources_checked': len(sources),
-        'sources_success': len(sources),
+        'started_at': now,
+        'fetched_at': now,
+        'sources_checked': 0,
+        'sources_success': 0,
         'sources_failed': 0,
+        'sources_cached': 0,
         'articles_new': 0,
+        'articles_updated': 0,
+        'articles_duplicate': 0,
+        'articles_already_seen': 0,
         'articles_total': 0,
+        'feeds_materialized': 0,
+        'feed_entries_added': 0,
+        'last_error': None,
+        'stages': [],
+    }
+
+
+def fetch_news(db: Session, due_only: bool = False) -> dict:
+    now = datetime.utcnow()
+    query = db.query(NewsSource).filter(NewsSource.enabled.is_(True))
+    if due_only:
+        query = query.filter(or_(NewsSource.next_fetch_at.is_(None), NewsSource.next_fetch_at <= now))
+    sources = query.all()
+    if not sources:
+        # An idle scheduler tick: nothing to fetch, record or invalidate.
+        return _idle_summary(now)
+    by_id = {source.id: source for source in sources}
+
+    newest = _newest_published(db, list(by_id))
+    outcome = run_pipeline(
+        db,
+        [
+            {
+                'source_id': source.id,
+                'rss_url': source.rss_url,
+                'tags': source.tags,
+                'etag': source.etag,
+                'last_modified': source.last_modified,
+                'content_hash': source.content_hash,
+                'newest_published_at': newest.get(source.id),
+            }
+            for source in sources
+        ],
+    )
+    results = outcome['results']
+
+    failed = [result for result in results if result['error']]
+    cached = [result for result in results if result['not_modified']]
+    for result in results:
+        source = by_id[result['source_id']]
+        if result['error']:
+            source.consecutive_failures += 1
+            _schedule_next_poll(source, 0, True, now)
+            continue
+        _schedule_next_poll(source, outcome['inserted_by_source'].get(source.id, 0), False, now)
+        source.consecutive_failures = 0
+        source.last_fetched_at = result['fetched_at']
+        source.etag = result['etag']
+        source.last_modified = result['last_modified']
+        source.content_hash = result['content_hash']
+
+    fanout = fan_out_articles(db, outcome['inserted_ids'], outcome['updated_ids'])
+
+    summary = {
+        'started_at': outcome['started_at'],
+        'fetched_at': datetime.utcnow(),
+        'sources_checked': len(sources),
+        'sources_success': len(sources) - len(failed),
+        'sources_failed': len(failed),
+        'sources_cached': len(cached),
+        'articles_new': outcome['inserted'],
+        'articles_updated': outcome['updated'],
+        'articles_duplicate': outcome['duplicates'],
+        'articles_already_seen': outcome['already_seen'],
+        'articles_total': outcome['records'],
+        'feeds_materialized': fanout['feeds'],
+        'feed_entries_added': fanout['entries'],
+        'last_error': failed[-1]['error'] if failed else None,
+        'stages': outcome['stages'],
     }
+    record_run(db, 'scheduled' if due_only else 'manual', summary, results, outcome['inserted_by_source'])
+    db.commit()
+    remember_seen(outcome['seen_keys'])
+    if outcome['inserted'] or outcome['updated']:
+        # Retires this process's cached feed pages and counts, so only on a real change.
+        bump_news_version()
+    return summary
+
+
+def fetch_news_now(db: Session) -> dict:
+    """Fetch every enabled source immediately, under the scheduler's leader lease.
+
+    Raises ``FetchInProgress`` rather than waiting when a fetch is already running in
+    this process or another worker holds the lease, so a manual trigger never runs
+    alongside the scheduled one. A lease taken only for this fetch is released after.
+    """
+    if not fetch_lock.acquire(blocking=False):
+        raise FetchInProgress('A news fetch is already running')
+    try:
+        lease = news_scheduler_lease(db.get_bind())
+        was_leader = lease.is_leader
+        if not lease.acquire():
+            raise FetchInProgress('Another worker is fetching news')
+        try:
+            return fetch_news(db)
+        finally:
+            if not was_leader:
+                lease.release()
+    finally:
+        fetch_lock.release()
@@ -0,0 +1,105 @@
+from array import array
+from bisect import bisect_left, insort
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.news import UserHiddenArticle, UserSavedArticle
+
+
+def _sorted_ids(ids: Iterable[int]) -> array:
+    return array('q', sorted(set(ids)))
+
+
+def _contains(ids: array, article_id: int) -> bool:
+    index = bisect_left(ids, article_id)
+    return index < len(ids) and ids[index] == article_id
+
+
+class InteractionState:
+    """A user's saved and hidden article ids as sorted int arrays, tagged with the
+    preference ``feed_version`` they were read at.
+
+    Instances are never mutated once cached; updates build a copy, so readers on other
+    threads always see a consistent pair of sets.
+    """
+
+    __slots__ = ('version', 'saved', 'hidden')
+
+    def __init__(self, version: int, saved: array, hidden: array):
+        self.version = version
+        self.saved = saved
+        self.hidden = hidden
+
+    def is_saved(self, article_id: int) -> bool:
+        return _contains(self.saved, article_id)
+
+    def is_hidden(self, article_id: int) -> bool:
+        return _contains(self.hidden, article_id)
+
+    def saved_ids(self, article_ids: Iterable[int]) -> set[int]:
+        return {article_id for article_id in article_ids if self.is_saved(article_id)}
+
+
+def _state_weight(state: InteractionState) -> int:
+    return 128 + state.saved.itemsize * (len(state.saved) + len(state.hidden))
+
+
+interaction_cache = TTLCache(
+    settings.NEWS_INTERACTION_CACHE_SIZE,
+    settings.NEWS_INTERACTION_CACHE_TTL_SECONDS,
+    max_weight=settings.NEWS_INTERACTION_CACHE_MAX_BYTES,
+    weigh=_state_weight,
+)
+
+
+def get_interactions(db: Session, user_id: int, version: int) -> InteractionState:
+    """Return the user's saved/hidden ids, reloading them when ``version`` has moved.
+
+    Saves, unsaves and hides bump the version in the same transaction. Callers pass
+    the version from the cached preference snapshot, so a change made by another
+    worker process is picked up here once that worker's snapshot is reloaded, within
+    NEWS_PREFERENCES_CACHE_TTL_SECONDS; changes made in this process apply at once.
+    """
+    state = interaction_cache.get(user_id)
+    if state is not None and state.version == version:
+        return state
+    saved = db.execute(select(UserSavedArticle.article_id).where(UserSavedArticle.user_id == user_id)).scalars()
+    hidden = db.execute(select(UserHiddenArticle.article_id).where(UserHiddenArticle.user_id == user_id)).scalars()
+    state = InteractionState(version, _sorted_ids(saved), _sorted_ids(hidden))
+    interaction_cache.set(user_id, state)
+    return state
+
+
+def update_interactions(
+    user_id: int,
+    version: int,
+    saved: Iterable[int] = (),
+    unsaved: Iterable[int] = (),
+    hidden: Iterable[int] = (),
+) -> None:
+    """Write a committed change through to the cached state.
+
+    ``version`` is the feed version the change committed; the cached state is only
+    carried forward when it was read at the version just before it, otherwise it is
+    dropped and the next read reloads it.
+    """
+    state = interaction_cache.get(user_id)
+    if state is None:
+        return
+    if state.version != version - 1:
+        interaction_cache.pop(user_id)
+        return
+    removed = set(unsaved)
+    saved_ids = array('q', (article_id for article_id in state.saved if article_id not in removed))
+    hidden_ids = array('q', state.hidden)
+    for article_id in saved:
+        if not _contains(saved_ids, article_id):
+            insort(saved_ids, article_id)
+    for article_id in hidden:
+        if not _contains(hidden_ids, article_id):
+            insort(hidden_ids, article_id)
+    interaction_cache.set(user_id, InteractionState(version, saved_ids, hidden_ids))
@@ -0,0 +1,95 @@
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.news import UserNewsPreference, UserNewsTopic
+from app.pipeline.tags import split_tags
+
+
+class PreferenceSnapshot:
+    """A user's news preferences, parsed and normalized once.
+
+    ``stored`` is False for users who never saved preferences; they get the defaults
+    without a row being created. ``feed_version`` stamps the snapshot for the feed and
+    interaction caches.
+    """
+
+    __slots__ = (
+        'user_id',
+        'stored',
+        'topics',
+        'topic_ids',
+        'level',
+        'equipment',
+        'blocked_keywords',
+        'feed_version',
+        'feed_materialized_at',
+        'feed_truncated',
+    )
+
+    def __init__(
+        self,
+        user_id: int,
+        stored: bool = False,
+        topics: tuple[str, ...] = (),
+        topic_ids: tuple[int, ...] = (),
+        level: str = 'beginner',
+        equipment: str = 'gym',
+        blocked_keywords: tuple[str, ...] = (),
+        feed_version: int = 0,
+        feed_materialized_at: datetime | None = None,
+        feed_truncated: bool = False,
+    ):
+        self.user_id = user_id
+        self.stored = stored
+        self.topics = topics
+        self.topic_ids = topic_ids
+        self.level = level
+        self.equipment = equipment
+        self.blocked_keywords = blocked_keywords
+        self.feed_version = feed_version
+        self.feed_materialized_at = feed_materialized_at
+        self.feed_truncated = feed_truncated
+
+
+preferences_cache = TTLCache(settings.NEWS_PREFERENCES_CACHE_SIZE, settings.NEWS_PREFERENCES_CACHE_TTL_SECONDS)
+
+
+def load_preferences(db: Session, user_id: int) -> PreferenceSnapshot:
+    """Return the user's preference snapshot, from cache when this process has one.
+
+    Changes made through this process are applied by ``forget_preferences``; those made
+    by other workers (saves and hides bump ``feed_version``) show up once the entry's
+    NEWS_PREFERENCES_CACHE_TTL_SECONDS pass. Never writes.
+    """
+    snapshot = preferences_cache.get(user_id)
+    if snapshot is not None:
+        return snapshot
+
+    pref = db.get(UserNewsPreference, user_id)
+    if pref is None:
+        snapshot = PreferenceSnapshot(user_id)
+    else:
+        topic_ids = db.execute(select(UserNewsTopic.tag_id).where(UserNewsTopic.user_id == user_id)).scalars()
+        snapshot = PreferenceSnapshot(
+            user_id,
+            stored=True,
+            topics=tuple(split_tags(pref.topics)),
+            topic_ids=tuple(topic_ids),
+            level=pref.level,
+            equipment=pref.equipment,
+            blocked_keywords=tuple(split_tags(pref.blocked_keywords)),
+            feed_version=pref.feed_version,
+            feed_materialized_at=pref.feed_materialized_at,
+            feed_truncated=pref.feed_truncated,
+        )
+    preferences_cache.set(user_id, snapshot)
+    return snapshot
+
+
+def forget_preferences(user_id: int) -> None:
+    """Drop the cached snapshot after committing a change to the user's preference row."""
+    preferences_cache.pop(user_id)
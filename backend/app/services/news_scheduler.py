@@ -1,26 +1,56 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
-from app.db.session import SessionLocal
-from app.services.news_fetcher import fetch_news
+from app.core.config import settings
+from app.db.session import SessionLocal, engine
+from app.pipeline.feed_fanout import flush_feed_activity
+from app.pipeline.orchestrator import shutdown_process_pool
+from app.services.leader import news_scheduler_lease
+from app.services.news_fetcher import fetch_lock, fetch_news
+from app.services.news_telemetry import prune_fetch_history
 
 
-def start_news_scheduler(app, interval_minutes: int = 30) -> None:
+def start_news_scheduler(app, tick_seconds: int | None = None) -> None:
+    """Poll whichever sources are due every tick.
+
+    Each source carries its own persisted ``next_fetch_at``, so the tick only picks up
+    sources whose adaptive interval has elapsed and a restart resumes the existing
+    schedule instead of refetching everything.
+
+    Every worker process runs the tick, but only the holder of the leader lease does any
+    work; the others retry the lease each tick and take over if the leader dies.
+    """
     if getattr(app.state, 'news_scheduler', None):
         return
 
     scheduler = BackgroundScheduler()
+    lease = news_scheduler_lease(engine)
 
     def job():
         db = SessionLocal()
         try:
-            fetch_news(db)
+            # Every worker records its own feed readers; only the leader fetches.
+            flush_feed_activity(db)
+            db.commit()
+            with fetch_lock:
+                if lease.acquire():
+                    fetch_news(db, due_only=True)
+                    prune_fetch_history(db)
+                    db.commit()
         finally:
             db.close()
 
-    scheduler.add_job(job, IntervalTrigger(minutes=interval_minutes), id='news_fetch', replace_existing=True)
+    scheduler.add_job(
+        job,
+        IntervalTrigger(seconds=tick_seconds or settings.NEWS_SCHEDULER_TICK_SECONDS),
+        id='news_fetch',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
     scheduler.start()
     app.state.news_scheduler = scheduler
+    app.state.news_scheduler_lease = lease
 
 
 def stop_news_scheduler(app) -> None:
@@ -28,3 +58,8 @@ def stop_news_scheduler(app) -> None:
     if scheduler:
         scheduler.shutdown(wait=False)
         app.state.news_scheduler = None
+    lease = getattr(app.state, 'news_scheduler_lease', None)
+    if lease:
+        lease.release()
+        app.state.news_scheduler_lease = None
+    shutdown_process_pool()
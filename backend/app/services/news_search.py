@@ -0,0 +1,198 @@
+import re
+from functools import lru_cache, reduce
+
+from sqlalchemy import BigInteger, cast, column, func, inspect, literal_column, or_, select, table
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+from app.models.news import NewsArticle
+
+FTS_TABLE = 'news_articles_fts'
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+# What the full-text tokenizers index: letters and digits (``_`` is a separator to both).
+TOKEN_RE = re.compile(r'[^\W_]', re.UNICODE)
+# tsvector relevance is ranked in millionths, see apply_search.
+RANK_SCALE = 1_000_000
+
+SQLITE_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, summary, content='news_articles', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS news_articles_fts_insert AFTER INSERT ON news_articles BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS news_articles_fts_delete AFTER DELETE ON news_articles BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, summary) VALUES ('delete', old.id, old.title, old.summary);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS news_articles_fts_update AFTER UPDATE OF title, summary ON news_articles BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, summary) VALUES ('delete', old.id, old.title, old.summary);
+        INSERT INTO {FTS_TABLE}(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+    END
+    """,
+)
+
+POSTGRES_DDL = (
+    """
+    ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(summary, '')), 'B')
+    ) STORED
+    """,
+    'CREATE INDEX IF NOT EXISTS ix_news_articles_search_vector ON news_articles USING GIN (search_vector)',
+)
+
+_backends: dict[str, str | None] = {}
+
+
+def ensure_search_index(engine: Engine) -> str | None:
+    """Create the full-text index for ``news_articles`` if the database supports one.
+
+    SQLite gets an external-content FTS5 table kept in sync by triggers, PostgreSQL a
+    generated ``tsvector`` column with a GIN index, so every writer (the pipeline's bulk
+    upserts included) updates the index without extra application code. Returns the
+    backend name, or None when searches must fall back to ILIKE.
+    """
+    dialect = engine.dialect.name
+    backend = None
+    with engine.begin() as connection:
+        if dialect == 'sqlite':
+            created = FTS_TABLE not in inspect(connection).get_table_names()
+            try:
+                for ddl in SQLITE_DDL:
+                    connection.exec_driver_sql(ddl)
+            except OperationalError:
+                # SQLite built without FTS5.
+                backend = None
+            else:
+                if created:
+                    connection.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+                backend = 'fts5'
+        elif dialect == 'postgresql':
+            for ddl in POSTGRES_DDL:
+                connection.exec_driver_sql(ddl)
+            backend = 'tsvector'
+    _backends[str(engine.url)] = backend
+    return backend
+
+
+def _engine_backend(engine: Engine) -> str | None:
+    key = str(engine.url)
+    if key not in _backends:
+        ensure_search_index(engine)
+    return _backends[key]
+
+
+def _search_backend(query) -> str | None:
+    return _engine_backend(query.session.get_bind())
+
+
+def _fts5_query(text: str) -> str:
+    # Quote every word so user input can never be parsed as FTS5 syntax.
+    return ' '.join(f'"{word}"' for word in WORD_RE.findall(text))
+
+
+@lru_cache(maxsize=4096)
+def compile_blocklist(keywords: tuple[str, ...]) -> str:
+    """Compile blocked keywords into one FTS5 expression matching any of them as a phrase."""
+    phrases = [' '.join(WORD_RE.findall(keyword)) for keyword in keywords]
+    return ' OR '.join(f'"{phrase}"' for phrase in dict.fromkeys(phrases) if phrase)
+
+
+def _substring_clause(keywords: list[str]):
+    return or_(
+        *(
+            or_(
+                NewsArticle.title.icontains(keyword, autoescape=True),
+                NewsArticle.summary.icontains(keyword, autoescape=True),
+            )
+            for keyword in keywords
+        )
+    )
+
+
+def blocked_clause(engine: Engine, keywords: list[str]):
+    """Predicate on news_articles that is true when the title or summary contains any keyword.
+
+    With a full-text index the whole list becomes a single index lookup (a rowid
+    subquery on FTS5, one ``@@`` on PostgreSQL), matched against the tokens stored at
+    ingest, so its cost does not grow with one scan per keyword. Without one it falls
+    back to a substring match per keyword, as do keywords with no letters or digits
+    (``"!!!"``, ``"_"``, emoji), which the tokenizers drop. Returns None when there is
+    nothing to block.
+    """
+    keywords = sorted({keyword.strip().lower() for keyword in keywords if keyword.strip()})
+    if not keywords:
+        return None
+    backend = _engine_backend(engine)
+    if backend not in ('fts5', 'tsvector'):
+        return _substring_clause(keywords)
+
+    words = [keyword for keyword in keywords if TOKEN_RE.search(keyword)]
+    symbols = [keyword for keyword in keywords if not TOKEN_RE.search(keyword)]
+    clauses = []
+    if words and backend == 'fts5':
+        fts = table(FTS_TABLE, column('rowid'))
+        match = compile_blocklist(tuple(words))
+        clauses.append(NewsArticle.id.in_(select(fts.c.rowid).where(literal_column(FTS_TABLE).match(match))))
+    elif words:
+        vector = literal_column('news_articles.search_vector')
+        ts_query = reduce(
+            lambda left, right: left.op('||')(right),
+            (func.phraseto_tsquery('english', keyword) for keyword in words),
+        )
+        clauses.append(vector.op('@@')(ts_query))
+    if symbols:
+        clauses.append(_substring_clause(symbols))
+    return or_(*clauses)
+
+
+def apply_search(query, text: str):
+    """Restrict an article query to matches for ``text``.
+
+    Returns the query and a relevance expression (higher is better), or None for the
+    expression when the ILIKE fallback is in use and no ranking is available.
+    """
+    backend = _search_backend(query)
+
+    if backend == 'fts5':
+        match = _fts5_query(text)
+        if match:
+            fts = table(FTS_TABLE, column('rowid'))
+            fts_column = literal_column(FTS_TABLE)
+            matches = (
+                fts.select()
+                .with_only_columns(
+                    fts.c.rowid.label('article_id'),
+                    # bm25 is lower for better matches; titles weigh twice the summary.
+                    (-func.bm25(fts_column, 2.0, 1.0)).label('relevance'),
+                )
+                .where(fts_column.match(match))
+                .subquery()
+            )
+            query = query.join(matches, matches.c.article_id == NewsArticle.id)
+            return query, matches.c.relevance
+
+    if backend == 'tsvector':
+        vector = literal_column('news_articles.search_vector')
+        ts_query = func.websearch_to_tsquery('english', text)
+        query = query.filter(vector.op('@@')(ts_query))
+        # ts_rank_cd is a float4; a float round-tripped through a JSON cursor can compare
+        # unequal to the value it came from and repeat or skip rows at page boundaries.
+        # Ranking on a fixed-point integer keeps ORDER BY and the cursor seek exact.
+        return query, cast(func.ts_rank_cd(vector, ts_query) * RANK_SCALE, BigInteger)
+
+    query = query.filter(
+        or_(
+            NewsArticle.title.ilike(f'%{text}%'),
+            NewsArticle.summary.ilike(f'%{text}%'),
+        )
+    )
+    return query, None
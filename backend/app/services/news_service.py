@@ -1,39 +1,46 @@
+import base64
+import binascii
+import json
 from datetime import datetime
+from functools import lru_cache
 from typing import List
 
-from sqlalchemy import case, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, func, select, tuple_
+from sqlalchemy.orm import Session, defer
 
+from app.api.deps import Principal
+from app.core.config import settings
 from app.models.news import (
     NewsArticle,
+    NewsArticleTag,
     NewsSource,
+    UserFeedEntry,
     UserHiddenArticle,
     UserNewsPreference,
     UserSavedArticle,
 )
-from app.models.user import User
+from app.pipeline.feed_fanout import materialize_feed, note_feed_activity
+from app.pipeline.seen_filter import seen_filter_stats
+from app.pipeline.tags import sync_preference_topics, tag_ids
 from app.schemas.news import (
     FetchNowResponse,
+    NewsArticleListItem,
     NewsArticleOut,
     NewsFeedResponse,
     NewsSourceCreate,
+    NewsSourceFetchStatsOut,
     NewsSourceOut,
     NewsSourceUpdate,
     NewsStatusOut,
     PreferencesIn,
     PreferencesOut,
 )
-
-
-# TODO: Replace stub data with pipeline + vector store integration.
-NEWS_STATUS = {
-    'last_run': None,
-    'sources_checked': 0,
-    'sources_success': 0,
-    'sources_failed': 0,
-    'items_ingested': 0,
-    'last_error': None,
-}
+from app.services.news_cache import bump_news_version, estimated_count, feed_cache, news_version
+from app.services.news_fetcher import fetch_news_now
+from app.services.news_interactions import InteractionState, get_interactions, update_interactions
+from app.services.news_preferences import PreferenceSnapshot, forget_preferences, load_preferences
+from app.services.news_search import apply_search, blocked_clause
+from app.services.news_telemetry import latest_run, source_fetch_stats
 
 
 def _split_csv(value: str | None) -> List[str]:
@@ -60,7 +67,12 @@ def _parse_date(value: str | None) -> datetime | None:
         return None
 
 
-def _get_or_create_preferences(db: Session, user: User) -> UserNewsPreference:
+def _get_or_create_preferences(db: Session, user: Principal) -> UserNewsPreference:
+    """Load the user's preference row for a write, creating it with the defaults first.
+
+    Only write paths call this; reads use the cached snapshot and never create rows.
+    The caller commits and then calls ``forget_preferences``.
+    """
     pref = db.get(UserNewsPreference, user.id)
     if pref:
         return pref
@@ -71,13 +83,38 @@ def _get_or_create_preferences(db: Session, user: User) -> UserNewsPreference:
         level='beginner',
         equipment='gym',
         blocked_keywords='',
+        feed_version=0,
+        feed_truncated=False,
     )
     db.add(pref)
-    db.commit()
-    db.refresh(pref)
+    db.flush()
     return pref
 
 
+def _bump_feed_version(db: Session, user: Principal) -> int:
+    """Retire the user's cached feed pages; call before committing the change.
+
+    The increment runs in SQL, so concurrent writers on other workers each get their
+    own version instead of overwriting one another's. Returns the new version, for
+    writing the change through to the interaction cache.
+    """
+    pref = _get_or_create_preferences(db, user)
+    pref.feed_version = UserNewsPreference.feed_version + 1
+    db.flush()
+    return pref.feed_version
+
+
+def _exclude_hidden(query, user: Principal, interactions: InteractionState):
+    if not interactions.hidden:
+        return query
+    if len(interactions.hidden) <= settings.NEWS_HIDDEN_INLINE_LIMIT:
+        return query.filter(NewsArticle.id.not_in(list(interactions.hidden)))
+    # Past the inline limit, probe the (user_id, article_id) unique index per candidate row.
+    return query.filter(
+        ~exists().where(UserHiddenArticle.user_id == user.id, UserHiddenArticle.article_id == NewsArticle.id)
+    )
+
+
 def _serialize_source(source: NewsSource) -> NewsSourceOut:
     return NewsSourceOut(
         id=source.id,
@@ -108,6 +145,42 @@ def _serialize_article(article: NewsArticle, saved: bool) -> NewsArticleOut:
     )
 
 
+@lru_cache(maxsize=4096)
+def _parsed_tags(value: str | None) -> tuple[str, ...]:
+    # Tag strings repeat across a page (source defaults, common topics), so split each once.
+    return tuple(_split_csv(value))
+
+
+def _serialize_articles(db: Session, articles: List[NewsArticle], saved_ids: set[int]) -> List[NewsArticleListItem]:
+    """List-view serializer: one query for all sources and no per-item validation.
+
+    Each distinct source is serialized once and shared by its articles, and items are
+    built with ``model_construct`` since every value already comes from typed columns.
+    FastAPI passes model instances of the response type through without revalidating.
+    """
+    sources = {}
+    source_ids = {article.source_id for article in articles}
+    if source_ids:
+        rows = db.query(NewsSource).filter(NewsSource.id.in_(source_ids)).all()
+        sources = {source.id: _serialize_source(source) for source in rows}
+    return [
+        NewsArticleListItem.model_construct(
+            id=article.id,
+            title=article.title,
+            link=article.link,
+            guid=article.guid,
+            published_at=article.published_at,
+            author=article.author,
+            summary=article.summary,
+            image_url=article.image_url,
+            tags=list(_parsed_tags(article.tags)),
+            source=sources[article.source_id],
+            saved=article.id in saved_ids,
+        )
+        for article in articles
+    ]
+
+
 def list_enabled_sources(db: Session) -> List[NewsSourceOut]:
     sources = db.query(NewsSource).filter(NewsSource.enabled.is_(True)).order_by(NewsSource.name).all()
     return [_serialize_source(source) for source in sources]
@@ -118,36 +191,49 @@ def list_all_sources(db: Session) -> List[NewsSourceOut]:
     return [_serialize_source(source) for source in sources]
 
 
-def get_preferences(db: Session, user: User) -> PreferencesOut:
-    pref = _get_or_create_preferences(db, user)
+def _preferences_out(pref: PreferenceSnapshot) -> PreferencesOut:
     return PreferencesOut(
-        topics=_split_csv(pref.topics),
+        topics=list(pref.topics),
         level=pref.level,
         equipment=pref.equipment,
-        blocked_keywords=_split_csv(pref.blocked_keywords),
+        blocked_keywords=list(pref.blocked_keywords),
     )
 
 
-def update_preferences(db: Session, user: User, payload: PreferencesIn) -> PreferencesOut:
+def get_preferences(db: Session, user: Principal) -> PreferencesOut:
+    return _preferences_out(load_preferences(db, user.id))
+
+
+def update_preferences(db: Session, user: Principal, payload: PreferencesIn) -> PreferencesOut:
     pref = _get_or_create_preferences(db, user)
     pref.topics = _list_to_csv(payload.topics)
     pref.level = payload.level
     pref.equipment = payload.equipment
     pref.blocked_keywords = _list_to_csv(payload.blocked_keywords)
     pref.updated_at = datetime.utcnow()
+    _bump_feed_version(db, user)
+    sync_preference_topics(db, user.id, pref.topics)
+    if pref.feed_materialized_at is not None:
+        materialize_feed(db, pref)
     db.commit()
-    db.refresh(pref)
-    return PreferencesOut(
-        topics=_split_csv(pref.topics),
-        level=pref.level,
-        equipment=pref.equipment,
-        blocked_keywords=_split_csv(pref.blocked_keywords),
-    )
+    forget_preferences(user.id)
+    snapshot = load_preferences(db, user.id)
+    update_interactions(user.id, snapshot.feed_version)
+    return _preferences_out(snapshot)
+
+
+def _topic_tag_ids(db: Session, topics: List[str]) -> List[int]:
+    return list(tag_ids(db, topics).values())
+
+
+def _list_query(db: Session):
+    # List views never show the body; only /news/articles/{id} loads it.
+    return db.query(NewsArticle).options(defer(NewsArticle.content))
 
 
 def _apply_article_filters(
     query,
-    topic_filters: List[str],
+    topic_ids: List[int] | None,
     source_filter: str | None,
     search_query: str | None,
     from_date: datetime | None,
@@ -160,13 +246,9 @@ def _apply_article_filters(
         except ValueError:
             query = query.filter(NewsSource.name.ilike(f'%{source_filter}%'))
 
+    relevance = None
     if search_query:
-        query = query.filter(
-            or_(
-                NewsArticle.title.ilike(f'%{search_query}%'),
-                NewsArticle.summary.ilike(f'%{search_query}%'),
-            )
-        )
+        query, relevance = apply_search(query, search_query)
 
     if from_date:
         query = query.filter(NewsArticle.published_at >= from_date)
@@ -174,33 +256,87 @@ def _apply_article_filters(
     if to_date:
         query = query.filter(NewsArticle.published_at <= to_date)
 
-    if topic_filters:
-        topic_conditions = [NewsArticle.tags.ilike(f'%{topic}%') for topic in topic_filters]
-        query = query.filter(or_(*topic_conditions))
+    if topic_ids is not None:
+        tagged = select(NewsArticleTag.article_id).where(NewsArticleTag.tag_id.in_(topic_ids))
+        query = query.filter(NewsArticle.id.in_(tagged))
 
-    return query
+    return query, relevance
 
 
 def _apply_blocked_keywords(query, blocked_keywords: List[str]):
-    for keyword in blocked_keywords:
-        query = query.filter(
-            ~or_(
-                NewsArticle.title.ilike(f'%{keyword}%'),
-                NewsArticle.summary.ilike(f'%{keyword}%'),
-            )
-        )
+    blocked = blocked_clause(query.session.get_bind(), blocked_keywords)
+    if blocked is not None:
+        query = query.filter(~blocked)
     return query
 
 
-def _paginate(query, page: int, page_size: int):
-    total = query.count()
-    items = query.offset((page - 1) * page_size).limit(page_size).all()
-    return total, items
+def _encode_cursor(values) -> str:
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor: str, size: int) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError('Invalid cursor') from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError('Invalid cursor')
+    # Strings only ever come from published_at; scores and ids are numbers.
+    try:
+        return [datetime.fromisoformat(value) if isinstance(value, str) else value for value in values]
+    except ValueError as exc:
+        raise ValueError('Invalid cursor') from exc
+
+
+def _paginate(
+    query,
+    sort_keys: list,
+    page: int,
+    page_size: int,
+    cursor: str | None = None,
+    total_mode: str | None = None,
+    tiebreaker=NewsArticle.id,
+    count_query=None,
+):
+    """Return ``(total, items, next_cursor)`` for ``query`` ordered by ``sort_keys`` descending.
+
+    ``tiebreaker`` (the article id) is appended to the keys, and the cursor encodes the sort key
+    values of the last item. With a cursor the next page is a keyset seek on
+    ``(keys...) < (values...)``, which stays constant-time however deep the client
+    scrolls; without one the old page/offset behaviour is kept, plus a cursor for the
+    page after it. One extra row is fetched so ``next_cursor`` doubles as "has more".
+
+    ``total_mode`` is ``exact`` (count every time), ``estimated`` (count once per filter
+    signature until the article set changes or the TTL passes) or ``none`` (total is
+    None). It defaults to ``exact`` for page requests and ``none`` for cursor requests.
+    Totals come from ``count_query`` when given, otherwise from ``query``.
+    """
+    total_mode = total_mode or ('none' if cursor else 'exact')
+    count_query = count_query if count_query is not None else query
+    total = None
+    if total_mode == 'exact':
+        total = count_query.count()
+    elif total_mode == 'estimated':
+        total = estimated_count(count_query.session, count_query)
+
+    keys = [*sort_keys, tiebreaker]
+    offset = 0
+    if cursor:
+        values = _decode_cursor(cursor, len(keys))
+        query = query.filter(tuple_(*keys) < tuple(values))
+    else:
+        offset = (page - 1) * page_size
+
+    query = query.add_columns(*keys).order_by(*(key.desc() for key in keys))
+    rows = query.offset(offset).limit(page_size + 1).all()
+    next_cursor = _encode_cursor(tuple(rows[page_size - 1])[1:]) if len(rows) > page_size else None
+    return total, [row[0] for row in rows[:page_size]], next_cursor
 
 
 def get_feed(
     db: Session,
-    user: User,
+    user: Principal,
     topic: str | None,
     source: str | None,
     q: str | None,
@@ -208,55 +344,111 @@ def get_feed(
     to_date: str | None,
     page: int,
     page_size: int,
+    sort: str = 'recent',
+    cursor: str | None = None,
+    total_mode: str | None = None,
 ) -> NewsFeedResponse:
-    pref = _get_or_create_preferences(db, user)
-    pref_topics = _split_csv(pref.topics)
-    topic_filters = _split_csv(topic) if topic else pref_topics
-    blocked_keywords = _split_csv(pref.blocked_keywords)
-
-    query = db.query(NewsArticle).join(NewsSource).filter(NewsSource.enabled.is_(True))
-    query = _apply_article_filters(query, topic_filters, source, q, _parse_date(from_date), _parse_date(to_date))
-    query = _apply_blocked_keywords(query, blocked_keywords)
+    pref = load_preferences(db, user.id)
+    note_feed_activity(user.id)
+    topic_filters = _split_csv(topic)
+    page = max(1, page)
+    page_size = min(max(1, page_size), 50)
 
-    hidden_subquery = (
-        db.query(UserHiddenArticle.article_id)
-        .filter(UserHiddenArticle.user_id == user.id)
-        .subquery()
+    # The preference version changes with this user's preferences, saves and hides; the
+    # news version with ingest and source changes. Either retires the cached pages. The
+    # version comes from the preference snapshot, so a change made on another worker
+    # retires this worker's pages only once its snapshot expires, after at most
+    # NEWS_PREFERENCES_CACHE_TTL_SECONDS.
+    cache_key = (
+        'feed',
+        user.id,
+        pref.feed_version,
+        news_version(db),
+        tuple(sorted(topic_filters)),
+        (source or '').strip(),
+        (q or '').strip(),
+        _parse_date(from_date),
+        _parse_date(to_date),
+        page,
+        page_size,
+        sort,
+        cursor,
+        total_mode,
     )
-    query = query.filter(~NewsArticle.id.in_(hidden_subquery))
-
-    if topic_filters:
-        score = None
-        for item in topic_filters:
-            condition = case((NewsArticle.tags.ilike(f'%{item}%'), 1), else_=0)
-            score = condition if score is None else score + condition
-        query = query.order_by(score.desc(), NewsArticle.published_at.desc())
+    cached = feed_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    topic_ids = _topic_tag_ids(db, topic_filters) if topic_filters else list(pref.topic_ids)
+    blocked_keywords = list(pref.blocked_keywords)
+
+    query = _list_query(db).join(NewsSource).filter(NewsSource.enabled.is_(True))
+    # Topics are matched by the score join below rather than a separate filter.
+    query, relevance = _apply_article_filters(query, None, source, q, _parse_date(from_date), _parse_date(to_date))
+    query = _apply_blocked_keywords(query, blocked_keywords)
+    interactions = get_interactions(db, user.id, pref.feed_version)
+    query = _exclude_hidden(query, user, interactions)
+
+    if topic_filters or topic_ids:
+        # Inner join: articles with no matching tag drop out, the rest rank by match count.
+        scores = (
+            select(NewsArticleTag.article_id, func.count().label('score'))
+            .where(NewsArticleTag.tag_id.in_(topic_ids))
+            .group_by(NewsArticleTag.article_id)
+            .subquery()
+        )
+        query = query.join(scores, scores.c.article_id == NewsArticle.id)
+        sort_keys = [scores.c.score, NewsArticle.published_at]
     else:
-        query = query.order_by(NewsArticle.published_at.desc())
+        sort_keys = [NewsArticle.published_at]
+    if sort == 'relevance' and relevance is not None:
+        sort_keys.insert(0, relevance)
+
+    page_result = None
+    unfiltered = not (topic_filters or (source or '').strip() or (q or '').strip() or from_date or to_date)
+    if settings.NEWS_FEED_MATERIALIZED_ENABLED and pref.feed_materialized_at is not None and unfiltered and topic_ids:
+        # Active users' feeds are ranked at ingest: the page is a range scan of their
+        # entries, with the same sort keys (and so the same cursors) as the query above.
+        feed_query = (
+            _list_query(db)
+            .join(UserFeedEntry, UserFeedEntry.article_id == NewsArticle.id)
+            .join(NewsSource, NewsSource.id == NewsArticle.source_id)
+            .filter(UserFeedEntry.user_id == user.id, NewsSource.enabled.is_(True))
+        )
+        page_result = _paginate(
+            feed_query,
+            [UserFeedEntry.score, UserFeedEntry.published_at],
+            page,
+            page_size,
+            cursor,
+            total_mode,
+            tiebreaker=UserFeedEntry.article_id,
+            count_query=query if pref.feed_truncated else feed_query,
+        )
+        if page_result[2] is None and pref.feed_truncated:
+            # Past the end of a truncated feed: the rest only exists in the full ranking.
+            page_result = None
+    if page_result is None:
+        page_result = _paginate(query, sort_keys, page, page_size, cursor, total_mode)
+    total, items, next_cursor = page_result
 
-    page = max(1, page)
-    page_size = min(max(1, page_size), 50)
-    total, items = _paginate(query, page, page_size)
-
-    article_ids = [article.id for article in items]
-    saved_ids = set(
-        row[0]
-        for row in db.query(UserSavedArticle.article_id)
-        .filter(UserSavedArticle.user_id == user.id, UserSavedArticle.article_id.in_(article_ids))
-        .all()
-    )
+    saved_ids = interactions.saved_ids(article.id for article in items)
 
-    return NewsFeedResponse(
-        items=[_serialize_article(article, article.id in saved_ids) for article in items],
+    response = NewsFeedResponse(
+        items=_serialize_articles(db, items, saved_ids),
         page=page,
         page_size=page_size,
         total=total,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None,
     )
+    feed_cache.set(cache_key, response)
+    return response
 
 
 def get_explore(
     db: Session,
-    user: User,
+    user: Principal,
     topic: str | None,
     source: str | None,
     q: str | None,
@@ -264,80 +456,76 @@ def get_explore(
     to_date: str | None,
     page: int,
     page_size: int,
+    sort: str = 'recent',
+    cursor: str | None = None,
+    total_mode: str | None = None,
 ) -> NewsFeedResponse:
-    query = db.query(NewsArticle).join(NewsSource).filter(NewsSource.enabled.is_(True))
+    query = _list_query(db).join(NewsSource).filter(NewsSource.enabled.is_(True))
     topic_filters = _split_csv(topic)
-    query = _apply_article_filters(query, topic_filters, source, q, _parse_date(from_date), _parse_date(to_date))
-
-    hidden_subquery = (
-        db.query(UserHiddenArticle.article_id)
-        .filter(UserHiddenArticle.user_id == user.id)
-        .subquery()
-    )
-    query = query.filter(~NewsArticle.id.in_(hidden_subquery))
+    topic_ids = _topic_tag_ids(db, topic_filters) if topic_filters else None
+    query, relevance = _apply_article_filters(query, topic_ids, source, q, _parse_date(from_date), _parse_date(to_date))
+    interactions = get_interactions(db, user.id, load_preferences(db, user.id).feed_version)
+    query = _exclude_hidden(query, user, interactions)
 
-    query = query.order_by(NewsArticle.published_at.desc())
+    sort_keys = [NewsArticle.published_at]
+    if sort == 'relevance' and relevance is not None:
+        sort_keys.insert(0, relevance)
 
     page = max(1, page)
     page_size = min(max(1, page_size), 50)
-    total, items = _paginate(query, page, page_size)
-
-    article_ids = [article.id for article in items]
-    saved_ids = set(
-        row[0]
-        for row in db.query(UserSavedArticle.article_id)
-        .filter(UserSavedArticle.user_id == user.id, UserSavedArticle.article_id.in_(article_ids))
-        .all()
-    )
+    total, items, next_cursor = _paginate(query, sort_keys, page, page_size, cursor, total_mode)
+
+    saved_ids = interactions.saved_ids(article.id for article in items)
 
     return NewsFeedResponse(
-        items=[_serialize_article(article, article.id in saved_ids) for article in items],
+        items=_serialize_articles(db, items, saved_ids),
         page=page,
         page_size=page_size,
         total=total,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None,
     )
 
 
-def get_saved(db: Session, user: User, page: int, page_size: int) -> NewsFeedResponse:
+def get_saved(
+    db: Session,
+    user: Principal,
+    page: int,
+    page_size: int,
+    cursor: str | None = None,
+    total_mode: str | None = None,
+) -> NewsFeedResponse:
     page = max(1, page)
     page_size = min(max(1, page_size), 50)
 
-    saved_subquery = (
-        db.query(UserSavedArticle.article_id)
-        .filter(UserSavedArticle.user_id == user.id)
-        .subquery()
-    )
+    saved_ids = select(UserSavedArticle.article_id).where(UserSavedArticle.user_id == user.id)
     query = (
-        db.query(NewsArticle)
+        _list_query(db)
         .join(NewsSource)
-        .filter(NewsArticle.id.in_(saved_subquery), NewsSource.enabled.is_(True))
-        .order_by(NewsArticle.published_at.desc())
+        .filter(NewsArticle.id.in_(saved_ids), NewsSource.enabled.is_(True))
     )
 
-    total, items = _paginate(query, page, page_size)
+    total, items, next_cursor = _paginate(query, [NewsArticle.published_at], page, page_size, cursor, total_mode)
     return NewsFeedResponse(
-        items=[_serialize_article(article, True) for article in items],
+        items=_serialize_articles(db, items, {article.id for article in items}),
         page=page,
         page_size=page_size,
         total=total,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None,
     )
 
 
-def get_article(db: Session, user: User, article_id: int) -> NewsArticleOut:
+def get_article(db: Session, user: Principal, article_id: int) -> NewsArticleOut:
     article = db.get(NewsArticle, article_id)
     if not article:
         raise ValueError('Article not found')
 
-    saved = (
-        db.query(UserSavedArticle)
-        .filter(UserSavedArticle.user_id == user.id, UserSavedArticle.article_id == article_id)
-        .first()
-        is not None
-    )
-    return _serialize_article(article, saved)
+    interactions = get_interactions(db, user.id, load_preferences(db, user.id).feed_version)
+    return _serialize_article(article, interactions.is_saved(article_id))
 
 
-def save_article(db: Session, user: User, article_id: int) -> dict:
+def save_article(db: Session, user: Principal, article_id: int) -> dict:
     article = db.get(NewsArticle, article_id)
     if not article:
         raise ValueError('Article not found')
@@ -351,11 +539,14 @@ def save_article(db: Session, user: User, article_id: int) -> dict:
         return {'status': 'already_saved'}
 
     db.add(UserSavedArticle(user_id=user.id, article_id=article_id))
+    version = _bump_feed_version(db, user)
     db.commit()
+    forget_preferences(user.id)
+    update_interactions(user.id, version, saved=[article_id])
     return {'status': 'saved'}
 
 
-def unsave_article(db: Session, user: User, article_id: int) -> dict:
+def unsave_article(db: Session, user: Principal, article_id: int) -> dict:
     saved = (
         db.query(UserSavedArticle)
         .filter(UserSavedArticle.user_id == user.id, UserSavedArticle.article_id == article_id)
@@ -364,11 +555,14 @@ def unsave_article(db: Session, user: User, article_id: int) -> dict:
     if not saved:
         return {'status': 'not_saved'}
     db.delete(saved)
+    version = _bump_feed_version(db, user)
     db.commit()
+    forget_preferences(user.id)
+    update_interactions(user.id, version, unsaved=[article_id])
     return {'status': 'deleted'}
 
 
-def hide_article(db: Session, user: User, article_id: int) -> dict:
+def hide_article(db: Session, user: Principal, article_id: int) -> dict:
     article = db.get(NewsArticle, article_id)
     if not article:
         raise ValueError('Article not found')
@@ -389,7 +583,13 @@ def hide_article(db: Session, user: User, article_id: int) -> dict:
     )
     if saved:
         db.delete(saved)
+    db.query(UserFeedEntry).filter(
+        UserFeedEntry.user_id == user.id, UserFeedEntry.article_id == article_id
+    ).delete(synchronize_session=False)
+    version = _bump_feed_version(db, user)
     db.commit()
+    forget_preferences(user.id)
+    update_interactions(user.id, version, unsaved=[article_id], hidden=[article_id])
     return {'status': 'hidden'}
 
 
@@ -435,6 +635,7 @@ def admin_update_source(db: Session, source_id: int, payload: NewsSourceUpdate)
         source.enabled = payload.enabled
 
     db.commit()
+    bump_news_version()
     db.refresh(source)
     return _serialize_source(source)
 
@@ -445,6 +646,7 @@ def admin_toggle_source(db: Session, source_id: int) -> NewsSourceOut:
         raise ValueError('Source not found')
     source.enabled = not source.enabled
     db.commit()
+    bump_news_version()
     db.refresh(source)
     return _serialize_source(source)
 
@@ -455,51 +657,55 @@ def admin_delete_source(db: Session, source_id: int) -> None:
         raise ValueError('Source not found')
     db.delete(source)
     db.commit()
+    bump_news_version()
 
 
 def admin_fetch_now(db: Session) -> FetchNowResponse:
-    sources_enabled = db.query(NewsSource).filter(NewsSource.enabled.is_(True)).count()
-    now = datetime.utcnow()
+    result = fetch_news_now(db)
+    return FetchNowResponse(
+        fetched_at=result['fetched_at'],
+        sources_checked=result['sources_checked'],
+        sources_success=result['sources_success'],
+        sources_failed=result['sources_failed'],
+        sources_cached=result['sources_cached'],
+        items_ingested=result['articles_new'],
+        last_error=result['last_error'],
+        stages=result['stages'],
+    )
+
 
-    NEWS_STATUS.update(
-        {
-            'last_run': now,
+def admin_status(db: Session) -> NewsStatusOut:
+    run = latest_run(db)
+    if run is None:
+        sources_enabled = db.query(NewsSource).filter(NewsSource.enabled.is_(True)).count()
+        last_run = {
+            'last_run': None,
             'sources_checked': sources_enabled,
             'sources_success': sources_enabled,
             'sources_failed': 0,
+            'sources_cached': 0,
             'items_ingested': 0,
             'last_error': None,
         }
-    )
-
-    db.query(NewsSource).filter(NewsSource.enabled.is_(True)).update(
-        {NewsSource.last_fetched_at: now}
-    )
-    db.commit()
-
-    return FetchNowResponse(
-        fetched_at=now,
-        sources_checked=NEWS_STATUS['sources_checked'],
-        sources_success=NEWS_STATUS['sources_success'],
-        sources_failed=NEWS_STATUS['sources_failed'],
-        items_ingested=NEWS_STATUS['items_ingested'],
-        last_error=NEWS_STATUS['last_error'],
-    )
-
-
-def admin_status(db: Session) -> NewsStatusOut:
-    sources_enabled = db.query(NewsSource).filter(NewsSource.enabled.is_(True)).count()
-    if NEWS_STATUS['last_run'] is None:
-        NEWS_STATUS['sources_checked'] = sources_enabled
-        NEWS_STATUS['sources_success'] = sources_enabled
-        NEWS_STATUS['sources_failed'] = 0
-        NEWS_STATUS['items_ingested'] = 0
+    else:
+        last_run = {
+            'last_run': run.finished_at,
+            'sources_checked': run.sources_checked,
+            'sources_success': run.sources_success,
+            'sources_failed': run.sources_failed,
+            'sources_cached': run.sources_cached,
+            'items_ingested': run.items_ingested,
+            'last_error': run.last_error,
+        }
 
+    source_stats = [NewsSourceFetchStatsOut(**item) for item in source_fetch_stats(db, settings.NEWS_STATUS_WINDOW_HOURS)]
+    seen_stats = seen_filter_stats()
     return NewsStatusOut(
-        last_run=NEWS_STATUS['last_run'],
-        sources_checked=NEWS_STATUS['sources_checked'],
-        sources_success=NEWS_STATUS['sources_success'],
-        sources_failed=NEWS_STATUS['sources_failed'],
-        items_ingested=NEWS_STATUS['items_ingested'],
-        last_error=NEWS_STATUS['last_error'],
+        **last_run,
+        window_hours=settings.NEWS_STATUS_WINDOW_HOURS,
+        source_stats=source_stats,
+        slowest_sources=source_stats[: settings.NEWS_STATUS_SLOWEST_SOURCES],
+        seen_filter_items=seen_stats['items'],
+        seen_filter_false_positive_rate=seen_stats['false_positive_rate'],
+        seen_filter_memory_bytes=seen_stats['memory_bytes'],
     )
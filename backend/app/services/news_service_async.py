@@ -0,0 +1,31 @@
+"""Async entry points for the news routes, used when DATABASE_ASYNC_ENABLED is set.
+
+Each function runs its ``news_service`` counterpart through ``AsyncSession.run_sync``:
+the ORM code is shared, but its queries go through the async driver on the event loop
+instead of occupying a threadpool thread per request.
+"""
+from functools import wraps
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services import news_service
+
+
+def _run_sync(func):
+    @wraps(func)
+    async def wrapper(db: AsyncSession, *args, **kwargs):
+        return await db.run_sync(func, *args, **kwargs)
+
+    return wrapper
+
+
+list_enabled_sources = _run_sync(news_service.list_enabled_sources)
+get_preferences = _run_sync(news_service.get_preferences)
+update_preferences = _run_sync(news_service.update_preferences)
+get_feed = _run_sync(news_service.get_feed)
+get_explore = _run_sync(news_service.get_explore)
+get_saved = _run_sync(news_service.get_saved)
+get_article = _run_sync(news_service.get_article)
+save_article = _run_sync(news_service.save_article)
+unsave_article = _run_sync(news_service.unsave_article)
+hide_article = _run_sync(news_service.hide_article)
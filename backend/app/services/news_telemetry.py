@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.news import NewsFetchLog, NewsFetchRun, NewsSource
+
+
+def record_run(db: Session, trigger: str, summary: dict, results: list[dict], inserted_by_source: dict) -> NewsFetchRun:
+    """Persist one pipeline run and a row per fetched source; the caller commits."""
+    run = NewsFetchRun(
+        trigger=trigger,
+        started_at=summary['started_at'],
+        finished_at=summary['fetched_at'],
+        sources_checked=summary['sources_checked'],
+        sources_success=summary['sources_success'],
+        sources_failed=summary['sources_failed'],
+        sources_cached=summary['sources_cached'],
+        items_ingested=summary['articles_new'],
+        last_error=summary['last_error'],
+    )
+    run.fetches = [
+        NewsFetchLog(
+            source_id=result['source_id'],
+            fetched_at=result['fetched_at'],
+            status_code=result['status_code'],
+            bytes=result.get('bytes', 0),
+            fetch_ms=result['elapsed_ms'],
+            parse_ms=result.get('parse_ms', 0.0),
+            items_seen=result.get('items_seen', 0),
+            items_new=inserted_by_source.get(result['source_id'], 0),
+            not_modified=result['not_modified'],
+            error=result['error'],
+        )
+        for result in results
+    ]
+    db.add(run)
+    return run
+
+
+def prune_fetch_history(db: Session) -> int:
+    """Delete runs older than NEWS_FETCH_LOG_RETENTION_DAYS together with their logs.
+
+    Logs go by ``run_id`` rather than their own timestamp, so a run straddling the
+    cutoff never loses its logs before the run row itself (which the foreign key would
+    reject). Runs from the scheduler tick in its own transaction, keeping a retention
+    failure from rolling back a fetch. The caller commits. Returns the runs deleted.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=settings.NEWS_FETCH_LOG_RETENTION_DAYS)
+    expired = select(NewsFetchRun.id).where(NewsFetchRun.started_at < cutoff)
+    db.execute(delete(NewsFetchLog).where(NewsFetchLog.run_id.in_(expired)))
+    return db.execute(delete(NewsFetchRun).where(NewsFetchRun.started_at < cutoff)).rowcount
+
+
+def latest_run(db: Session) -> NewsFetchRun | None:
+    return db.query(NewsFetchRun).order_by(NewsFetchRun.started_at.desc()).first()
+
+
+def source_fetch_stats(db: Session, hours: int) -> list[dict]:
+    """Per-source fetch aggregates over the last ``hours``, slowest p95 first.
+
+    Reads only the window's rows through the fetched_at index and aggregates them in
+    the database. The percentiles pick the same ranked row as a sorted Python list
+    would: a window function numbers each source's fetches by latency and the outer
+    GROUP BY keeps the rows at ``n * 50 // 100`` and ``n * 95 // 100``.
+    """
+    since = datetime.utcnow() - timedelta(hours=hours)
+    ranked = (
+        select(
+            NewsFetchLog.source_id,
+            NewsFetchLog.fetch_ms,
+            NewsFetchLog.parse_ms,
+            NewsFetchLog.bytes,
+            NewsFetchLog.items_new,
+            NewsFetchLog.not_modified,
+            NewsFetchLog.error,
+            func.row_number()
+            .over(partition_by=NewsFetchLog.source_id, order_by=NewsFetchLog.fetch_ms)
+            .label('position'),
+            func.count().over(partition_by=NewsFetchLog.source_id).label('total'),
+        )
+        .where(NewsFetchLog.fetched_at >= since)
+        .subquery()
+    )
+
+    def percentile(percent: int):
+        # Integer division keeps the rank identical on SQLite and PostgreSQL.
+        return func.max(case((ranked.c.position == ranked.c.total * percent // 100 + 1, ranked.c.fetch_ms)))
+
+    rows = db.execute(
+        select(
+            ranked.c.source_id,
+            NewsSource.name,
+            func.count().label('fetches'),
+            func.count(ranked.c.error).label('failures'),
+            func.sum(case((ranked.c.not_modified.is_(True), 1), else_=0)).label('not_modified'),
+            func.sum(ranked.c.items_new).label('items_new'),
+            func.sum(ranked.c.bytes).label('bytes_total'),
+            percentile(50).label('p50'),
+            percentile(95).label('p95'),
+            func.sum(ranked.c.parse_ms).label('parse_ms_total'),
+        )
+        .join(NewsSource, NewsSource.id == ranked.c.source_id)
+        .group_by(ranked.c.source_id, NewsSource.name)
+        .order_by(percentile(95).desc())
+    )
+
+    return [
+        {
+            'source_id': row.source_id,
+            'source_name': row.name,
+            'fetches': row.fetches,
+            'failures': row.failures,
+            'not_modified': row.not_modified,
+            'items_new': row.items_new,
+            'bytes_total': row.bytes_total,
+            'latency_ms_p50': round(row.p50 or 0.0, 2),
+            'latency_ms_p95': round(row.p95 or 0.0, 2),
+            'parse_ms_total': round(row.parse_ms_total or 0.0, 2),
+        }
+        for row in rows
+    ]
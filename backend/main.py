@@ -2,12 +2,16 @@
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.security import shutdown_hash_pool
 from app.db.init_db import init_db
+from app.services.news_scheduler import start_news_scheduler, stop_news_scheduler
 from app.api.routes.health import router as health_router
 from app.api.routes.auth import router as auth_router
+from app.api.routes.auth_async import router as auth_async_router
 from app.api.routes.users import router as users_router
 from app.api.routes.ai_chat import router as ai_chat_router
 from app.api.routes.news import router as news_router
+from app.api.routes.news_async import router as news_async_router
 from app.api.routes.admin_news import router as admin_news_router
 
 app = FastAPI(title=settings.APP_NAME)
@@ -16,6 +20,14 @@ app = FastAPI(title=settings.APP_NAME)
 @app.on_event('startup')
 def on_startup():
     init_db()
+    if settings.NEWS_PIPELINE_ENABLED:
+        start_news_scheduler(app)
+
+
+@app.on_event('shutdown')
+def on_shutdown():
+    stop_news_scheduler(app)
+    shutdown_hash_pool()
 
 app.add_middleware(
     CORSMiddleware,
@@ -26,8 +38,8 @@ app.add_middleware(
 )
 
 app.include_router(health_router)
-app.include_router(auth_router, prefix='/auth')
+app.include_router(auth_async_router if settings.DATABASE_ASYNC_ENABLED else auth_router, prefix='/auth')
 app.include_router(users_router, prefix='/users')
 app.include_router(ai_chat_router)
-app.include_router(news_router)
+app.include_router(news_async_router if settings.DATABASE_ASYNC_ENABLED else news_router)
 app.include_router(admin_news_router)
@@ -0,0 +1,222 @@
+import os
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Settings are read at import time, so point them at a scratch database and keep the
+# background machinery (scheduler, process pools, data lake) off before importing app.
+_scratch = Path(tempfile.mkdtemp(prefix='gymunity-tests-'))
+os.environ.update(
+    {
+        'DATABASE_URL': f'sqlite:///{_scratch / "test.db"}',
+        'DATABASE_ASYNC_ENABLED': 'false',
+        'JWT_SECRET': 'test-secret',
+        'NEWS_PIPELINE_ENABLED': 'false',
+        'NEWS_PIPELINE_WORKERS': '0',
+        'NEWS_DATA_LAKE_ENABLED': 'false',
+        'NEWS_DATA_LAKE_PATH': str(_scratch / 'lake'),
+        'NEWS_LEADER_LOCK_PATH': str(_scratch / 'leader.lock'),
+        'AUTH_BCRYPT_ROUNDS': '4',
+        'AUTH_HASH_WORKERS': '0',
+    }
+)
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.api.deps import Principal, principal_cache  # noqa: E402
+from app.core.security import token_cache  # noqa: E402
+from app.db.init_db import init_db  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.models.news import NewsSource  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.pipeline.article_store import upsert_articles  # noqa: E402
+from app.services.news_cache import count_cache, feed_cache  # noqa: E402
+from app.services.news_interactions import interaction_cache  # noqa: E402
+from app.services.news_preferences import preferences_cache  # noqa: E402
+from main import app  # noqa: E402
+
+
+@pytest.fixture(scope='session', autouse=True)
+def database():
+    init_db()
+    # The seeded sources point at real publishers; keep scheduled fetches off them.
+    session = SessionLocal()
+    session.query(NewsSource).update({NewsSource.next_fetch_at: datetime(2100, 1, 1)})
+    session.commit()
+    session.close()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cache in (feed_cache, count_cache, interaction_cache, preferences_cache, principal_cache, token_cache):
+        cache.clear()
+    yield
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def user(db) -> Principal:
+    account = User(name='Reader', email=f'{uuid.uuid4().hex}@example.com', password_hash='x', role='user')
+    db.add(account)
+    db.commit()
+    return Principal(account)
+
+
+@pytest.fixture
+def source(db):
+    feed_source = NewsSource(
+        name=f'Test source {uuid.uuid4().hex[:8]}',
+        rss_url=f'http://127.0.0.1/{uuid.uuid4().hex}.xml',
+        category='fitness',
+        tags='strength',
+        enabled=True,
+    )
+    db.add(feed_source)
+    db.commit()
+    yield feed_source
+    # Later tests run due-only fetches; a leftover source would point at a closed server.
+    db.rollback()
+    feed_source.enabled = False
+    db.commit()
+
+
+def rss(items: list[dict]) -> bytes:
+    """An RSS 2.0 document with one <item> per dict (title, link, guid, published_at, summary)."""
+    entries = []
+    for item in items:
+        published = item.get('published_at', datetime(2026, 10, 1)).strftime('%a, %d %b %Y %H:%M:%S GMT')
+        entries.append(
+            '<item>'
+            f"<title>{item['title']}</title>"
+            f"<link>{item.get('link', 'https://example.com/' + item['title'].replace(' ', '-'))}</link>"
+            f"<guid>{item.get('guid', item['title'])}</guid>"
+            f'<pubDate>{published}</pubDate>'
+            f"<description>{item.get('summary', '')}</description>"
+            '</item>'
+        )
+    return f'<?xml version="1.0"?><rss><channel><title>Test</title>{"".join(entries)}</channel></rss>'.encode()
+
+
+class StubFeedServer:
+    """Local HTTP server standing in for RSS publishers.
+
+    ``routes`` maps a path to its body plus optional ``etag``, ``last_modified``,
+    ``status`` and ``delay``; every request's path and headers are kept in ``requests``.
+    Conditional requests matching the route's validators get a 304.
+    """
+
+    def __init__(self):
+        self.routes: dict[str, dict] = {}
+        self.requests: list[tuple[str, dict]] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                route = server.routes.get(self.path)
+                if route is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                time.sleep(route.get('delay', 0))
+                etag, modified = route.get('etag'), route.get('last_modified')
+                if (etag and self.headers.get('If-None-Match') == etag) or (
+                    modified and self.headers.get('If-Modified-Since') == modified
+                ):
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = route['body']
+                self.send_response(route.get('status', 200))
+                self.send_header('Content-Type', 'application/rss+xml')
+                self.send_header('Content-Length', str(len(body)))
+                if etag:
+                    self.send_header('ETag', etag)
+                if modified:
+                    self.send_header('Last-Modified', modified)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def start(self) -> 'StubFeedServer':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def add(self, path: str, body: bytes, **options) -> str:
+        self.routes[path] = {'body': body, **options}
+        return self.url(path)
+
+    def url(self, path: str) -> str:
+        return f'http://127.0.0.1:{self._httpd.server_address[1]}{path}'
+
+    def requests_for(self, path: str) -> list[dict]:
+        return [headers for request_path, headers in self.requests if request_path == path]
+
+
+@pytest.fixture
+def articles(db, source):
+    """Twelve articles in the test source; pairs share a published_at to exercise the id tiebreaker."""
+    start = datetime(2026, 9, 1, 9, 0)
+    records = [
+        {
+            'source_id': source.id,
+            'title': f'Training note {index}',
+            'link': f'https://example.com/notes/{index}',
+            'unique_hash': f'note-{index}',
+            'published_at': start + timedelta(hours=index // 2),
+            'summary': 'Squat programming' if index % 3 == 0 else 'Conditioning',
+        }
+        for index in range(12)
+    ]
+    upsert_articles(db, records)
+    return records
+
+
+@pytest.fixture
+def feed_server():
+    server = StubFeedServer().start()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+@pytest.fixture
+def make_feed():
+    return rss
+
+
+@pytest.fixture
+def recent():
+    """Publication times relative to now, newest first: ``recent(0)``, ``recent(1)``..."""
+    now = datetime.utcnow().replace(microsecond=0)
+    return lambda hours: now - timedelta(hours=hours)
@@ -0,0 +1,78 @@
+from datetime import datetime
+
+from app.models.news import NewsArticle, NewsArticleTag
+from app.pipeline.article_store import upsert_articles
+
+
+def _record(source_id: int, key: str, **fields) -> dict:
+    return {
+        'source_id': source_id,
+        'title': f'Article {key}',
+        'link': f'https://example.com/{key}',
+        'guid': key,
+        'unique_hash': f'hash-{key}',
+        'published_at': datetime(2026, 10, 1, 12, 0),
+        'summary': 'Original summary',
+        'tags': 'strength,mobility',
+        **fields,
+    }
+
+
+def test_counts_inserts_updates_and_unchanged_rows(db, source):
+    first = upsert_articles(db, [_record(source.id, 'a'), _record(source.id, 'b')])
+
+    assert first['inserted'] == 2
+    assert first['updated'] == 0 and first['skipped'] == 0
+    assert first['inserted_by_source'] == {source.id: 2}
+    assert len(first['inserted_ids']) == 2 and first['updated_ids'] == []
+
+    second = upsert_articles(
+        db,
+        [
+            _record(source.id, 'a'),
+            _record(source.id, 'b', summary='Corrected summary'),
+            _record(source.id, 'c'),
+        ],
+    )
+
+    article_b = db.query(NewsArticle).filter(NewsArticle.unique_hash == 'hash-b').one()
+    assert second['inserted'] == 1
+    assert second['updated'] == 1
+    assert second['skipped'] == 1
+    assert second['updated_ids'] == [article_b.id]
+    assert article_b.summary == 'Corrected summary'
+    assert db.query(NewsArticle).filter(NewsArticle.source_id == source.id).count() == 3
+
+
+def test_update_keeps_published_at_and_can_be_disabled(db, source):
+    upsert_articles(db, [_record(source.id, 'a')])
+
+    ignored = upsert_articles(db, [_record(source.id, 'a', title='Retitled')], update=False)
+    assert (ignored['inserted'], ignored['updated'], ignored['skipped']) == (0, 0, 1)
+
+    upsert_articles(db, [_record(source.id, 'a', title='Retitled', published_at=datetime(2026, 10, 9))])
+    article = db.query(NewsArticle).filter(NewsArticle.unique_hash == 'hash-a').one()
+    db.refresh(article)
+    assert article.title == 'Retitled'
+    assert article.published_at == datetime(2026, 10, 1, 12, 0)
+
+
+def test_repeats_within_a_batch_collapse_to_the_last_record(db, source):
+    result = upsert_articles(
+        db,
+        [_record(source.id, 'a', title='Draft'), _record(source.id, 'b'), _record(source.id, 'a', title='Final')],
+        batch_size=2,
+    )
+
+    assert result['inserted'] == 2 and result['skipped'] == 0
+    titles = {article.title for article in db.query(NewsArticle).filter(NewsArticle.source_id == source.id)}
+    assert titles == {'Final', 'Article b'}
+
+
+def test_tag_links_follow_the_tags_column(db, source):
+    result = upsert_articles(db, [_record(source.id, 'a')])
+    article_id = result['inserted_ids'][0]
+    assert db.query(NewsArticleTag).filter(NewsArticleTag.article_id == article_id).count() == 2
+
+    upsert_articles(db, [_record(source.id, 'a', tags='strength')])
+    assert db.query(NewsArticleTag).filter(NewsArticleTag.article_id == article_id).count() == 1
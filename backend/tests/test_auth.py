@@ -0,0 +1,169 @@
+import hashlib
+import os
+import time
+import uuid
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from app.api.deps import principal_cache
+from app.core import security
+from app.core.config import settings
+from app.core.security import (
+    create_access_token,
+    hash_metrics,
+    pwd_context,
+    run_hash_job,
+    shutdown_hash_pool,
+    token_cache,
+    verify_token,
+)
+from app.db.session import SessionLocal
+from app.models.user import User
+
+PASSWORD = 'correct horse'
+
+
+def _email() -> str:
+    return f'{uuid.uuid4().hex}@example.com'
+
+
+def _register(client, email: str, **fields):
+    return client.post('/auth/register', json={'name': 'Lifter', 'email': email, 'password': PASSWORD, **fields})
+
+
+def _login(client, email: str, password: str = PASSWORD):
+    return client.post('/auth/login', json={'email': email, 'password': password})
+
+
+def test_register_validates_email_and_role(client):
+    email = _email()
+
+    created = _register(client, email, role='coach')
+    assert created.status_code == 201
+    assert created.json()['role'] == 'coach'
+    assert _register(client, email).status_code == 400
+    assert _register(client, _email(), role='root').status_code == 400
+
+
+def test_login_issues_a_token_for_valid_credentials_only(client):
+    email = _email()
+    _register(client, email)
+
+    assert _login(client, email, 'wrong password').status_code == 401
+    assert _login(client, _email()).status_code == 401
+
+    token = _login(client, email).json()['access_token']
+    me = client.get('/users/me', headers={'Authorization': f'Bearer {token}'})
+    assert me.status_code == 200
+    assert me.json()['email'] == email
+
+    assert client.get('/users/me').status_code == 401
+    assert client.get('/users/me', headers={'Authorization': 'Bearer nonsense'}).status_code == 401
+
+
+def test_login_upgrades_hashes_made_with_other_rounds(client):
+    email = _email()
+    with SessionLocal() as db:
+        db.add(User(name='Old', email=email, password_hash=pwd_context.hash(PASSWORD, rounds=5), role='user'))
+        db.commit()
+
+    assert _login(client, email).status_code == 200
+
+    with SessionLocal() as db:
+        stored = db.query(User).filter(User.email == email).one().password_hash
+    assert stored.startswith(f'$2b${settings.AUTH_BCRYPT_ROUNDS:02d}$')
+    assert pwd_context.verify(PASSWORD, stored)
+
+
+def test_hash_jobs_past_the_queue_limit_are_rejected_with_retry_after(client, monkeypatch):
+    email = _email()
+    _register(client, email)
+    rejected = hash_metrics.rejected
+    monkeypatch.setattr(settings, 'AUTH_HASH_QUEUE_LIMIT', 0)
+
+    response = _login(client, email)
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == str(settings.AUTH_HASH_RETRY_AFTER_SECONDS)
+    assert hash_metrics.rejected == rejected + 1
+    assert hash_metrics.in_flight == 0
+
+
+def _exit_once(marker: str) -> str:
+    # Kills its worker the first time, as an out-of-memory kill would.
+    path = Path(marker)
+    if not path.exists():
+        path.touch()
+        os._exit(1)
+    return 'hashed'
+
+
+def _always_exit() -> None:
+    os._exit(1)
+
+
+@pytest.fixture
+def hash_pool(monkeypatch):
+    monkeypatch.setattr(settings, 'AUTH_HASH_WORKERS', 1)
+    yield
+    shutdown_hash_pool()
+
+
+def test_a_broken_hash_pool_is_replaced_and_the_job_retried(hash_pool, tmp_path):
+    completed, failed = hash_metrics.completed, hash_metrics.failed
+
+    assert run_hash_job(_exit_once, str(tmp_path / 'exited')) == 'hashed'
+    assert (hash_metrics.completed, hash_metrics.failed) == (completed + 1, failed)
+
+
+def test_a_job_that_breaks_the_retry_pool_too_is_counted_as_failed(hash_pool):
+    completed, failed = hash_metrics.completed, hash_metrics.failed
+
+    with pytest.raises(BrokenProcessPool):
+        run_hash_job(_always_exit)
+
+    assert (hash_metrics.completed, hash_metrics.failed) == (completed, failed + 1)
+    assert security._hash_pool is None
+    assert hash_metrics.in_flight == 0
+
+
+def _token(client, **fields) -> tuple[int, str]:
+    email = _email()
+    user_id = _register(client, email, **fields).json()['id']
+    return user_id, _login(client, email).json()['access_token']
+
+
+def test_principal_is_cached_and_dropped_when_the_user_row_changes(client):
+    user_id, token = _token(client)
+    headers = {'Authorization': f'Bearer {token}'}
+
+    assert client.get('/users/me', headers=headers).json()['role'] == 'user'
+    assert principal_cache.get(user_id).role == 'user'
+
+    with SessionLocal() as db:
+        db.get(User, user_id).role = 'coach'
+        db.commit()
+    assert principal_cache.get(user_id) is None
+    assert client.get('/users/me', headers=headers).json()['role'] == 'coach'
+
+    with SessionLocal() as db:
+        db.delete(db.get(User, user_id))
+        db.commit()
+    assert client.get('/users/me', headers=headers).status_code == 401
+
+
+def test_cached_token_payloads_still_expire(client):
+    user_id, token = _token(client)
+    payload = verify_token(token)
+    assert verify_token(token) is payload
+
+    expired = create_access_token({'sub': str(user_id)}, expires_minutes=-1)
+    with pytest.raises(ValueError):
+        verify_token(expired)
+
+    # A payload cached just before its expiry is not served after it.
+    token_cache.set(hashlib.sha256(expired.encode('utf-8')).digest(), {'sub': str(user_id), 'exp': time.time() - 1})
+    with pytest.raises(ValueError):
+        verify_token(expired)
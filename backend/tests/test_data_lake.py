@@ -0,0 +1,59 @@
+from datetime import datetime, time
+
+import pytest
+
+from app.pipeline import replay
+from app.pipeline.data_lake import DataLakeWriter, PayloadFrame, iter_payloads
+
+
+def _record(source_id: int, fetched_at: datetime, content: bytes = b'') -> dict:
+    return {
+        'source_id': source_id,
+        'rss_url': f'https://example.com/{source_id}.xml',
+        'fetched_at': fetched_at,
+        'content': content,
+    }
+
+
+def test_frames_round_trip_across_segments(tmp_path):
+    writer = DataLakeWriter(tmp_path, segment_bytes=64)
+    writer.append(_record(1, datetime(2026, 10, 1, 8), b'<rss>one</rss>'))
+    frame = PayloadFrame(_record(2, datetime(2026, 10, 1, 9)))
+    for chunk in (b'<rss>', b'streamed', b'</rss>'):
+        frame.feed(chunk)
+    writer.append_frame(_record(2, datetime(2026, 10, 1, 9)), frame.finish())
+    writer.append(_record(1, datetime(2026, 10, 3), b'<rss>later</rss>'))
+    writer.close()
+
+    payloads = list(iter_payloads(datetime(2026, 10, 1), datetime(2026, 10, 2), root=tmp_path))
+
+    assert len(list(tmp_path.glob('*.seg'))) > 1
+    assert [(payload['source_id'], payload['content']) for payload in payloads] == [
+        (1, b'<rss>one</rss>'),
+        (2, b'<rss>streamed</rss>'),
+    ]
+    assert payloads[1]['rss_url'] == 'https://example.com/2.xml'
+    only_source_2 = iter_payloads(datetime(2026, 10, 1), datetime(2026, 10, 4), [2], root=tmp_path)
+    assert [payload['source_id'] for payload in only_source_2] == [2]
+
+
+def test_a_date_only_replay_end_includes_that_whole_day():
+    assert replay._end_of('2026-10-08') == datetime.combine(datetime(2026, 10, 8), time.max)
+    assert replay._end_of('2026-10-08T06:30') == datetime(2026, 10, 8, 6, 30)
+
+
+def test_an_empty_source_list_matches_nothing(tmp_path):
+    writer = DataLakeWriter(tmp_path, segment_bytes=1024)
+    writer.append(_record(1, datetime(2026, 10, 1, 8), b'<rss/>'))
+    writer.close()
+
+    assert list(iter_payloads(datetime(2026, 10, 1), datetime(2026, 10, 2), [], root=tmp_path)) == []
+    assert len(list(iter_payloads(datetime(2026, 10, 1), datetime(2026, 10, 2), None, root=tmp_path))) == 1
+
+
+def test_replay_exits_when_no_source_matches(capsys):
+    with pytest.raises(SystemExit) as exited:
+        replay.main(['--from', '2026-10-01', '--source', '999999'])
+
+    assert exited.value.code == 0
+    assert 'nothing to replay' in capsys.readouterr().err
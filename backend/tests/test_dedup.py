@@ -0,0 +1,81 @@
+import random
+
+from app.pipeline.dedup import NearDuplicateIndex, drop_near_duplicates, simhash
+
+# Title and summary, as transform signs them.
+TEXT = (
+    'Progressive overload beats fixed loads for muscle growth '
+    'Researchers followed untrained adults who lifted three times per week for twelve weeks and found that '
+    'adding weight or reps each session built more muscle and strength than repeating the same loads, '
+    'with the biggest gains in the lower body and no extra injuries reported by the group'
+)
+OTHER = (
+    'Sleep matters more than supplements for recovery '
+    'A review of recent studies suggests that lifters trying to add strength over a long training block '
+    'get more from consistent sleep and enough protein than from pre workout powders or recovery drinks, '
+    'especially when training volume is high'
+)
+
+def _distance(left: int, right: int) -> int:
+    return bin((left ^ right) & ((1 << 64) - 1)).count('1')
+
+
+def test_simhash_is_a_signed_64_bit_value_that_tracks_similarity():
+    signature = simhash(TEXT)
+
+    assert -(1 << 63) <= signature < 1 << 63
+    assert simhash(TEXT.upper() + '!') == signature
+    assert _distance(signature, simhash(TEXT + ' experts say')) <= 5
+    assert _distance(signature, simhash(OTHER)) > 5
+
+
+def test_index_finds_signatures_within_max_distance_only():
+    index = NearDuplicateIndex(max_distance=3)
+    base = 0x0F0F_0F0F_0F0F_0F0F
+    index.add(base, (1, 'a'))
+
+    assert index.find(base ^ 0b111, key=(2, 'b')) == (1, 'a')
+    assert index.find(base ^ 0b1111, key=(2, 'b')) is None
+    # An entry never matches itself.
+    assert index.find(base, key=(1, 'a')) is None
+
+
+def test_index_never_misses_a_signature_within_max_distance():
+    rng = random.Random(7)
+    index = NearDuplicateIndex(max_distance=5)
+    base = rng.getrandbits(64)
+    index.add(base, (1, 'a'))
+
+    for _ in range(500):
+        flips = sum(1 << bit for bit in rng.sample(range(64), rng.randint(0, 5)))
+        assert index.find(base ^ flips, key=(2, 'b')) == (1, 'a')
+
+
+def test_a_lookup_only_checks_a_handful_of_candidates():
+    rng = random.Random(11)
+    index = NearDuplicateIndex(max_distance=5)
+    for number in range(20000):
+        index.add(rng.getrandbits(64), (1, number))
+
+    checked = [len(index.candidates(rng.getrandbits(64))) for _ in range(200)]
+
+    # Keys span ~18 bits over 21 tables, so a random probe collides with ~1.6 of the
+    # 20k entries on average; 10-bit bands would have checked ~117.
+    assert sum(checked) / len(checked) < 5
+    assert max(checked) <= 20
+
+
+def test_drop_near_duplicates_keeps_the_first_of_each_cluster():
+    index = NearDuplicateIndex()
+    index.add(simhash(TEXT), (1, 'stored'))
+    records = [
+        {'source_id': 1, 'unique_hash': 'stored', 'simhash': simhash(TEXT)},
+        {'source_id': 2, 'unique_hash': 'copy', 'simhash': simhash(TEXT + ' experts say')},
+        {'source_id': 2, 'unique_hash': 'new', 'simhash': simhash(OTHER)},
+        {'source_id': 3, 'unique_hash': 'new-copy', 'simhash': simhash(OTHER + ' experts say')},
+        {'source_id': 3, 'unique_hash': 'unsigned', 'simhash': None},
+    ]
+
+    kept = [record['unique_hash'] for record in drop_near_duplicates(records, index)]
+
+    assert kept == ['stored', 'new', 'unsigned']
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from app.models.news import NewsArticle, UserFeedEntry
+from app.pipeline.article_store import upsert_articles
+from app.pipeline.feed_fanout import fan_out_articles, note_feed_activity
+from app.schemas.news import PreferencesIn
+from app.services import news_service
+
+
+def _upsert(db, source, key: str, tags: str, title: str | None = None) -> dict:
+    return upsert_articles(
+        db,
+        [
+            {
+                'source_id': source.id,
+                'title': title or f'Fan-out {key}',
+                'link': f'https://example.com/fanout/{key}',
+                'unique_hash': f'fanout-{key}',
+                'published_at': datetime(2026, 10, 1, 12, 0),
+                'summary': 'Programming notes',
+                'tags': tags,
+            }
+        ],
+    )
+
+
+def _entries(db, user, *article_ids) -> dict[int, int]:
+    rows = db.query(UserFeedEntry.article_id, UserFeedEntry.score).filter(
+        UserFeedEntry.user_id == user.id, UserFeedEntry.article_id.in_(article_ids)
+    )
+    return dict(rows.all())
+
+
+def test_new_and_updated_articles_are_scored_into_active_feeds(db, user, source):
+    strength = _upsert(db, source, 'strength', 'strength')['inserted_ids'][0]
+    db.commit()
+    news_service.update_preferences(db, user, PreferencesIn(topics=['strength', 'mobility']))
+    note_feed_activity(user.id)
+    fan_out_articles(db, [])
+    assert _entries(db, user, strength) == {strength: 1}
+
+    nutrition = _upsert(db, source, 'nutrition', 'nutrition')['inserted_ids'][0]
+    fan_out_articles(db, [nutrition])
+    assert _entries(db, user, nutrition) == {}
+
+    # Retagging an article re-scores it for every active feed.
+    updated = _upsert(db, source, 'nutrition', 'strength,mobility')['updated_ids']
+    assert updated == [nutrition]
+    fan_out_articles(db, [], updated)
+    assert _entries(db, user, nutrition) == {nutrition: 2}
+
+    updated = _upsert(db, source, 'nutrition', 'nutrition')['updated_ids']
+    fan_out_articles(db, [], updated)
+    assert _entries(db, user, nutrition) == {}
+
+
+def test_updated_articles_stay_out_of_feeds_that_hid_them(db, user, source):
+    article_id = _upsert(db, source, 'hidden', 'strength')['inserted_ids'][0]
+    db.commit()
+    news_service.update_preferences(db, user, PreferencesIn(topics=['strength']))
+    note_feed_activity(user.id)
+    fan_out_articles(db, [])
+    news_service.hide_article(db, user, article_id)
+    assert _entries(db, user, article_id) == {}
+
+    updated = _upsert(db, source, 'hidden', 'strength', title='Fan-out hidden, revised')['updated_ids']
+    fan_out_articles(db, [], updated)
+
+    assert db.get(NewsArticle, article_id).title == 'Fan-out hidden, revised'
+    assert _entries(db, user, article_id) == {}
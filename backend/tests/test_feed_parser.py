@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pytest
+
+from app.pipeline.ingest import FeedItemParser, iter_chunks, iter_feed_items
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>Zone 2 cardio</title>
+    <link href="https://example.com/zone-2"/>
+    <id>urn:zone-2</id>
+    <updated>2026-10-02T08:00:00Z</updated>
+  </entry>
+</feed>
+"""
+
+
+def _titles(records) -> list[str]:
+    return [record['title'] for record in records]
+
+
+def test_byte_sized_chunks_parse_like_the_whole_document(make_feed):
+    document = make_feed([{'title': f'Mobility drill {index}'} for index in range(5)])
+
+    whole = list(iter_feed_items([document]))
+    trickled = list(iter_feed_items(iter_chunks(document, size=1)))
+
+    assert _titles(whole) == [f'Mobility drill {index}' for index in range(5)]
+    assert trickled == whole
+
+
+def test_parses_atom_entries():
+    records = list(iter_feed_items([ATOM]))
+
+    assert _titles(records) == ['Zone 2 cardio']
+    assert records[0]['link'] == 'https://example.com/zone-2'
+    assert records[0]['published_at'] == datetime(2026, 10, 2, 8, 0)
+
+
+def test_stops_after_max_items_and_ignores_later_chunks(make_feed):
+    document = make_feed([{'title': f'Set {index}'} for index in range(10)])
+    parser = FeedItemParser(max_items=3)
+
+    records = []
+    for chunk in iter_chunks(document, size=64):
+        records.extend(parser.feed(chunk))
+
+    assert _titles(records) == ['Set 0', 'Set 1', 'Set 2']
+    assert parser.done
+    assert parser.feed(b'<not even xml') == []
+
+
+def test_stops_at_the_first_item_older_than_stop_before(make_feed, recent):
+    document = make_feed(
+        [
+            {'title': 'Today', 'published_at': recent(1)},
+            {'title': 'Yesterday', 'published_at': recent(30)},
+            {'title': 'Out of order', 'published_at': recent(2)},
+        ]
+    )
+
+    records = list(iter_feed_items(iter_chunks(document, size=32), stop_before=recent(24)))
+
+    assert _titles(records) == ['Today']
+
+
+def test_malformed_documents_raise_value_error():
+    with pytest.raises(ValueError, match='Malformed feed'):
+        list(iter_feed_items([b'<rss><channel><item><title>x</title></oops>']))
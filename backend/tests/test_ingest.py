@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+from app.pipeline.ingest import fetch_sources, pull_sources
+
+
+def _source(source_id: int, url: str, **validators) -> dict:
+    return {'source_id': source_id, 'rss_url': url, **validators}
+
+
+def test_fetches_every_source_and_returns_them_in_input_order(feed_server, make_feed):
+    first = feed_server.add('/first.xml', make_feed([{'title': 'Squat depth'}, {'title': 'Bench form'}]))
+    second = feed_server.add('/second.xml', make_feed([{'title': 'Protein timing'}]))
+
+    records = pull_sources([_source(2, second), _source(1, first)])
+
+    assert [record['source_id'] for record in records] == [2, 1]
+    assert all(record['status_code'] == 200 and record['error'] is None for record in records)
+    assert [item['title'] for item in records[1]['items']] == ['Squat depth', 'Bench form']
+    assert records[0]['items'][0]['title'] == 'Protein timing'
+    assert records[0]['bytes'] > 0 and records[0]['content_hash']
+
+
+def test_sources_are_fetched_concurrently(feed_server, make_feed):
+    body = make_feed([{'title': 'Slow feed'}])
+    sources = [_source(index, feed_server.add(f'/slow-{index}.xml', body, delay=0.5)) for index in range(6)]
+
+    started = time.perf_counter()
+    records = pull_sources(sources, concurrency=6, per_host=6)
+    elapsed = time.perf_counter() - started
+
+    assert all(record['error'] is None for record in records)
+    # Sequential fetching would take at least 6 * 0.5s.
+    assert elapsed < 2.0
+
+
+def test_failures_are_reported_per_source_without_aborting_the_batch(feed_server, make_feed):
+    good = feed_server.add('/good.xml', make_feed([{'title': 'Deadlift cues'}]))
+    missing = feed_server.url('/missing.xml')
+    broken = feed_server.add('/broken.xml', b'<rss><channel><item><title>x</title></oops>')
+    unreachable = 'http://127.0.0.1:9/feed.xml'
+    invalid = 'http://exa mple.com:abc/feed'
+
+    records = pull_sources(
+        [_source(1, good), _source(2, missing), _source(3, broken), _source(4, unreachable), _source(5, invalid)]
+    )
+
+    assert records[0]['error'] is None and len(records[0]['items']) == 1
+    assert records[1]['error'] == 'HTTP 404'
+    assert records[2]['error'].startswith('Malformed feed')
+    assert records[3]['error'] and records[3]['status_code'] is None
+    assert records[4]['error'].startswith('InvalidURL')
+
+
+def test_oversized_feeds_and_slow_feeds_are_cut_off(feed_server, make_feed):
+    big = feed_server.add('/big.xml', make_feed([{'title': f'Item {index}', 'summary': 'x' * 500} for index in range(50)]))
+    slow = feed_server.add('/slow.xml', make_feed([{'title': 'Late'}]), delay=2)
+
+    big_record, slow_record = asyncio.run(
+        fetch_sources([_source(1, big), _source(2, slow)], max_bytes=4096, timeout=0.5)
+    )
+
+    assert big_record['error'] == 'Feed larger than 4096 bytes'
+    assert big_record['items'] is None
+    assert slow_record['error'].startswith('Timed out')
+
+
+def test_conditional_get_sends_validators_and_skips_unchanged_feeds(feed_server, make_feed):
+    url = feed_server.add(
+        '/cached.xml',
+        make_feed([{'title': 'Mobility flow'}]),
+        etag='"v1"',
+        last_modified='Wed, 01 Oct 2026 10:00:00 GMT',
+    )
+
+    first = pull_sources([_source(1, url)])[0]
+    assert first['etag'] == '"v1"'
+    assert first['last_modified'] == 'Wed, 01 Oct 2026 10:00:00 GMT'
+
+    second = pull_sources(
+        [_source(1, url, etag=first['etag'], last_modified=first['last_modified'], content_hash=first['content_hash'])]
+    )[0]
+
+    headers = feed_server.requests_for('/cached.xml')[-1]
+    assert headers['If-None-Match'] == '"v1"'
+    assert headers['If-Modified-Since'] == 'Wed, 01 Oct 2026 10:00:00 GMT'
+    assert second['status_code'] == 304
+    assert second['not_modified'] is True
+    assert second['items'] is None and second['error'] is None
+
+
+def test_identical_body_without_validators_counts_as_not_modified(feed_server, make_feed):
+    url = feed_server.add('/plain.xml', make_feed([{'title': 'Grip strength'}]))
+
+    first = pull_sources([_source(1, url)])[0]
+    second = pull_sources([_source(1, url, content_hash=first['content_hash'])])[0]
+
+    assert 'If-None-Match' not in feed_server.requests_for('/plain.xml')[-1]
+    assert second['status_code'] == 200
+    assert second['not_modified'] is True and second['items'] is None
+
+    feed_server.add('/plain.xml', make_feed([{'title': 'Grip strength'}, {'title': 'Farmer carries'}]))
+    third = pull_sources([_source(1, url, content_hash=first['content_hash'])])[0]
+    assert third['not_modified'] is False
+    assert len(third['items']) == 2
@@ -0,0 +1,75 @@
+import uuid
+
+from sqlalchemy import create_engine, event
+
+from app.core.config import settings
+from app.db.session import engine
+from app.services import news_fetcher
+from app.services.leader import LeaderLease, news_scheduler_lease
+
+
+def _admin_headers(client) -> dict:
+    email = f'{uuid.uuid4().hex}@example.com'
+    client.post('/auth/register', json={'name': 'Admin', 'email': email, 'password': 'admin-pass', 'role': 'admin'})
+    token = client.post('/auth/login', json={'email': email, 'password': 'admin-pass'}).json()['access_token']
+    return {'Authorization': f'Bearer {token}'}
+
+
+def test_only_one_lease_holder_at_a_time(tmp_path):
+    first = LeaderLease(engine, 'test', tmp_path / 'lease.lock')
+    second = LeaderLease(engine, 'test', tmp_path / 'lease.lock')
+
+    assert first.acquire() and first.acquire()
+    assert not second.acquire()
+
+    first.release()
+    assert not first.is_leader
+    assert second.acquire()
+    second.release()
+
+
+def test_fetch_now_is_refused_while_another_fetch_runs(client):
+    headers = _admin_headers(client)
+
+    # Another worker holds the scheduler lease.
+    other_worker = LeaderLease(engine, 'other', settings.NEWS_LEADER_LOCK_PATH)
+    assert other_worker.acquire()
+    try:
+        response = client.post('/admin/news/fetch-now', headers=headers)
+        assert response.status_code == 409
+    finally:
+        other_worker.release()
+
+    # A fetch is already running in this process.
+    with news_fetcher.fetch_lock:
+        response = client.post('/admin/news/fetch-now', headers=headers)
+    assert response.status_code == 409
+
+
+def test_fetch_now_holds_the_lease_only_while_it_runs(db, monkeypatch):
+    lease = news_scheduler_lease(db.get_bind())
+    held = []
+    monkeypatch.setattr(news_fetcher, 'fetch_news', lambda session: held.append(lease.is_leader) or {})
+
+    news_fetcher.fetch_news_now(db)
+
+    assert held == [True]
+    assert not lease.is_leader
+    assert not news_fetcher.fetch_lock.locked()
+
+
+def test_advisory_lease_keep_alive_leaves_no_open_transaction(tmp_path):
+    # SQLite stand-ins for the PostgreSQL advisory lock functions.
+    advisory_engine = create_engine('sqlite://')
+
+    @event.listens_for(advisory_engine, 'connect')
+    def add_lock_functions(connection, _):
+        connection.create_function('pg_try_advisory_lock', 1, lambda key: 1)
+        connection.create_function('pg_advisory_unlock', 1, lambda key: 1)
+
+    lease = LeaderLease(advisory_engine, 'test', tmp_path / 'unused.lock')
+    assert lease._acquire_advisory()
+    assert lease._acquire_advisory()
+
+    assert not lease._connection.in_transaction()
+    lease.release()
@@ -0,0 +1,126 @@
+from app.db.session import SessionLocal
+from app.models.news import NewsArticle, UserNewsPreference
+from app.pipeline.article_store import upsert_articles
+from app.schemas.news import PreferencesIn
+from app.services import news_service
+from app.services.news_interactions import get_interactions, interaction_cache, update_interactions
+from app.services.news_preferences import load_preferences
+
+
+def _feed(db, user, source, **options):
+    options = {'page': 1, 'page_size': 20, **options}
+    return news_service.get_feed(db, user, None, str(source.id), None, None, None, **options)
+
+
+def _ids(response) -> list[int]:
+    return [item.id for item in response.items]
+
+
+def test_feed_pages_are_cached_until_something_they_show_changes(db, user, source, articles):
+    first = _feed(db, user, source)
+    assert _feed(db, user, source) is first
+    article_id = first.items[0].id
+
+    news_service.save_article(db, user, article_id)
+    saved = _feed(db, user, source)
+    assert saved is not first
+    assert saved.items[0].saved
+
+    news_service.hide_article(db, user, article_id)
+    hidden = _feed(db, user, source)
+    assert article_id not in _ids(hidden)
+
+    news_service.update_preferences(db, user, PreferencesIn(blocked_keywords=['squat']))
+    blocked = _feed(db, user, source)
+    assert blocked.items and not any('Squat' in (item.summary or '') for item in blocked.items)
+
+    upsert_articles(
+        db,
+        [
+            {
+                'source_id': source.id,
+                'title': 'Fresh',
+                'link': 'https://example.com/fresh',
+                'unique_hash': 'fresh',
+                'summary': 'Deload weeks',
+            }
+        ],
+    )
+    assert _feed(db, user, source).items[0].title == 'Fresh'
+
+
+def test_feed_version_bumps_do_not_overwrite_each_other(db, user):
+    news_service.update_preferences(db, user, PreferencesIn())
+    start = db.get(UserNewsPreference, user.id).feed_version
+
+    first, second = SessionLocal(), SessionLocal()
+    try:
+        # Both load the row before either writes, as two workers handling saves would.
+        first.get(UserNewsPreference, user.id)
+        second.get(UserNewsPreference, user.id)
+        news_service._bump_feed_version(first, user)
+        first.commit()
+        news_service._bump_feed_version(second, user)
+        second.commit()
+    finally:
+        first.close()
+        second.close()
+
+    db.expire_all()
+    assert db.get(UserNewsPreference, user.id).feed_version == start + 2
+
+
+def test_interaction_changes_are_written_through_to_the_cache(db, user, source, articles):
+    first, second = (row.id for row in db.query(NewsArticle.id).filter(NewsArticle.source_id == source.id).limit(2))
+    state = get_interactions(db, user.id, 0)
+    assert get_interactions(db, user.id, 0) is state
+
+    news_service.save_article(db, user, first)
+    news_service.hide_article(db, user, second)
+
+    cached = interaction_cache.get(user.id)
+    assert cached.version == 2
+    assert cached.is_saved(first) and not cached.is_hidden(first)
+    assert cached.is_hidden(second) and not cached.is_saved(second)
+    assert get_interactions(db, user.id, 2) is cached
+
+    news_service.unsave_article(db, user, first)
+    assert not interaction_cache.get(user.id).is_saved(first)
+
+
+def test_interaction_state_reloads_when_the_version_moves_elsewhere(db, user, source, articles):
+    article_id = db.query(NewsArticle.id).filter(NewsArticle.source_id == source.id).limit(1).scalar()
+    get_interactions(db, user.id, 0)
+
+    # A write that skipped a version (another worker saved in between) drops the entry.
+    update_interactions(user.id, 5, saved=[article_id])
+    assert interaction_cache.get(user.id) is None
+
+    news_service.save_article(db, user, article_id)
+    version = db.get(UserNewsPreference, user.id).feed_version
+    assert get_interactions(db, user.id, version).is_saved(article_id)
+
+
+def test_reading_preferences_never_writes(db, user, source, articles):
+    _feed(db, user, source)
+    defaults = news_service.get_preferences(db, user)
+
+    assert defaults.level == 'beginner' and defaults.topics == []
+    assert not db.new and not db.dirty
+    assert db.get(UserNewsPreference, user.id) is None
+
+
+def test_preference_snapshot_is_cached_and_replaced_on_update(db, user):
+    snapshot = load_preferences(db, user.id)
+    assert load_preferences(db, user.id) is snapshot
+
+    news_service.update_preferences(
+        db, user, PreferencesIn(topics=['Strength'], level='advanced', blocked_keywords=['Keto', 'keto'])
+    )
+
+    updated = load_preferences(db, user.id)
+    assert updated is not snapshot
+    assert updated.level == 'advanced'
+    assert updated.topics == ('strength',)
+    assert updated.blocked_keywords == ('keto',)
+    assert updated.feed_version == snapshot.feed_version + 1
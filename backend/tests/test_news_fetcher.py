@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+from app.models.news import NewsArticle, NewsFetchRun, NewsSource
+from app.services.news_cache import news_version
+from app.services.news_fetcher import fetch_news, next_poll_interval
+
+
+def test_fetch_persists_validators_and_skips_unchanged_feeds(db, source, feed_server, make_feed, recent):
+    source.rss_url = feed_server.add(
+        '/news.xml',
+        make_feed([{'title': 'Tempo squats for strength', 'published_at': recent(1)}]),
+        etag='"abc"',
+    )
+    db.commit()
+
+    summary = fetch_news(db, due_only=True)
+    db.refresh(source)
+    assert summary['sources_checked'] == 1
+    assert summary['articles_new'] == 1
+    assert source.etag == '"abc"'
+    assert source.content_hash
+    assert source.next_fetch_at is not None
+    assert db.query(NewsArticle).filter(NewsArticle.source_id == source.id).count() == 1
+
+    db.query(NewsSource).filter(NewsSource.id == source.id).update({NewsSource.next_fetch_at: None})
+    db.commit()
+    version = news_version(db)
+    summary = fetch_news(db, due_only=True)
+
+    # Nothing changed, so cached feed pages and counts stay valid.
+    assert news_version(db) == version
+    assert feed_server.requests_for('/news.xml')[-1]['If-None-Match'] == '"abc"'
+    assert summary['sources_cached'] == 1
+    assert summary['articles_new'] == 0
+
+
+def test_poll_interval_follows_the_publishing_cadence_within_bounds():
+    now = datetime(2026, 10, 1, 12, 0)
+    source = NewsSource(poll_interval_minutes=60, consecutive_failures=0, last_fetched_at=now - timedelta(minutes=60))
+
+    # Six items an hour apart is a ten minute cadence; the interval halves the gap.
+    assert next_poll_interval(source, 6, False, now) == 35
+    assert next_poll_interval(source, 0, False, now) == 90
+    assert next_poll_interval(NewsSource(poll_interval_minutes=6), 60, False, now) == 5
+    assert next_poll_interval(NewsSource(poll_interval_minutes=600), 0, False, now) == 720
+
+
+def test_failing_sources_back_off_exponentially(db, source, feed_server):
+    source.rss_url = feed_server.url('/missing.xml')
+    source.poll_interval_minutes = 10
+    db.commit()
+
+    for expected_failures in (1, 2):
+        fetch_news(db, due_only=True)
+        db.refresh(source)
+        assert source.consecutive_failures == expected_failures
+        assert source.poll_interval_minutes == 10
+        db.query(NewsSource).filter(NewsSource.id == source.id).update({NewsSource.next_fetch_at: None})
+        db.commit()
+
+    assert next_poll_interval(source, 0, True, datetime.utcnow()) == 40
+
+
+def test_an_idle_tick_records_and_invalidates_nothing(db):
+    runs = db.query(NewsFetchRun).count()
+    version = news_version(db)
+
+    summary = fetch_news(db, due_only=True)
+
+    assert summary['sources_checked'] == 0 and summary['stages'] == []
+    assert db.query(NewsFetchRun).count() == runs
+    assert news_version(db) == version
@@ -0,0 +1,71 @@
+from datetime import datetime
+
+import pytest
+
+from app.services import news_service
+from app.services.news_cache import count_cache
+
+
+def _explore(db, user, source, **options):
+    options = {'page': 1, 'page_size': 5, **options}
+    return news_service.get_explore(db, user, None, str(source.id), options.pop('q', None), None, None, **options)
+
+
+def _ids(response) -> list[int]:
+    return [item.id for item in response.items]
+
+
+def test_cursor_pages_match_offset_pages(db, user, source, articles):
+    offset_ids = []
+    for page in range(1, 4):
+        offset_ids.extend(_ids(_explore(db, user, source, page=page)))
+
+    cursor_ids = []
+    response = _explore(db, user, source)
+    while True:
+        cursor_ids.extend(_ids(response))
+        if not response.has_more:
+            break
+        response = _explore(db, user, source, cursor=response.next_cursor)
+
+    assert len(cursor_ids) == 12
+    assert len(set(cursor_ids)) == 12
+    assert cursor_ids == offset_ids
+
+
+def test_relevance_cursor_round_trips_the_rank(db, user, source, articles):
+    pages = []
+    response = _explore(db, user, source, q='squat', sort='relevance', page_size=2)
+    while True:
+        pages.append(_ids(response))
+        if not response.has_more:
+            break
+        response = _explore(db, user, source, q='squat', sort='relevance', page_size=2, cursor=response.next_cursor)
+
+    seen = [article_id for page in pages for article_id in page]
+    assert len(seen) == len(set(seen)) == 4
+
+
+def test_cursor_encoding_round_trips_timestamps_and_numbers():
+    values = (datetime(2026, 9, 1, 9, 30, 15, 123456), 3, 17.25, 42)
+
+    assert news_service._decode_cursor(news_service._encode_cursor(values), 4) == list(values)
+
+
+@pytest.mark.parametrize('cursor', ['not base64!', 'WzFd', 'eyJhIjoxfQ=='])
+def test_invalid_cursors_are_rejected(db, user, source, cursor):
+    with pytest.raises(ValueError, match='Invalid cursor'):
+        _explore(db, user, source, cursor=cursor)
+
+
+def test_total_modes(db, user, source, articles):
+    assert _explore(db, user, source).total == 12
+    assert _explore(db, user, source, total_mode='none').total is None
+    # Cursor requests skip the count unless asked for one.
+    first = _explore(db, user, source)
+    assert _explore(db, user, source, cursor=first.next_cursor).total is None
+
+    assert _explore(db, user, source, total_mode='estimated').total == 12
+    assert len(count_cache) == 1
+    assert _explore(db, user, source, page=2, total_mode='estimated').total == 12
+    assert len(count_cache) == 1
@@ -0,0 +1,15 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.news import NewsSourceCreate, NewsSourceUpdate
+
+
+def test_feed_urls_must_be_http_urls():
+    assert NewsSourceCreate(name='Feed', rss_url=' https://example.com/rss ').rss_url == 'https://example.com/rss'
+    assert NewsSourceUpdate().rss_url is None
+
+    for url in ('http://exa mple.com:abc/feed', 'ftp://example.com/rss', 'example.com/rss'):
+        with pytest.raises(ValidationError):
+            NewsSourceCreate(name='Feed', rss_url=url)
+        with pytest.raises(ValidationError):
+            NewsSourceUpdate(rss_url=url)
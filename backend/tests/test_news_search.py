@@ -0,0 +1,59 @@
+from app.models.news import NewsArticle
+from app.pipeline.article_store import upsert_articles
+from app.services.news_search import apply_search, blocked_clause
+
+
+def _add(db, source, *titles):
+    upsert_articles(
+        db,
+        [
+            {
+                'source_id': source.id,
+                'title': title,
+                'link': f'https://example.com/{index}',
+                'unique_hash': f'search-{index}',
+                'summary': 'Weekly roundup',
+            }
+            for index, title in enumerate(titles)
+        ],
+    )
+
+
+def _titles(db, source, clause) -> set[str]:
+    query = db.query(NewsArticle.title).filter(NewsArticle.source_id == source.id)
+    return {title for title, in query.filter(~clause)}
+
+
+def test_blocked_words_and_symbol_only_keywords(db, source):
+    _add(db, source, 'Keto diet myths', 'Best deals 🔥🔥', 'Shocking results!!!', 'Rowing technique', 'Ketones explained')
+    engine = db.get_bind()
+
+    assert _titles(db, source, blocked_clause(engine, ['keto'])) == {
+        'Best deals 🔥🔥',
+        'Shocking results!!!',
+        'Rowing technique',
+        'Ketones explained',
+    }
+    assert _titles(db, source, blocked_clause(engine, ['!!!', '🔥', ' KETO diet '])) == {
+        'Rowing technique',
+        'Ketones explained',
+    }
+    assert blocked_clause(engine, ['  ', '']) is None
+
+
+def test_symbol_keywords_match_literally(db, source):
+    _add(db, source, '100% effort', 'Full effort', 'Under_score')
+    engine = db.get_bind()
+
+    assert _titles(db, source, blocked_clause(engine, ['%'])) == {'Full effort', 'Under_score'}
+    assert _titles(db, source, blocked_clause(engine, ['_'])) == {'100% effort', 'Full effort'}
+
+
+def test_search_ranks_title_matches_first(db, source):
+    _add(db, source, 'Rowing technique', 'Rowing and rowing drills for rowing', 'Deadlift setup')
+
+    query, relevance = apply_search(db.query(NewsArticle.title).filter(NewsArticle.source_id == source.id), 'rowing')
+    ranked = [title for title, in query.order_by(relevance.desc())]
+
+    assert ranked[0] == 'Rowing and rowing drills for rowing'
+    assert set(ranked) == {'Rowing technique', 'Rowing and rowing drills for rowing'}
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+
+from app.models.news import NewsFetchLog, NewsFetchRun
+from app.services.news_telemetry import prune_fetch_history, source_fetch_stats
+
+
+def _run(db, started_at: datetime) -> NewsFetchRun:
+    run = NewsFetchRun(trigger='scheduled', started_at=started_at, finished_at=started_at + timedelta(seconds=5))
+    db.add(run)
+    db.flush()
+    return run
+
+
+def test_stats_aggregate_per_source_with_sorted_list_percentiles(db, source):
+    run = _run(db, datetime.utcnow())
+    latencies = [float(value) for value in range(20, 0, -1)]
+    for index, fetch_ms in enumerate(latencies):
+        db.add(
+            NewsFetchLog(
+                run_id=run.id,
+                source_id=source.id,
+                fetched_at=datetime.utcnow(),
+                status_code=304 if index % 4 == 0 else 200,
+                bytes=100,
+                fetch_ms=fetch_ms,
+                parse_ms=0.5,
+                items_new=1,
+                not_modified=index % 4 == 0,
+                error='timeout' if index % 5 == 0 else None,
+            )
+        )
+    db.flush()
+
+    stats = next(row for row in source_fetch_stats(db, hours=1) if row['source_id'] == source.id)
+
+    ordered = sorted(latencies)
+    assert stats['source_name'] == source.name
+    assert stats['fetches'] == 20
+    assert stats['failures'] == 4
+    assert stats['not_modified'] == 5
+    assert stats['items_new'] == 20
+    assert stats['bytes_total'] == 2000
+    assert stats['latency_ms_p50'] == ordered[len(ordered) * 50 // 100]
+    assert stats['latency_ms_p95'] == ordered[len(ordered) * 95 // 100]
+    assert stats['parse_ms_total'] == 10.0
+
+
+def test_prune_removes_expired_runs_with_all_their_logs(db, source):
+    now = datetime.utcnow()
+    expired = _run(db, now - timedelta(days=400))
+    kept = _run(db, now)
+    # A log written after the cutoff still belongs to the expired run.
+    for run, fetched_at in ((expired, now - timedelta(days=400)), (expired, now), (kept, now)):
+        db.add(NewsFetchLog(run_id=run.id, source_id=source.id, fetched_at=fetched_at))
+    db.flush()
+
+    assert prune_fetch_history(db) >= 1
+
+    assert db.get(NewsFetchRun, expired.id) is None
+    assert db.query(NewsFetchLog).filter(NewsFetchLog.run_id == expired.id).count() == 0
+    assert db.query(NewsFetchLog).filter(NewsFetchLog.run_id == kept.id).count() == 1
@@ -0,0 +1,72 @@
+import threading
+import uuid
+
+from app.models.news import NewsSource
+from app.pipeline import orchestrator
+from app.pipeline.orchestrator import run_pipeline
+
+
+def _pipeline_source(source: NewsSource) -> dict:
+    return {'source_id': source.id, 'rss_url': source.rss_url, 'tags': source.tags, 'newest_published_at': None}
+
+
+def test_a_failing_feed_fails_only_its_own_source(db, source, feed_server, make_feed, recent, monkeypatch):
+    source.rss_url = feed_server.add('/good.xml', make_feed([{'title': 'Split squats', 'published_at': recent(1)}]))
+    broken = NewsSource(
+        name=f'Broken {uuid.uuid4().hex[:8]}',
+        rss_url=feed_server.add('/bad.xml', make_feed([{'title': 'Poison pill', 'published_at': recent(1)}])),
+        enabled=True,
+    )
+    db.add(broken)
+    db.flush()
+
+    normalize = orchestrator.normalize_records
+
+    def normalize_or_fail(items, feed_source, *args, **kwargs):
+        if feed_source['source_id'] == broken.id:
+            raise KeyError('guid')
+        return normalize(items, feed_source, *args, **kwargs)
+
+    store_threads = set()
+
+    def tracked(func):
+        def wrapper(*args, **kwargs):
+            store_threads.add(threading.current_thread().name)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(orchestrator, 'normalize_records', normalize_or_fail)
+    monkeypatch.setattr(orchestrator, 'upsert_articles', tracked(orchestrator.upsert_articles))
+    monkeypatch.setattr(orchestrator, 'load_index', tracked(orchestrator.load_index))
+    monkeypatch.setattr(orchestrator, 'get_seen_filter', tracked(orchestrator.get_seen_filter))
+
+    outcome = run_pipeline(db, [_pipeline_source(source), _pipeline_source(broken)])
+
+    results = {result['source_id']: result for result in outcome['results']}
+    assert outcome['process_errors'] == 1
+    assert results[broken.id]['error'] == "'guid'"
+    assert results[source.id]['error'] is None
+    assert outcome['inserted_by_source'] == {source.id: 1}
+    # Every use of the Session happened on the pipeline's single store thread.
+    assert len(store_threads) == 1
+    assert store_threads.pop().startswith('news-store')
+
+
+def test_cpu_stages_run_on_the_process_pool(db, source, feed_server, make_feed, recent, monkeypatch):
+    source.rss_url = feed_server.add(
+        '/pooled.xml',
+        make_feed([{'title': 'Pause squats', 'published_at': recent(1)}, {'title': 'Tempo rows', 'published_at': recent(2)}]),
+    )
+    monkeypatch.setattr(orchestrator.settings, 'NEWS_PIPELINE_WORKERS', 1)
+
+    try:
+        outcome = run_pipeline(db, [_pipeline_source(source)])
+        pool = orchestrator._process_pool
+    finally:
+        orchestrator.shutdown_process_pool()
+
+    assert pool is not None
+    assert outcome['process_errors'] == 0
+    assert outcome['results'][0]['error'] is None
+    assert outcome['inserted_by_source'] == {source.id: 2}
@@ -0,0 +1,61 @@
+import pytest
+
+from app.models.news import NewsSource
+from app.pipeline import seen_filter
+from app.pipeline.seen_filter import BloomFilter, ScalableBloomFilter, get_seen_filter
+from app.services.news_fetcher import fetch_news
+
+
+def test_bloom_filter_has_no_false_negatives_and_a_bounded_false_positive_rate():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for index in range(1000):
+        bloom.add(f'1:{index}')
+
+    assert all(f'1:{index}' in bloom for index in range(1000))
+    false_positives = sum(f'2:{index}' in bloom for index in range(10000))
+    assert false_positives / 10000 < 0.03
+
+
+def test_scalable_filter_adds_layers_instead_of_saturating():
+    seen = ScalableBloomFilter(capacity=100, error_rate=0.01)
+    for index in range(1000):
+        seen.add(f'1:{index}')
+    count = len(seen)
+    seen.add('1:0')
+
+    # Keys that test positive are not counted again, false positives included.
+    assert len(seen) == count > 950
+    assert len(seen.layers) > 1
+    assert all(f'1:{index}' in seen for index in range(1000))
+    assert seen.false_positive_rate < 0.02
+
+
+@pytest.fixture
+def fresh_filter(monkeypatch):
+    monkeypatch.setattr(seen_filter, '_filter', None)
+
+
+def test_keys_are_remembered_only_after_the_fetch_commits(
+    db, source, feed_server, make_feed, recent, monkeypatch, fresh_filter
+):
+    source.rss_url = feed_server.add('/seen.xml', make_feed([{'title': 'Kettlebell swings', 'published_at': recent(1)}]))
+    db.commit()
+    seen = get_seen_filter(db)
+    before = len(seen)
+
+    def fail_commit():
+        raise RuntimeError('commit failed')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(db, 'commit', fail_commit)
+        with pytest.raises(RuntimeError):
+            fetch_news(db, due_only=True)
+    db.rollback()
+    assert len(seen) == before
+
+    db.query(NewsSource).filter(NewsSource.id == source.id).update({NewsSource.next_fetch_at: None})
+    db.commit()
+    summary = fetch_news(db, due_only=True)
+
+    assert summary['articles_new'] == 1
+    assert len(seen) == before + 1